@@ -11,6 +11,7 @@ from .manage import server, Root, Calculator
 class TestRpcOnThread(unittest.TestCase):
     app_cfg = None
     concurrency = 'thread'
+    preload_app = False
     # used for both keep-alive and timeout in JsonProxy
     # long enough to allow to wait for tasks
     rpc_timeout = 500
@@ -18,7 +19,10 @@ class TestRpcOnThread(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         name = 'calc_' + cls.concurrency
-        s = server(bind='127.0.0.1:0', name=name, concurrency=cls.concurrency)
+        if cls.preload_app:
+            name += '_preload'
+        s = server(bind='127.0.0.1:0', name=name, concurrency=cls.concurrency,
+                   preload_app=cls.preload_app)
         cls.app_cfg = yield from send('arbiter', 'run', s)
         cls.uri = 'http://{0}:{1}'.format(*cls.app_cfg.addresses[0])
         cls.p = rpc.JsonProxy(cls.uri, timeout=cls.rpc_timeout)
@@ -176,3 +180,32 @@ class TestRpcOnProcess(TestRpcOnThread):
         sync = rpc.JsonProxy(self.uri, sync=True)
         self.assertEqual(sync.ping(), 'pong')
         self.assertEqual(sync.ping(), 'pong')
+
+
+@dont_run_with_thread
+class TestRpcPreload(TestRpcOnProcess):
+    preload_app = True
+
+    def test_preload(self):
+        response = yield from self.p.server_info()
+        app = response['monitors'][self.app_cfg.name]
+        self.assertTrue(app['actor']['preload_time'] >= 0)
+        for worker in app['workers']:
+            wsgi = worker.get('wsgi')
+            if wsgi:
+                self.assertTrue(wsgi['preload_app'])
+                self.assertTrue(wsgi['setup_time'] >= 0)
+
+
+class TestRpcThreadPreload(TestRpcOnThread):
+    preload_app = True
+
+    def test_preload(self):
+        # thread workers build their own handler
+        response = yield from self.p.server_info()
+        app = response['monitors'][self.app_cfg.name]
+        self.assertFalse('preload_time' in app['actor'])
+        for worker in app['workers']:
+            wsgi = worker.get('wsgi')
+            if wsgi:
+                self.assertFalse(wsgi['preload_app'])
@@ -124,7 +124,18 @@ class EchoProtocol(pulsar.ProtocolConsumer):
 
 class EchoServerProtocol(EchoProtocol):
     '''The :class:`EchoProtocol` used by the echo :func:`server`.
+
+    It is :attr:`~.ProtocolConsumer.reusable` across requests on
+    the same connection.
     '''
+    reusable = True
+
+    def reset(self):
+        '''Override :meth:`~.ProtocolConsumer.reset` to clear the
+        :attr:`buffer`.'''
+        super(EchoServerProtocol, self).reset()
+        self.__dict__.pop('buffer', None)
+
     def response(self, data):
         '''Override :meth:`~EchoProtocol.response` method by writing the
         ``data`` received back to the client.
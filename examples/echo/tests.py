@@ -1,7 +1,7 @@
 import unittest
 
 from pulsar import (send, multi_async, new_event_loop, get_application,
-                    run_in_loop, get_event_loop)
+                    run_in_loop, get_event_loop, platform)
 from pulsar.apps.test import dont_run_with_thread
 
 from .manage import server, Echo, EchoServerProtocol
@@ -9,12 +9,14 @@ from .manage import server, Echo, EchoServerProtocol
 
 class TestEchoServerThread(unittest.TestCase):
     concurrency = 'thread'
+    reuse_port = False
     server_cfg = None
 
     @classmethod
     def setUpClass(cls):
         s = server(name=cls.__name__.lower(), bind='127.0.0.1:0',
-                   backlog=1024, concurrency=cls.concurrency)
+                   backlog=1024, concurrency=cls.concurrency,
+                   reuse_port=cls.reuse_port)
         cls.server_cfg = yield from send('arbiter', 'run', s)
         cls.client = Echo(cls.server_cfg.addresses[0])
 
@@ -162,3 +164,13 @@ class TestEchoServerProcess(TestEchoServerThread):
         self.assertEqual(echo.sessions, 1)
         self.assertEqual(echo(b'ciao!'), b'ciao!')
         self.assertEqual(echo.sessions, 2)
+
+
+@unittest.skipUnless(platform.has_reuse_port, 'Requires SO_REUSEPORT')
+@dont_run_with_thread
+class TestEchoServerReusePort(TestEchoServerProcess):
+    reuse_port = True
+
+    def test_reuse_port(self):
+        app = yield from get_application(self.__class__.__name__.lower())
+        self.assertTrue(app.cfg.reuse_port)
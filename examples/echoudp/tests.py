@@ -1,6 +1,7 @@
 import unittest
 
-from pulsar import send, multi_async, new_event_loop, get_application
+from pulsar import (send, multi_async, new_event_loop, get_application,
+                    platform, asyncio)
 from pulsar.apps.test import dont_run_with_thread
 
 from .manage import server, Echo, EchoUdpServerProtocol
@@ -8,12 +9,14 @@ from .manage import server, Echo, EchoUdpServerProtocol
 
 class TestEchoUdpServerThread(unittest.TestCase):
     concurrency = 'thread'
+    reuse_port = False
     server_cfg = None
 
     @classmethod
     def setUpClass(cls):
         s = server(name=cls.__name__.lower(), bind='127.0.0.1:0',
-                   concurrency=cls.concurrency)
+                   concurrency=cls.concurrency,
+                   reuse_port=cls.reuse_port)
         cls.server_cfg = yield from send('arbiter', 'run', s)
         cls.client = Echo(cls.server_cfg.addresses[0])
 
@@ -60,3 +63,24 @@ class TestEchoUdpServerProcess(TestEchoUdpServerThread):
         echo = self.sync_client()
         self.assertEqual(echo(b'ciao!'), b'ciao!')
         self.assertEqual(echo(b'fooooooooooooo!'),  b'fooooooooooooo!')
+
+
+@unittest.skipUnless(platform.has_reuse_port, 'Requires SO_REUSEPORT')
+@dont_run_with_thread
+class TestEchoUdpServerReusePort(TestEchoUdpServerProcess):
+    reuse_port = True
+
+    @classmethod
+    def setUpClass(cls):
+        yield from super(TestEchoUdpServerReusePort, cls).setUpClass()
+        # Workers bind their own socket, datagrams are refused until then
+        name = cls.server_cfg.name
+        for _ in range(100):
+            info = yield from send('arbiter', 'info')
+            if info['monitors'][name].get('workers'):
+                break
+            yield from asyncio.sleep(0.1)
+
+    def test_reuse_port(self):
+        app = yield from get_application(self.__class__.__name__.lower())
+        self.assertTrue(app.cfg.reuse_port)
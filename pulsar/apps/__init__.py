@@ -61,6 +61,7 @@ By default, the list of hooks only contains a callback to start the
 import os
 import sys
 from inspect import getfile
+from timeit import default_timer
 from functools import partial
 from collections import namedtuple, OrderedDict
 
@@ -125,6 +126,14 @@ def monitor_start(self, exc=None):
         coro = app.monitor_start(self)
         if coro:
             yield from coro
+        if app.should_preload():
+            start = default_timer()
+            coro = app.preload(self)
+            if coro:
+                yield from coro
+            self.preload_time = default_timer() - start
+            self.logger.info('Preloaded application in %.3f seconds',
+                             self.preload_time)
         if not self.cfg.workers:
             coro = app.worker_start(self)
             if coro:
@@ -155,12 +164,18 @@ def monitor_info(self, info=None):
     if not self.cfg.workers:
         self.app.worker_info(self, info)
     else:
+        preload_time = getattr(self, 'preload_time', None)
+        if preload_time is not None:
+            info['actor']['preload_time'] = preload_time
         self.app.monitor_info(self, info)
 
 
 def monitor_params(self, params=None):
     app = self.app
-    params.update({'cfg': app.cfg.clone(),
+    # a preloaded application must not be pickled, workers share it
+    preloaded = getattr(self, 'preload_time', None) is not None
+    cfg = app.cfg.copy() if preloaded else app.cfg.clone()
+    params.update({'cfg': cfg,
                    'name': '%s.worker' % app.name,
                    'start': worker_start})
     app.actorparams(self, params)
@@ -485,6 +500,28 @@ class Application(Configurator):
         pass
 
     # MONITOR CALLBACKS
+    def should_preload(self):
+        '''``True`` when the monitor invokes :meth:`preload` before
+        spawning workers.
+
+        The :ref:`preload_app <setting-preload_app>` setting must be on and
+        workers must be processes forked by the arbiter. Thread workers
+        do not preload, each one builds its own application.
+        '''
+        cfg = self.cfg
+        return bool(cfg.workers and cfg.preload_app and
+                    cfg.concurrency == 'process' and not cfg.fork_server)
+
+    def preload(self, monitor):
+        '''Build the application before spawning workers.
+
+        Invoked by the monitor, in the arbiter process, when
+        :meth:`should_preload` returns ``True``.
+        Objects created here are inherited by process workers when forked.
+        By default it does nothing.
+        '''
+        pass
+
     def actorparams(self, monitor, params=None):
         '''Hook to add additional entries when the monitor spawn new actors.
         '''
@@ -854,18 +854,38 @@ class HttpResponse(ProtocolConsumer):
         # request.parser my change (100-continue)
         # Always invoke it via request
         try:
-            if request.parser.execute(data, len(data)) == len(data):
-                if request.parser.is_headers_complete():
-                    self._status_code = request.parser.get_status_code()
+            while data:
+                parser = request.parser
+                consumed = parser.execute(data, len(data))
+                if consumed < len(data) and not parser.is_message_complete():
+                    raise pulsar.ProtocolError('%s\n%s' % (self, self.headers))
+                data = data[consumed:]
+                if parser.is_headers_complete():
+                    self._status_code = parser.get_status_code()
                     if not self.event('on_headers').fired():
                         self.fire_event('on_headers')
+                    if request.parser is not parser:
+                        # a new parser for the rest of the data
+                        continue
                     if (not self.event('post_request').fired() and
-                            request.parser.is_message_complete()):
+                            parser.is_message_complete()):
                         self.finished()
-            else:
-                raise pulsar.ProtocolError('%s\n%s' % (self, self.headers))
+                break
         except Exception as exc:
             self.finished(exc=exc)
+        else:
+            if data:
+                return self._unconsumed(data)
+
+    def _unconsumed(self, data):
+        # Bytes following the complete response. They belong to the
+        # consumer of an upgraded connection, otherwise there is no
+        # request for them and the connection cannot be reused
+        connection = self._connection
+        if connection:
+            if connection._current_consumer is not None:
+                return data
+            connection.close()
 
 
 class HttpClient(AbstractClient):
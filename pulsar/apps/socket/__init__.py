@@ -54,6 +54,22 @@ last read from the remote client, one can use the
 
 will close client connections which have been idle for 10 seconds.
 
+autocork
+---------------
+To accumulate data written by a server :class:`.Connection` during an event
+loop iteration and send it with a single ``writelines`` call at the next
+iteration, one can use the :ref:`autocork <setting-autocork>` setting::
+
+    python script.py --autocork
+
+reuse_port
+---------------
+To let each worker bind its own listening socket with the ``SO_REUSEPORT``
+option, so that the kernel balances new connections across workers,
+one can use the :ref:`reuse-port <setting-reuse_port>` setting::
+
+    python script.py --reuse-port
+
 .. _socket-server-ssl:
 
 TLS/SSL support
@@ -93,6 +109,14 @@ for:
 * Windows running python 3.2 or above (python 2 on windows does not support
   the creation of sockets from file descriptors).
 
+When the :ref:`reuse-port <setting-reuse_port>` setting is on, the
+arbiter only reserves the address and each process-based actor binds and
+listens to its own socket. All workers waiting on a single shared socket
+are woken up by each new connection (the thundering herd) and the busiest
+worker often accepts most of them, while with ``SO_REUSEPORT`` the kernel
+distributes connections evenly. The same applies to datagrams received by
+a :class:`UdpSocketServer`.
+
 Check the :meth:`SocketServer.monitor_start` method for implementation details.
 '''
 import os
@@ -100,11 +124,13 @@ import socket
 from math import log
 from random import lognormvariate
 from functools import partial
+from collections import OrderedDict
 
 import pulsar
 from pulsar import (asyncio, TcpServer, DatagramServer, Connection,
                     ImproperlyConfigured)
-from pulsar.utils.internet import parse_address, SSLContext
+from pulsar.utils.internet import (parse_address, SSLContext,
+                                   reuse_port_socket, close_socket)
 from pulsar.utils.config import pass_through
 
 
@@ -138,6 +164,41 @@ class KeepAlive(SocketSetting):
         open."""
 
 
+class Autocork(SocketSetting):
+    name = "autocork"
+    flags = ["--autocork"]
+    validator = pulsar.validate_bool
+    action = "store_true"
+    default = False
+    desc = """\
+        Coalesce data written by a connection during an event loop
+        iteration.
+
+        Chunks are accumulated and passed to the transport in a single
+        ``writelines`` call at the next loop iteration. Useful for
+        servers sending responses in several small writes or replying to
+        pipelined requests."""
+
+
+class ReusePort(SocketSetting):
+    name = "reuse_port"
+    flags = ["--reuse-port"]
+    validator = pulsar.validate_bool
+    action = "store_true"
+    default = False
+    desc = """\
+        Each worker binds its own socket with the ``SO_REUSEPORT`` option.
+
+        The kernel load-balances incoming connections, or datagrams, across
+        workers rather than waking all of them on a shared socket.
+        Available on platforms supporting ``SO_REUSEPORT`` and only for
+        multi-process servers bound to an internet address.
+
+        UDP servers do not reserve the address in the monitor. Datagrams
+        sent before the first worker has bound its socket are refused,
+        and when binding to port 0 the resolved port is free until then."""
+
+
 class Backlog(SocketSetting):
     name = "backlog"
     flags = ["--backlog"]
@@ -175,6 +236,11 @@ class CertFile(SocketSetting):
     """
 
 
+def datagram_transport(sock, loop, protocol):
+    sock.setblocking(False)
+    return loop._make_datagram_transport(sock, protocol)
+
+
 class WrapTransport:
 
     def __init__(self, transport):
@@ -234,6 +300,15 @@ class SocketServer(pulsar.Application):
                                            cfg.key_file)
             ssl = SSLContext(keyfile=cfg.key_file, certfile=cfg.cert_file)
         address = parse_address(self.cfg.address)
+        monitor.ssl = ssl
+        sockets = self.reuse_port_sockets(address)
+        if sockets:
+            # Keep the address reserved, the sockets are not listening
+            # and each worker listens to its own socket
+            monitor.sockets = None
+            monitor.reserved_sockets = sockets
+            cfg.addresses = [sock.getsockname() for sock in sockets]
+            return
         # First create the sockets
         try:
             server = yield from loop.create_server(asyncio.Protocol, *address)
@@ -247,12 +322,14 @@ class SocketServer(pulsar.Application):
                 sockets.append(sock)
                 loop.remove_reader(sock.fileno())
             monitor.sockets = sockets
-            monitor.ssl = ssl
             cfg.addresses = addresses
 
     def actorparams(self, monitor, params):
         params.update({'sockets': monitor.sockets, 'ssl': monitor.ssl})
 
+    def monitor_stopping(self, monitor):
+        self.release_sockets(monitor)
+
     def worker_start(self, worker, exc=None):
         '''Start the worker by invoking the :meth:`create_server` method.
         '''
@@ -277,6 +354,41 @@ class SocketServer(pulsar.Application):
         '''
         return TcpServer(*args, **kw)
 
+    def reuse_port_sockets(self, address, type=socket.SOCK_STREAM):
+        '''Bind ``SO_REUSEPORT`` sockets to ``address`` in the monitor.
+
+        :return: the list of bound sockets if the
+            :ref:`reuse-port <setting-reuse_port>` setting is on and
+            the server has process-based workers, otherwise ``None``.
+        '''
+        cfg = self.cfg
+        if not (cfg.reuse_port and cfg.workers and
+                isinstance(address, tuple)):
+            return
+        if not pulsar.platform.has_reuse_port:
+            raise ImproperlyConfigured('SO_REUSEPORT is not available')
+        host, port = address
+        sockets = []
+        try:
+            infos = socket.getaddrinfo(host or None, port, 0, type, 0,
+                                       socket.AI_PASSIVE)
+            for sockaddr in OrderedDict(((info[4], None) for info in infos)):
+                sockets.append(reuse_port_socket(sockaddr, type))
+        except socket.error as e:
+            for sock in sockets:
+                sock.close()
+            raise ImproperlyConfigured(e)
+        return sockets
+
+    def release_sockets(self, monitor):
+        '''Close the sockets reserving the address in the ``monitor``.
+        '''
+        sockets = getattr(monitor, 'reserved_sockets', None)
+        if sockets:
+            monitor.reserved_sockets = None
+            for sock in sockets:
+                close_socket(sock)
+
     #   INTERNALS
     def create_server(self, worker):
         '''Create the Server which will listen for requests.
@@ -285,6 +397,9 @@ class SocketServer(pulsar.Application):
         '''
         sockets = worker.sockets
         cfg = self.cfg
+        if sockets is None:
+            sockets = [reuse_port_socket(address)
+                       for address in cfg.addresses]
         max_requests = cfg.max_requests
         if max_requests:
             max_requests = int(lognormvariate(log(max_requests), 0.2))
@@ -293,6 +408,7 @@ class SocketServer(pulsar.Application):
                                      sockets=sockets,
                                      max_requests=max_requests,
                                      keep_alive=cfg.keep_alive,
+                                     autocork=cfg.autocork,
                                      name=self.name,
                                      logger=self.logger)
         for event in ('connection_made', 'pre_request', 'post_request',
@@ -337,6 +453,16 @@ class UdpSocketServer(SocketServer):
             raise pulsar.ImproperlyConfigured('Could not open a socket. '
                                               'No address to bind to')
         address = parse_address(self.cfg.address)
+        sockets = self.reuse_port_sockets(address, socket.SOCK_DGRAM)
+        if sockets:
+            # A bound datagram socket receives its share of datagrams,
+            # which would never be read. Only resolve the address and let
+            # each worker bind its own socket
+            monitor.sockets = None
+            cfg.addresses = [sock.getsockname() for sock in sockets]
+            for sock in sockets:
+                close_socket(sock)
+            return
         # First create the sockets
         t, _ = yield from loop.create_datagram_endpoint(
             asyncio.DatagramProtocol, address)
@@ -360,12 +486,17 @@ class UdpSocketServer(SocketServer):
         :return: the server obtained from :meth:`server_factory`.
         '''
         cfg = self.cfg
+        sockets = worker.sockets
+        if sockets is None:
+            sockets = [partial(datagram_transport,
+                               reuse_port_socket(address, socket.SOCK_DGRAM))
+                       for address in cfg.addresses]
         max_requests = cfg.max_requests
         if max_requests:
             max_requests = int(lognormvariate(log(max_requests), 0.2))
         server = self.server_factory(self.protocol_factory(),
                                      worker._loop,
-                                     sockets=worker.sockets,
+                                     sockets=sockets,
                                      max_requests=max_requests,
                                      name=self.name,
                                      logger=self.logger)
@@ -42,6 +42,17 @@ For available run options::
 
     python script.py --help
 
+To build a :class:`.LazyWsgi` handler in the arbiter, before process
+workers are forked, use the :ref:`preload_app <setting-preload_app>`
+setting::
+
+    python script.py --preload-app
+
+Workers share the preloaded handler copy-on-write. The ``wsgi`` entry of
+the worker info reports if the handler was preloaded and the time taken to
+build it, while the ``system`` entry reports the worker ``memory`` and the
+part of it which is ``memory_shared``.
+
 
 
 WSGI Server
@@ -73,11 +84,34 @@ from .routers import *
 from .auth import *
 
 
+class WsgiSetting(pulsar.Setting):
+    virtual = True
+    app = 'wsgi'
+    section = "WSGI Servers"
+
+
+class HttpPipelining(WsgiSetting):
+    name = "http_pipeline"
+    flags = ["--http-pipeline"]
+    validator = pulsar.validate_pos_int
+    type = int
+    default = 0
+    desc = """\
+        Maximum number of pipelined HTTP/1.1 requests processed
+        concurrently on a connection.
+
+        When greater than one, requests received while the previous
+        response is still being produced are dispatched straight away and
+        their responses are buffered so that they are written in the order
+        the requests were received. By default pipelined requests are
+        processed one after the other."""
+
+
 class WSGIServer(SocketServer):
     '''A WSGI :class:`.SocketServer`.
     '''
     name = 'wsgi'
-    cfg = pulsar.Config(apps=['socket'],
+    cfg = pulsar.Config(apps=['socket', 'wsgi'],
                         server_software=pulsar.SERVER_SOFTWARE)
 
     def protocol_factory(self):
@@ -85,3 +119,19 @@ class WSGIServer(SocketServer):
         consumer_factory = partial(HttpServerResponse, cfg.callable, cfg,
                                    cfg.server_software)
         return partial(Connection, consumer_factory)
+
+    def preload(self, monitor):
+        '''Build the handler of a :class:`.LazyWsgi` callable so that
+        process workers inherit it rather than building their own.
+        '''
+        callable = self.cfg.callable
+        if isinstance(callable, LazyWsgi):
+            callable.handler()
+
+    def worker_info(self, worker, info):
+        info = super(WSGIServer, self).worker_info(worker, info)
+        callable = self.cfg.callable
+        if isinstance(callable, LazyWsgi):
+            info['wsgi'] = {'preload_app': self.should_preload(),
+                            'setup_time': callable.local.get('setup_time')}
+        return info
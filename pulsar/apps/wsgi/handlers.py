@@ -98,6 +98,8 @@ via the ``_loop`` attribute::
 .. _WSGI: http://www.wsgi.org
 .. _`WSGI 1.0.1`: http://www.python.org/dev/peps/pep-3333/
 '''
+from timeit import default_timer
+
 from pulsar import Http404, async, isfuture
 from pulsar.utils.log import LocalMixin, local_method
 
@@ -203,7 +205,10 @@ class LazyWsgi(LocalMixin):
         is loaded via the :meth:`setup` method, once only,
         when first accessed.
         '''
-        return self.setup(environ)
+        start = default_timer()
+        handler = self.setup(environ)
+        self.local.setup_time = default_timer() - start
+        return handler
 
     def setup(self, environ=None):
         '''The setup function for this :class:`LazyWsgi`.
@@ -97,6 +97,8 @@ def wait_for_body_middleware(environ, start_response=None):
     other middleware to be processed.
 
     Useful when using synchronous web-frameworks such as :django:`django <>`.
+    Without it, ``wsgi.input`` streams the body as it arrives and the
+    application reads it asynchronously.
     '''
     def _wsgi_input(value):
         environ['wsgi.input'] = BytesIO(value)
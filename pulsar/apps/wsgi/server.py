@@ -16,7 +16,8 @@ import sys
 import time
 import os
 import socket
-from asyncio import wait_for
+from asyncio import wait_for, CancelledError
+from collections import deque
 from wsgiref.handlers import format_date_time
 
 import pulsar
@@ -37,7 +38,12 @@ __all__ = ['HttpServerResponse', 'MAX_CHUNK_SIZE', 'test_wsgi_environ']
 
 
 MAX_CHUNK_SIZE = 65536
+MAX_BODY_BUFFER = 4*MAX_CHUNK_SIZE
 MAX_TIME_IN_LOOP = 0.5
+MAX_ENVIRON_KEYS = 1000
+_environ_keys = {}
+_static_headers = {}
+_date_header = [None, b'']
 
 
 def test_wsgi_environ(path=None, method=None, headers=None, extra=None,
@@ -69,28 +75,71 @@ def test_wsgi_environ(path=None, method=None, headers=None, extra=None,
     #
     headers = Headers()
     stream = StreamReader(request_headers, parser)
-    stream.buffer = body or b''
-    stream.on_message_complete.set_result(None)
+    stream.feed_data(body)
+    stream.feed_eof()
     extra = extra or {}
     return wsgi_environ(stream, ('127.0.0.1', 8060), '777.777.777.777:8080',
                         headers, https=secure, extra=extra)
 
 
 class StreamReader:
+    '''The ``wsgi.input`` of requests served by :class:`HttpServerResponse`.
+
+    Body data is buffered as it arrives from the client and can be consumed
+    in chunks, without waiting for the full body, via :meth:`read` with a
+    size or, in python 3.5 and above, ``async for``::
+
+        def upload(environ, start_response):
+            stream = environ['wsgi.input']
+            while True:
+                chunk = yield from stream.read(65536)
+                if not chunk:
+                    break
+                ...
+
+    When more than ``limit`` unread bytes are buffered the transport stops
+    reading from the socket until the buffer is drained. Readers sharing
+    a transport, such as the ones of pipelined requests, share the
+    ``pausing`` set of readers which need the transport to be paused.
+    :meth:`read` without arguments waits for the full body, see also
+    :func:`.wait_for_body_middleware`.
+    '''
     _expect_sent = None
     _waiting = None
+    _waiter = None
+    _read_all = False
 
-    def __init__(self, headers, parser, transport=None):
+    def __init__(self, headers, parser, transport=None,
+                 limit=MAX_BODY_BUFFER, pausing=None):
         self.headers = headers
         self.parser = parser
         self.transport = transport
-        self.buffer = b''
+        self.limit = limit
+        self.pausing = set() if pausing is None else pausing
         self.on_message_complete = Future()
+        self._chunks = deque()
+        self._size = 0
 
     def __repr__(self):
         return repr(self.transport)
     __str__ = __repr__
 
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return chain_future(self.read(MAX_CHUNK_SIZE), callback=_next_chunk)
+
+    @property
+    def buffered(self):
+        '''Number of bytes received and not yet read.'''
+        return self._size
+
+    @property
+    def paused(self):
+        '''``True`` when this reader holds the transport paused.'''
+        return self in self.pausing
+
     def done(self):
         '''``True`` when the full HTTP message has been read.
         '''
@@ -110,8 +159,28 @@ class StreamReader:
             self._expect_sent = ''
         return False
 
-    def recv(self):
-        '''Read bytes in the buffer.
+    def feed_data(self, data):
+        '''Add body ``data`` received from the client.'''
+        if data:
+            self._chunks.append(data)
+            self._size += len(data)
+            self._wakeup()
+            if (self.limit and self._size > self.limit and
+                    not self._read_all and not self.paused and
+                    self.transport):
+                # pause on the first reader over its limit only
+                if not self.pausing:
+                    self.transport.pause_reading()
+                self.pausing.add(self)
+
+    def feed_eof(self):
+        '''The full body has been received.'''
+        if not self.on_message_complete.done():
+            self.on_message_complete.set_result(None)
+        self._wakeup()
+
+    def recv(self, n=None):
+        '''Read bytes in the buffer, up to ``n`` if given.
         '''
         if self.waiting_expect():
             if self.parser.get_version() < (1, 1):
@@ -120,38 +189,132 @@ class StreamReader:
                 msg = '%s 100 Continue\r\n\r\n' % self.protocol()
                 self._expect_sent = msg
                 self.transport.write(msg.encode(DEFAULT_CHARSET))
-        return self.parser.recv_body()
+        return self._pop(n)
+
+    def read(self, n=None):
+        '''Read from the body.
 
-    def read(self, maxbuf=None):
-        '''Return bytes in the buffer.
+        Without ``n``, return the full body once received. If the stream is
+        not yet ready, return a :class:`asyncio.Future` which results in the
+        bytes read. The body is buffered in memory regardless of ``limit``.
 
-        If the stream is not yet ready, return a :class:`asyncio.Future`
-        which results in the bytes read.
+        With ``n``, return a :class:`asyncio.Future` which results in up to
+        ``n`` bytes as soon as they are available, or an empty bytes
+        string once the body has been read.
         '''
+        if n is None:
+            return self._read_body()
+        if self._waiter:
+            raise RuntimeError('read called while waiting for data')
+        if not self._size and not self.done():
+            # send 100 Continue if the client waits for it
+            self.recv()
+            self._waiter = Future()
+            return chain_future(self._waiter, lambda r: self.recv(n))
+        future = Future()
+        future.set_result(self.recv(n))
+        return future
+
+    def resume_reading(self):
+        '''Resume reading from the transport if paused by this reader
+        and no other reader sharing the transport needs it paused.'''
+        pausing = self.pausing
+        if self in pausing:
+            pausing.discard(self)
+            if not pausing and self.transport:
+                self.transport.resume_reading()
+
+    def fail(self):
+        if self.waiting_expect():
+            raise HttpException(status=417)
+
+    #    INTERNALS
+    def _read_body(self):
         if not self._waiting:
+            self._read_all = True
+            self.resume_reading()
             body = self.recv()
             if self.done():
-                return self._getvalue(body, maxbuf)
+                return self._getvalue(body)
             else:
                 self._waiting = chain_future(
                     self.on_message_complete,
-                    lambda r: self._getvalue(body, maxbuf))
+                    lambda r: self._getvalue(body))
                 return self._waiting
         else:
             return self._waiting
 
-    def fail(self):
-        if self.waiting_expect():
-            raise HttpException(status=417)
+    def _getvalue(self, body):
+        return body + self.recv()
 
-    #    INTERNALS
-    def _getvalue(self, body, maxbuf):
-        if self.buffer:
-            body = self.buffer + body
-        body = body + self.recv()
-        if maxbuf and len(body) > maxbuf:
-            body, self.buffer = body[:maxbuf], body[maxbuf:]
-        return body
+    def _pop(self, n=None):
+        chunks = self._chunks
+        if n is None or n >= self._size:
+            data = b''.join(chunks)
+            chunks.clear()
+        else:
+            parts = []
+            size = 0
+            while size < n:
+                chunk = chunks.popleft()
+                size += len(chunk)
+                parts.append(chunk)
+            if size > n:
+                chunk = parts[-1]
+                parts[-1] = chunk[:len(chunk) - size + n]
+                chunks.appendleft(chunk[len(chunk) - size + n:])
+            data = b''.join(parts)
+        self._size -= len(data)
+        if self.paused and self._size <= self.limit // 2:
+            self.resume_reading()
+        return data
+
+    def _wakeup(self):
+        waiter, self._waiter = self._waiter, None
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+
+def _next_chunk(chunk):
+    if not chunk:
+        raise StopAsyncIteration
+    return chunk
+
+
+def http_date_header(now=None):
+    '''The ``Date`` header line of a response as bytes.
+
+    The formatted date is cached and refreshed at most once per second.
+    '''
+    second = int(time.time() if now is None else now)
+    if second != _date_header[0]:
+        date = 'Date: %s\r\n' % format_date_time(second)
+        _date_header[:] = second, date.encode(DEFAULT_CHARSET)
+    return _date_header[1]
+
+
+def static_headers(server_software):
+    '''Serialized ``Server`` header line which does not change from one
+    response to another.'''
+    block = _static_headers.get(server_software)
+    if block is None:
+        if server_software:
+            block = ('Server: %s\r\n' % server_software).encode(
+                DEFAULT_CHARSET)
+        else:
+            block = b''
+        _static_headers[server_software] = block
+    return block
+
+
+def _environ_key(header):
+    # Lower case name and HTTP_ environ key of a request header, cached
+    # for up to MAX_ENVIRON_KEYS header names
+    lower = header.lower()
+    key = (lower, 'HTTP_' + lower.upper().replace('-', '_'))
+    if len(_environ_keys) < MAX_ENVIRON_KEYS:
+        _environ_keys[header] = key
+    return key
 
 
 def wsgi_environ(stream, address, client_address, headers,
@@ -187,7 +350,10 @@ def wsgi_environ(stream, address, client_address, headers,
     forward = client_address
     script_name = os.environ.get("SCRIPT_NAME", "")
     for header, value in request_headers:
-        header = header.lower()
+        try:
+            header, key = _environ_keys[header]
+        except KeyError:
+            header, key = _environ_key(header)
         if header in HOP_HEADERS:
             headers[header] = value
         if header == 'x-forwarded-for':
@@ -206,7 +372,6 @@ def wsgi_environ(stream, address, client_address, headers,
         elif header == "content-length":
             environ['CONTENT_LENGTH'] = value
             continue
-        key = 'HTTP_' + header.upper().replace('-', '_')
         environ[key] = value
     environ['wsgi.url_scheme'] = url_scheme
     if url_scheme == 'https':
@@ -276,6 +441,86 @@ def keep_alive_with_status(status, headers):
     return True
 
 
+class HttpPipeline:
+    '''Write the responses to pipelined requests in the order the
+    requests were received on a :class:`.Connection`.
+
+    Pipelined requests are processed concurrently. The response at the
+    head of the pipeline writes into the connection while data written
+    by the following ones is buffered until all previous responses are
+    finished.
+    '''
+    def __init__(self, connection):
+        self.connection = connection
+        self._responses = deque()
+        self._buffers = {}
+        self._close = None
+        connection._http_pipeline = self
+        connection.bind_event('connection_lost', self._connection_lost)
+
+    @property
+    def pending(self):
+        '''Number of responses in the pipeline.'''
+        return len(self._responses)
+
+    def add(self, response):
+        '''Add ``response`` at the end of the pipeline.
+
+        Invoked by all responses built by the :attr:`connection` once the
+        pipeline is created.
+        '''
+        response._pipeline = self
+        self._responses.append(response)
+        response.bind_event('post_request', self._finished)
+
+    def write(self, response, data):
+        '''Write ``data`` for ``response`` or buffer it until all
+        previous responses are written.'''
+        responses = self._responses
+        if responses and responses[0] is not response:
+            self._buffers.setdefault(response, []).append(data)
+            return ()
+        return self.connection.write(data)
+
+    def close(self, response):
+        '''Close the connection once ``response`` is written.'''
+        responses = self._responses
+        if responses and responses[0] is not response:
+            if self._close is None:
+                self._close = response
+        else:
+            self.connection.close()
+
+    def _finished(self, response, exc=None):
+        responses = self._responses
+        if not responses or responses[0] is not response:
+            return
+        responses.popleft()
+        while responses:
+            head = responses[0]
+            data = self._buffers.pop(head, None)
+            if data:
+                if self.connection.closed:
+                    return
+                self.connection.write(b''.join(data))
+            if head is self._close:
+                self.connection.close()
+                return
+            if not head.event('post_request').fired():
+                return
+            responses.popleft()
+        self._buffers.clear()
+
+    def _connection_lost(self, _, exc=None):
+        # Responses still running cannot be written, abort them
+        responses = list(self._responses)
+        self._responses.clear()
+        self._buffers.clear()
+        exc = ConnectionResetError('Connection lost')
+        for response in responses:
+            response._abort(exc)
+
+
 class HttpServerResponse(ProtocolConsumer):
     '''Server side WSGI :class:`.ProtocolConsumer`.
 
@@ -287,6 +532,8 @@ class HttpServerResponse(ProtocolConsumer):
     _headers_sent = None
     _stream = None
     _buffer = None
+    _pipeline = None
+    _task = None
     _logger = LOGGER
     SERVER_SOFTWARE = pulsar.SERVER_SOFTWARE
     ONE_TIME_EVENTS = ProtocolConsumer.ONE_TIME_EVENTS + ('on_headers',)
@@ -300,6 +547,11 @@ class HttpServerResponse(ProtocolConsumer):
         self.keep_alive = False
         self.SERVER_SOFTWARE = server_software or self.SERVER_SOFTWARE
 
+    def connection_made(self, connection):
+        pipeline = getattr(connection, '_http_pipeline', None)
+        if pipeline is not None:
+            pipeline.add(self)
+
     @property
     def headers_sent(self):
         '''Available once the headers have been sent to the client.
@@ -317,19 +569,26 @@ class HttpServerResponse(ProtocolConsumer):
         '''
         parser = self.parser
         processed = parser.execute(data, len(data))
-        if not self._stream and parser.is_headers_complete():
+        stream = self._stream
+        if stream:
+            stream.feed_data(parser.recv_body())
+        elif parser.is_headers_complete():
             headers = Headers(parser.get_headers(), kind='client')
-            self._stream = StreamReader(headers, parser, self.transport)
-            self._response(self.wsgi_environ())
+            stream = StreamReader(headers, parser, self.transport,
+                                  pausing=self._pausing_readers())
+            self._stream = stream
+            stream.feed_data(parser.recv_body())
+            self._task = self._response(self.wsgi_environ())
         #
         if parser.is_message_complete():
             #
             # Stream has the whole body
-            if not self._stream.on_message_complete.done():
-                self._stream.on_message_complete.set_result(None)
+            stream.feed_eof()
 
             if processed < len(data):
                 if not self._buffer:
+                    if self._can_pipeline():
+                        return self._pipeline_next(data[processed:])
                     self._buffer = data[processed:]
                     self.bind_event('post_request', self._new_request)
                 else:
@@ -428,7 +687,8 @@ class HttpServerResponse(ProtocolConsumer):
         chunks = []
         if not self._headers_sent:
             tosend = self.get_headers()
-            self._headers_sent = tosend.flat(self.version, self.status)
+            self._headers_sent = tosend.flat(self.version, self.status,
+                                             self._static_headers(tosend))
             self.fire_event('on_headers')
             chunks.append(self._headers_sent)
         if data:
@@ -443,6 +703,8 @@ class HttpServerResponse(ProtocolConsumer):
         elif force and self.chunked:
             chunks.append(chunk_encoding(data))
         if chunks:
+            if self._pipeline is not None:
+                return self._pipeline.write(self, b''.join(chunks))
             return write(b''.join(chunks))
 
     ########################################################################
@@ -494,23 +756,27 @@ class HttpServerResponse(ProtocolConsumer):
                 # make sure we write headers and last chunk if needed
                 self.write(b'', True)
 
+            except CancelledError:      # aborted by the pipeline
+                raise
             except IOError:     # client disconnected, end this connection
                 self.finished()
             except Exception:
                 if wsgi_request(environ).cache.handle_wsgi_error:
                     self.keep_alive = False
                     self._write_headers()
-                    self.connection.close()
+                    self._close_connection()
                     self.finished()
                 else:
                     done = False
                     exc_info = sys.exc_info()
             else:
                 if not self.keep_alive:
-                    self.connection.close()
+                    self._close_connection()
                 self.finished()
                 log_wsgi_info(self.logger.info, environ, self.status)
             finally:
+                # an unread body must not stall the connection
+                self._stream.resume_reading()
                 if hasattr(response, 'close'):
                     try:
                         response.close()
@@ -535,6 +801,10 @@ class HttpServerResponse(ProtocolConsumer):
 
     def get_headers(self):
         '''Get the headers to send to the client.
+
+        The ``Server`` and ``Date`` lines are not added to these headers,
+        they are written into the wire together with the headers unless
+        the application sets them.
         '''
         if not self._status:
             # we are sending headers but the start_response was not called
@@ -566,14 +836,59 @@ class HttpServerResponse(ProtocolConsumer):
                                       'pulsar.cfg': self.cfg,
                                       'wsgi.multiprocess': multiprocess})
         self.keep_alive = keep_alive(self.headers, self.parser.get_version())
-        self.headers.update([('Server', self.SERVER_SOFTWARE),
-                             ('Date', format_date_time(time.time()))])
         return environ
 
+    def _static_headers(self, headers):
+        # Server and Date lines not set by the application
+        server = None if 'Server' in headers else self.SERVER_SOFTWARE
+        block = static_headers(server)
+        if 'Date' not in headers:
+            block += http_date_header()
+        return block
+
+    def _pausing_readers(self):
+        # Readers holding the connection transport paused
+        connection = self._connection
+        pausing = getattr(connection, '_pausing_readers', None)
+        if pausing is None:
+            pausing = connection._pausing_readers = set()
+        return pausing
+
     def _new_request(self, _, exc=None):
         connection = self._connection
         connection.data_received(self._buffer)
 
+    def _can_pipeline(self):
+        limit = self.cfg.http_pipeline
+        if limit and limit > 1 and self.keep_alive:
+            return (self._pipeline is None or
+                    self._pipeline.pending < limit)
+        return False
+
+    def _pipeline_next(self, data):
+        # Hand over ``data`` to a new consumer which processes the next
+        # pipelined request while this one is still responding
+        connection = self._connection
+        if self._pipeline is None:
+            HttpPipeline(connection).add(self)
+        connection.release_consumer(self)
+        return data
+
+    def _close_connection(self):
+        if self._pipeline is not None:
+            self._pipeline.close(self)
+        else:
+            self.connection.close()
+
+    def _abort(self, exc):
+        # Stop the response and report ``exc`` to post_request listeners
+        if self._task is not None:
+            self._task.cancel()
+        event = self.finished(exc=exc)
+        if event is not None:
+            # the client is gone, do not log the exception as unhandled
+            event.exception()
+
     def _write_headers(self):
         if not self._headers_sent:
             if self.content_length:
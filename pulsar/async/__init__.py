@@ -8,4 +8,5 @@ from .clients import *
 from .tracelogger import format_traceback
 from .actor import *
 from .concurrency import *
+from .processes import *
 from . import commands
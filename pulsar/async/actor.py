@@ -10,6 +10,7 @@ from pulsar.utils.log import WritelnDecorator
 from .events import EventHandler
 from .proxy import ActorProxy, ActorProxyMonitor, actor_identity
 from .mailbox import command_in_context
+from .futures import chain_future
 from .access import get_actor, set_actor
 from .cov import Coverage
 from .consts import *
@@ -177,6 +178,12 @@ class Actor(EventHandler, Coverage):
         The :class:`asyncio.Handle` for the next
         :ref:`actor periodic task <actor-periodic-task>`.
 
+    .. attribute:: lag_monitor
+
+        The :class:`.LoopLagMonitor` sampling the event loop of this actor
+        or ``None`` if the :ref:`lag_interval <setting-lag_interval>`
+        setting is zero.
+
     .. attribute:: stream
 
         A ``stream`` handler to write information messages without using
@@ -187,6 +194,7 @@ class Actor(EventHandler, Coverage):
     exit_code = None
     mailbox = None
     monitor = None
+    lag_monitor = None
     next_periodic_task = None
 
     def __init__(self, impl):
@@ -244,6 +252,13 @@ class Actor(EventHandler, Coverage):
     def address(self):
         return self.mailbox.address
 
+    @property
+    def peer_address(self):
+        '''The socket address where this actor accepts direct connections
+        from other actors, ``None`` if not available.
+        '''
+        return getattr(self.mailbox, 'peer_address', None)
+
     @property
     def info_state(self):
         return ACTOR_STATES.DESCRIPTION[self.state]
@@ -323,6 +338,25 @@ class Actor(EventHandler, Coverage):
     def add_monitor(self, monitor_name, **params):
         return self.__impl.add_monitor(self, monitor_name, **params)
 
+    def run_in_process(self, callable, *args, **kwargs):
+        '''Run ``callable`` with ``args`` and ``kwargs`` in the process
+        pool of the arbiter.
+
+        Use it to offload CPU bound work which would otherwise block the
+        event loop of this actor. ``callable`` and its arguments must be
+        picklable and the pool size is controlled by the
+        :ref:`process_workers <setting-process_workers>` setting.
+
+        :return: a :class:`~asyncio.Future` called back with the result
+            of ``callable`` or with the exception it raised.
+        '''
+        if self.is_arbiter():
+            return self.__impl.run_in_process(self, callable, *args,
+                                              **kwargs)
+        result = self.send('arbiter', 'run_in_process', callable, *args,
+                           **kwargs)
+        return chain_future(result, callback=_process_result)
+
     def actorparams(self):
         '''Returns a dictionary of parameters for spawning actors.
 
@@ -395,7 +429,9 @@ class Actor(EventHandler, Coverage):
         * ``actor`` a dictionary containing information regarding the type of
           actor and its status.
         * ``events`` a dictionary of information about the
-          :ref:`event loop <asyncio-event-loop>` running the actor.
+          :ref:`event loop <asyncio-event-loop>` running the actor,
+          including lag percentiles and slow callbacks when the
+          :ref:`lag_interval <setting-lag_interval>` setting is positive.
         * ``extra`` the :attr:`extra` attribute (you can use it to add stuff).
         * ``system`` system info.
 
@@ -413,8 +449,13 @@ class Actor(EventHandler, Coverage):
                  'process_id': self.pid,
                  'is_process': isp,
                  'age': self.impl.age}
+        peer_address = self.peer_address
+        if peer_address:
+            actor['peer_address'] = peer_address
         events = {'callbacks': len(self._loop._ready),
                   'scheduled': len(self._loop._scheduled)}
+        if self.lag_monitor:
+            events.update(self.lag_monitor.info())
         data = {'actor': actor,
                 'events': events,
                 'extra': self.extra}
@@ -442,3 +483,12 @@ class Actor(EventHandler, Coverage):
 
     def _remove_actor(self, actor, log=True):
         return self.__impl._remove_actor(self, actor, log=log)
+
+
+def _process_result(result):
+    if not result:
+        raise CommandError('run_in_process failed in the arbiter')
+    success, value = result
+    if success:
+        return value
+    raise value
@@ -1,10 +1,8 @@
 from functools import reduce
 
-from pulsar.utils.internet import is_socket_closed
-
 import asyncio
 
-from .futures import AsyncObject
+from .futures import AsyncObject, async
 from .protocols import Producer
 
 
@@ -17,9 +15,26 @@ class Pool(AsyncObject):
     Open connections are either :attr:`in_use` or :attr:`available`
     to be used. Available connection are placed in an :class:`asyncio.Queue`.
 
+    Connection liveness is tracked via the ``connection_lost`` event of
+    connections: closed connections are removed from the available queue
+    as soon as they are lost.
+
     This class is not thread safe.
+
+    :param creator: callable returning a coroutine resulting in a new
+        connection.
+    :param pool_size: maximum number of open connections.
+    :param timeout: optional timeout in seconds when waiting for an available
+        connection.
+    :param max_idle: optional number of seconds after which an idle
+        connection is closed.
+    :param max_lifetime: optional number of seconds after which a connection
+        is closed, once released back to the pool.
+    :param min_idle: minimum number of idle connections the pool tries to
+        keep open. It only applies once the pool is used.
     '''
-    def __init__(self, creator, pool_size=10, loop=None, timeout=None, **kw):
+    def __init__(self, creator, pool_size=10, loop=None, timeout=None,
+                 max_idle=None, max_lifetime=None, min_idle=0, **kw):
         self._creator = creator
         self._closed = False
         self._timeout = timeout
@@ -27,6 +42,16 @@ class Pool(AsyncObject):
         self._connecting = 0
         self._loop = self._queue._loop
         self._in_use_connections = set()
+        self._max_idle = max_idle
+        self._max_lifetime = max_lifetime
+        self._min_idle = min(min_idle or 0, pool_size)
+        self._created = {}
+        self._idle_since = {}
+        self._reaper = None
+        self._stats = dict.fromkeys(('created', 'lost', 'expired',
+                                     'checkouts', 'waiting'), 0)
+        self._wait_time = 0
+        self._max_wait_time = 0
 
     @property
     def pool_size(self):
@@ -67,22 +92,74 @@ class Pool(AsyncObject):
         :return: a :class:`~asyncio.Future` resulting in the connection.
         '''
         assert not self._closed
-        connection = yield from self._get()
+        stats = self._stats
+        start = self._loop.time()
+        stats['waiting'] += 1
+        try:
+            connection = yield from self._get()
+        finally:
+            stats['waiting'] -= 1
+        wait = self._loop.time() - start
+        stats['checkouts'] += 1
+        self._wait_time += wait
+        self._max_wait_time = max(self._max_wait_time, wait)
+        if self._min_idle:
+            self._fill()
         return PoolConnection(self, connection)
 
     def close(self):
         '''Close all :attr:`available` and :attr:`in_use` connections.
         '''
         self._closed = True
+        if self._reaper:
+            self._reaper.cancel()
+            self._reaper = None
         queue = self._queue
         while queue.qsize():
             connection = queue.get_nowait()
-            connection.close()
+            if connection is not None:
+                connection.close()
         in_use = self._in_use_connections
         self._in_use_connections = set()
         for connection in in_use:
             connection.close()
 
+    def is_connection_closed(self, connection):
+        '''Check if ``connection`` is closed or expired.
+
+        It does not poll the socket, closed connections are detected via
+        their ``connection_lost`` event. Expired connections are closed.
+        '''
+        if connection not in self._created or getattr(connection, 'closed',
+                                                      False):
+            return True
+        elif self._expired(connection, self._loop.time()):
+            self._stats['expired'] += 1
+            self._forget(connection)
+            connection.close()
+            return True
+        return False
+
+    def info(self):
+        '''Dictionary of information about the pool and the time
+        spent waiting for connections to be checked out.'''
+        stats = self._stats
+        checkouts = stats['checkouts']
+        info = {'pool_size': self.pool_size,
+                'in_use': self.in_use,
+                'available': self.available,
+                'connecting': self._connecting,
+                'max_idle': self._max_idle,
+                'max_lifetime': self._max_lifetime,
+                'min_idle': self._min_idle,
+                'wait_time': self._wait_time,
+                'max_wait_time': self._max_wait_time,
+                'mean_wait_time': (self._wait_time/checkouts
+                                   if checkouts else 0)}
+        info.update(stats)
+        return info
+
+    #    INTERNALS
     def _get(self):
         queue = self._queue
         # grab the connection without waiting, important!
@@ -94,16 +171,13 @@ class Pool(AsyncObject):
                                                      self._timeout,
                                                      loop=self._loop)
         else:   # must create a new connection
-            self._connecting += 1
-            try:
-                connection = yield from self._creator()
-            finally:
-                self._connecting -= 1
+            connection = yield from self._create()
         # None signal that a connection was removed form the queue
         # Go again
         if connection is None:
             connection = yield from self._get()
         else:
+            self._idle_since.pop(connection, None)
             if self.is_connection_closed(connection):
                 connection = yield from self._get()
             else:
@@ -112,26 +186,97 @@ class Pool(AsyncObject):
 
     def _put(self, conn, discard=False):
         if not self._closed:
+            if not discard and self.is_connection_closed(conn):
+                discard = True
+            if not discard:
+                self._idle_since[conn] = self._loop.time()
             try:
                 self._queue.put_nowait(None if discard else conn)
             except asyncio.QueueFull:
                 conn.close()
+            else:
+                self._schedule_reaper()
         self._in_use_connections.discard(conn)
 
-    def is_connection_closed(self, connection):
-        if is_socket_closed(connection.sock):
-            connection.close()
-            return True
-        return False
+    def _create(self):
+        self._connecting += 1
+        try:
+            connection = yield from self._creator()
+        finally:
+            self._connecting -= 1
+        self._created[connection] = self._loop.time()
+        self._stats['created'] += 1
+        if hasattr(connection, 'bind_event'):
+            connection.bind_event('connection_lost', self._connection_lost)
+        return connection
 
-    def info(self, message=None, level=None):   # pragma    nocover
-        if self._queue._maxsize != 2:
-            return
-        message = '%s: ' % message if message else ''
-        self.logger.log(level or 10,
-                        '%smax size %s, in_use %s, available %s',
-                        message, self._queue._maxsize, self.in_use,
-                        self.available)
+    def _fill(self):
+        # Create connections until min_idle connections are available
+        opened = self.in_use + self.available + self._connecting
+        missing = min(self._min_idle - self.available - self._connecting,
+                      self.pool_size - opened)
+        for _ in range(missing):
+            # account for the connection before the task starts
+            self._connecting += 1
+            async(self._fill_one(), loop=self._loop)
+
+    def _fill_one(self):
+        self._connecting -= 1
+        try:
+            connection = yield from self._create()
+        except Exception:
+            self.logger.exception('Could not create idle connection')
+        else:
+            if self._closed:
+                connection.close()
+            else:
+                self._put(connection)
+
+    def _connection_lost(self, connection, exc=None):
+        if self._forget(connection):
+            self._stats['lost'] += 1
+            queue = self._queue._queue
+            if connection in queue:
+                queue.remove(connection)
+            if self._min_idle and not self._closed:
+                self._fill()
+
+    def _forget(self, connection):
+        self._idle_since.pop(connection, None)
+        return self._created.pop(connection, None) is not None
+
+    def _expired(self, connection, now):
+        if (self._max_lifetime and
+                now - self._created[connection] > self._max_lifetime):
+            return True
+        idle = self._idle_since.get(connection)
+        return bool(self._max_idle and idle is not None and
+                    now - idle > self._max_idle)
+
+    def _schedule_reaper(self):
+        if self._reaper is None and (self._max_idle or self._max_lifetime):
+            interval = min((t for t in (self._max_idle, self._max_lifetime)
+                            if t))
+            self._reaper = self._loop.call_later(interval/2, self._reap)
+
+    def _reap(self):
+        # Close idle connections which expired
+        self._reaper = None
+        now = self._loop.time()
+        queue = self._queue._queue
+        keep = self._min_idle
+        idle = self.available
+        for connection in list(queue):
+            if connection is None or idle <= keep:
+                continue
+            if self._expired(connection, now):
+                idle -= 1
+                queue.remove(connection)
+                self._stats['expired'] += 1
+                self._forget(connection)
+                connection.close()
+        if self.available:
+            self._schedule_reaper()
 
     def _count_connections(self, x, y):
         return x + int(y is not None)
@@ -204,12 +349,18 @@ class AbstractClient(Producer):
 
     def create_connection(self, address, protocol_factory=None, **kw):
         '''Helper method for creating a connection to an ``address``.
+
+        The ``address`` is either a ``(host, port)`` tuple or the path of
+        a unix domain socket.
         '''
         protocol_factory = protocol_factory or self.create_protocol
         if isinstance(address, tuple):
             host, port = address
             _, protocol = yield from self._loop.create_connection(
                 protocol_factory, host, port, **kw)
+        elif isinstance(address, (str, bytes)):
+            _, protocol = yield from self._loop.create_unix_connection(
+                protocol_factory, address, **kw)
         else:
             raise NotImplementedError('Could not connect to %s' %
                                       str(address))
@@ -1,12 +1,16 @@
+import pickle
 from time import time
 
 from pulsar import CommandError
+from pulsar.utils.pep import default_timer
+from pulsar.utils.structures import apply_delta
 
 from .proxy import command, ActorProxyMonitor
+from .mailbox import command_in_context
 from .futures import async_while
 
 
-@command()
+@command(control=True)
 def ping(request):
     return 'pong'
 
@@ -38,29 +42,46 @@ def run(request, callable, *args, **kwargs):
     return callable(request.actor, *args, **kwargs)
 
 
-@command(ack=False)
+@command(ack=False, control=True)
 def stop(request):
     '''Stop the actor from running.'''
     return request.actor.stop()
 
 
-@command()
-def notify(request, info):
+@command(control=True)
+def notify(request, info, delta=None):
     '''The actor notify itself with a dictionary of information.
 
     The command perform the following actions:
 
     * Update the mailbox to the current consumer of the actor connection
-    * Update the info dictionary
-    * Returns the time of the update
+    * Update the info dictionary, either replacing it with ``info`` or
+      applying the ``delta`` obtained from :func:`.mapping_delta`
+    * Returns the time of the update and the changes in the ``peer_address``
+      of the other actors managed by the same monitor, see
+      :func:`peer_addresses`
     '''
     t = time()
+    peers = None
     actor = request.actor
     remote_actor = request.caller
     if isinstance(remote_actor, ActorProxyMonitor):
         remote_actor.mailbox = request.connection
+        if delta is not None:
+            info = apply_delta(remote_actor.info, delta)
         info['last_notified'] = t
+        if remote_actor.spawn_time is None and remote_actor.spawning_start:
+            remote_actor.spawn_time = (default_timer() -
+                                       remote_actor.spawning_start)
+        info['spawn_time'] = remote_actor.spawn_time
         remote_actor.info = info
+        address = info.get('actor', {}).get('peer_address')
+        if address != remote_actor.peer_address:
+            remote_actor.peer_address = address
+            if address:
+                push_peer_address(actor, remote_actor)
+        if address:
+            peers = peer_addresses(actor, remote_actor, delta is None)
         callback = remote_actor.callback
         # if a callback is still available, this is the first
         # time we got notified
@@ -74,7 +95,47 @@ def notify(request, info):
             actor.logger.debug('Got notification from %s', remote_actor)
     else:
         actor._logger.warning('notify got a bad actor')
-    return t
+    return t, peers
+
+
+def peer_addresses(monitor, remote_actor, full=False):
+    '''Peer addresses of the actors managed by ``monitor`` which changed
+    since the last notification of ``remote_actor``.
+
+    Return a dictionary mapping actor ids to their ``peer_address``,
+    ``None`` for actors which are gone. When ``full`` is ``True`` all
+    the known addresses are returned.
+    '''
+    current = dict(((a.aid, a.peer_address)
+                    for a in monitor.managed_actors.values()
+                    if a.peer_address and a is not remote_actor))
+    sent = {} if full else (remote_actor.peers or {})
+    changes = dict(((aid, address) for aid, address in current.items()
+                    if sent.get(aid) != address))
+    changes.update(((aid, None) for aid in sent if aid not in current))
+    remote_actor.peers = current
+    return changes
+
+
+def push_peer_address(monitor, remote_actor):
+    '''Send the new ``peer_address`` of ``remote_actor`` to the other
+    actors managed by ``monitor`` without waiting for their next
+    notification.'''
+    aid, address = remote_actor.aid, remote_actor.peer_address
+    for other in list(monitor.managed_actors.values()):
+        if (other is not remote_actor and other.peers is not None and
+                other.mailbox):
+            other.peers[aid] = address
+            monitor.send(other, 'peers', {aid: address})
+
+
+@command(ack=False, control=True)
+def peers(request, addresses):
+    '''Update the peer addresses of other actors known by the actor.
+
+    Sent by the monitor when an actor advertises a new ``peer_address``.
+    '''
+    request.actor.mailbox.update_peers(addresses)
 
 
 @command()
@@ -89,7 +150,86 @@ def info(request):
     return request.actor.info()
 
 
+@command(control=True)
+def recycle(request, reason=None):
+    '''Ask the monitor to gracefully stop the calling actor and replace it
+    with a fresh one.
+
+    Return ``True`` if the calling actor is being recycled.
+    '''
+    monitor = request.actor
+    caller = request.caller
+    if monitor.is_monitor() and isinstance(caller, ActorProxyMonitor):
+        return monitor.impl.recycle_actor(monitor, caller, reason)
+    return False
+
+
+@command(control=True)
+def restart(request, name=None):
+    '''Rolling restart of the workers of the monitor ``name``, or of all
+    monitors if ``name`` is not given.
+    This command can only be executed by the arbiter::
+
+        send('arbiter', 'restart', 'wsgi')
+
+    Return the list of monitor names which started the rolling restart.
+    '''
+    arbiter = request.actor
+    if not arbiter.is_arbiter():
+        raise CommandError('restart can only be executed by the arbiter')
+    try:
+        return arbiter.impl.restart_monitors(arbiter, name)
+    except KeyError as exc:
+        raise CommandError(str(exc))
+
+
+@command()
+def run_in_process(request, callable, *args, **kwargs):
+    '''Run ``callable`` in the arbiter process pool.
+    This command can only be executed by the arbiter.
+
+    Return a two elements tuple ``(True, result)`` or ``(False, exception)``
+    so that the exception can be raised by the caller.
+    '''
+    arbiter = request.actor
+    if not arbiter.is_arbiter():
+        raise CommandError('run_in_process can only be executed by the '
+                           'arbiter')
+    try:
+        result = yield from arbiter.impl.run_in_process(arbiter, callable,
+                                                        *args, **kwargs)
+    except Exception as exc:
+        return False, exc
+    return True, result
+
+
+@command()
+def broadcast(request, command, *args, broadcast_timeout=None, **kwargs):
+    '''Send ``command`` with ``args`` and ``kwargs`` to all the actors
+    managed by the receiving monitor or arbiter::
+
+        results = yield from send('monitor', 'broadcast', 'info')
+
+    Return a dictionary of results keyed by actor id. Actors which fail to
+    respond within ``broadcast_timeout`` seconds have an exception as result.
+    '''
+    monitor = request.actor
+    if not (monitor.is_monitor() or monitor.is_arbiter()):
+        raise CommandError('broadcast can only be executed by a monitor')
+    return monitor.impl.broadcast(monitor, command, *args,
+                                  broadcast_timeout=broadcast_timeout,
+                                  **kwargs)
+
+
 @command()
+def broadcast_payload(request, payload):
+    '''Execute a command received via the :func:`broadcast` command.'''
+    command, args, kwargs = pickle.loads(payload)
+    return command_in_context(command, request.caller, request.actor, args,
+                              kwargs, request.connection)
+
+
+@command(control=True)
 def kill_actor(request, aid, timeout=5):
     '''Kill an actor with id ``aid``.
     This command can only be executed by the arbiter,
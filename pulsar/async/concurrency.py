@@ -1,8 +1,17 @@
 import os
 import sys
+import math
+import pickle
+from random import lognormvariate
+import tempfile
 from time import time
 from collections import OrderedDict
 from multiprocessing import Process, current_process
+try:
+    from multiprocessing import forkserver
+    from multiprocessing.context import ForkServerProcess
+except ImportError:     # pragma    nocover
+    ForkServerProcess = None
 from concurrent.futures import ThreadPoolExecutor
 
 import asyncio
@@ -12,13 +21,17 @@ from pulsar import system, MonitorStarted, HaltServer, Config
 from pulsar.utils.log import logger_fds
 from pulsar.utils import autoreload
 from pulsar.utils.tools import Pidfile
+from pulsar.utils.structures import flat_mapping, mapping_delta
 
 from .proxy import ActorProxyMonitor, get_proxy, actor_proxy_future
 from .access import get_actor, set_actor, logger, _StopError, SELECTORS
 from .threads import Thread
 from .mailbox import MailboxClient, MailboxProtocol, ProxyMailbox, create_aid
-from .futures import async, add_errback, chain_future, Future
+from .futures import (async, add_errback, chain_future, Future,
+                      MultiFuture)
 from .protocols import TcpServer
+from .lag import LoopLagMonitor
+from .processes import ProcessPool
 from .actor import Actor
 from .consts import *
 
@@ -28,6 +41,9 @@ if sys.platform == 'win32':     # pragma    nocover
 else:
     import signal
 
+# Names of the signals handled by the arbiter on top of the exit signals
+ARBITER_SIGNALS = ('SIGHUP', 'SIGCHLD')
+
 
 __all__ = ['arbiter']
 
@@ -69,6 +85,11 @@ class Concurrency(object):
     terminated_actors = None
     registered = None
     actor_class = Actor
+    _notified_info = None
+    _notify_ack = None
+    _max_age = None
+    _recycle_request = None
+    _recyclable = False
 
     def make(self, kind, cfg, name, aid, **kw):
         self.__class__._creation_counter += 1
@@ -143,6 +164,12 @@ class Concurrency(object):
         loop.set_default_executor(executor)
         loop.logger = actor._logger
         asyncio.set_event_loop(loop)
+        if self.cfg.lag_interval:
+            lag = LoopLagMonitor(loop, self.cfg.lag_interval,
+                                 self.cfg.slow_callback)
+            actor.lag_monitor = lag
+            loop.call_soon(lag.start)
+            actor.bind_event('stopping', lambda _, **kw: lag.stop())
         actor.mailbox = self.create_mailbox(actor, loop)
         return loop
 
@@ -175,12 +202,15 @@ class Concurrency(object):
 
     def create_actor(self):
         self.daemon = False
-        self.params['monitor'] = get_proxy(self.params['monitor'])
+        monitor = self.params['monitor']
+        self._recyclable = monitor.is_monitor()
+        self.params['monitor'] = get_proxy(monitor)
         return ActorProxyMonitor(self)
 
     def create_mailbox(self, actor, loop):
         '''Create the mailbox for ``actor``.'''
-        client = MailboxClient(actor.monitor.address, actor, loop)
+        client = MailboxClient(actor.monitor.address, actor, loop,
+                               peers=self.cfg.mailbox_peers)
         loop.call_soon_threadsafe(self.hand_shake, actor)
         client.bind_event('finish', lambda _, **kw: loop.stop())
         return client
@@ -199,8 +229,9 @@ class Concurrency(object):
             if actor.cfg.debug:
                 actor.logger.debug('notify monitor')
             # if an error occurs, shut down the actor
-            ack = actor.send('monitor', 'notify', actor.info())
+            ack = self._notify(actor)
             add_errback(ack, actor.stop)
+            self._recycle(actor)
             actor.fire_event('periodic_task')
             next = max(ACTOR_TIMEOUT_TOLE*actor.cfg.timeout, MIN_NOTIFY)
         else:
@@ -209,6 +240,72 @@ class Concurrency(object):
             min(next, MAX_NOTIFY), self.periodic_task, actor)
         return ack
 
+    def _notify(self, actor):
+        '''Send the heartbeat to the monitor.
+
+        The first heartbeat, and any heartbeat sent while the previous one
+        is still waiting for its acknowledgement, carries the full
+        :meth:`.Actor.info` dictionary. Otherwise only the changes since the
+        last acknowledged heartbeat are sent.
+        '''
+        info = actor.info() or {}
+        flat = flat_mapping(info)
+        notified = self._notified_info
+        if notified is None or self._notify_ack is not None:
+            ack = actor.send('monitor', 'notify', info)
+        else:
+            ack = actor.send('monitor', 'notify', None,
+                             delta=mapping_delta(notified, flat))
+        self._notify_ack = ack
+
+        def _acknowledged(fut):
+            if self._notify_ack is fut:
+                self._notify_ack = None
+            if not fut.cancelled() and not fut.exception():
+                self._notified_info = flat
+                result = fut.result()
+                if result and result[1]:
+                    actor.mailbox.update_peers(result[1])
+
+        ack.add_done_callback(_acknowledged)
+        return ack
+
+    def recycle_reason(self, actor):
+        '''The reason for recycling ``actor`` or ``None``.
+
+        An actor is recycled when it lives longer than
+        :ref:`max_worker_age <setting-max_worker_age>`, with a random jitter,
+        or when its process uses more than
+        :ref:`max_worker_memory <setting-max_worker_memory>`.
+        '''
+        cfg = actor.cfg
+        if cfg.max_worker_age:
+            if self._max_age is None:
+                self._max_age = lognormvariate(math.log(cfg.max_worker_age),
+                                               0.2)
+            uptime = actor._loop.time() - actor._started
+            if uptime > self._max_age:
+                return 'age %d seconds' % uptime
+        if cfg.max_worker_memory and actor.is_process():
+            memory = system.memory_usage()
+            if memory and memory > cfg.max_worker_memory << 20:
+                return 'memory %s' % system.convert_bytes(memory)
+
+    def _recycle(self, actor):
+        # Ask the monitor to stop and replace this actor. The monitor
+        # refuses while another actor is stopping, ask again later.
+        # The arbiter never recycles the actors it spawns directly
+        if self._recyclable and self._recycle_request is None:
+            reason = self.recycle_reason(actor)
+            if reason:
+                self._recycle_request = request = actor.send(
+                    'monitor', 'recycle', reason)
+
+                def _done(fut):
+                    self._recycle_request = None
+
+                request.add_done_callback(_done)
+
     def stop(self, actor, exc=None, exit_code=0):
         '''Gracefully stop the ``actor``.
         '''
@@ -264,7 +361,10 @@ class Concurrency(object):
     def _remove_signals(self, actor):
         if signal and actor.is_process():
             actor.logger.debug('Remove signal handlers')
-            for sig in system.EXIT_SIGNALS:
+            signals = list(system.EXIT_SIGNALS)
+            signals.extend(getattr(signal, name) for name in ARBITER_SIGNALS
+                           if hasattr(signal, name))
+            for sig in signals:
                 try:
                     actor._loop.remove_signal_handler(sig)
                 except Exception:
@@ -330,6 +430,8 @@ class MonitorMixin(object):
     def create_actor(self):
         self.managed_actors = {}
         self.terminated_actors = []
+        self.actors_load = {}
+        self.next_autoscale = 0
         actor = self.actor_class(self)
         actor.bind_event('on_info', self._info_monitor)
         return actor
@@ -427,26 +529,156 @@ class MonitorMixin(object):
                 monitor.send(actor, 'stop')
         return 1
 
+    def reap_actors(self, monitor):
+        '''Remove managed process actors which exited and, for monitors,
+        spawn their replacements.
+
+        Called by the arbiter when it receives ``SIGCHLD`` so that crashed
+        workers are replaced without waiting for the next
+        :ref:`periodic task <actor-periodic-task>`.
+
+        :return: the number of actors removed.
+        '''
+        dead = [a for a in self.managed_actors.values()
+                if a.impl.is_process() and not a.is_alive()]
+        for actor in dead:
+            actor.join()
+            if not actor.stopping_start:
+                monitor.logger.warning('%s exited with code %s', actor,
+                                       actor.impl.exitcode)
+            monitor._remove_actor(actor, False)
+        if dead and monitor.is_monitor() and monitor.is_running():
+            self.spawn_actors(monitor)
+        return len(dead)
+
     def spawn_actors(self, monitor):
         '''Spawn new actors if needed.
         '''
-        to_spawn = monitor.cfg.workers - len(self.managed_actors)
+        to_spawn = monitor.cfg.workers - len(self._active_actors())
         if monitor.cfg.workers and to_spawn > 0:
             for _ in range(to_spawn):
                 monitor.spawn()
 
     def stop_actors(self, monitor):
-        """Maintain the number of workers by spawning or killing as required
+        """Maintain the number of workers by spawning or killing as required.
+
+        The least loaded workers are stopped first.
         """
         if monitor.cfg.workers:
-            num_to_kill = len(self.managed_actors) - monitor.cfg.workers
-            for i in range(num_to_kill, 0, -1):
-                w, kage = 0, sys.maxsize
-                for worker in self.managed_actors.values():
-                    age = worker.impl.age
-                    if age < kage:
-                        w, kage = w, age
-                self.manage_actor(monitor, w, True)
+            actors = self._active_actors()
+            num_to_kill = len(actors) - monitor.cfg.workers
+            if num_to_kill > 0:
+                load = self.actors_load
+                actors.sort(key=lambda a: (load.get(a.aid, (0, 0, 0))[2],
+                                           a.impl.age))
+                for actor in actors[:num_to_kill]:
+                    self.manage_actor(monitor, actor, True)
+
+    def autoscale(self, monitor):
+        '''Adjust the number of :ref:`workers <setting-workers>` to the
+        load reported by the managed actors.
+
+        Autoscaling is enabled only when the
+        :ref:`workers_max <setting-workers_max>` setting is positive.
+        '''
+        cfg = monitor.cfg
+        if not cfg.workers_max:
+            return
+        low = max(cfg.workers_min, 1)
+        high = max(cfg.workers_max, low)
+        workers = cfg.workers
+        target = min(max(workers, low), high)
+        if target != workers:
+            cfg.set('workers', target)
+            return
+        actors = self._active_actors()
+        loads = [self.actor_load(monitor, actor) for actor in actors]
+        num = len(actors)
+        # wait for pending spawns/retirements and for all workers to report
+        if num != workers or None in loads:
+            return
+        now = time()
+        if now < self.next_autoscale:
+            return
+        load = sum(loads)/num
+        if load > 1 and num < high:
+            target = min(int(math.ceil(num*load)), high)
+        elif num > low and load*num/(num - 1) < AUTOSCALE_DOWN_LOAD:
+            target = num - 1
+        else:
+            return
+        monitor.logger.info('Autoscaling from %d to %d workers, load %.2f',
+                            num, target, load)
+        cfg.set('workers', target)
+        self.next_autoscale = now + cfg.autoscale_cooldown
+
+    def actor_load(self, monitor, actor):
+        '''The load of a managed ``actor`` from the information it has
+        notified.
+
+        A value of ``1`` means the actor has reached one of its autoscaling
+        targets. Return ``None`` if the actor has not notified yet.
+        '''
+        info = actor.info
+        notified = info.get('last_notified')
+        if not notified:
+            return
+        previous = self.actors_load.get(actor.aid)
+        if previous and previous[0] == notified:
+            return previous[2]
+        cfg = monitor.cfg
+        connections, requests = 0, 0
+        for value in info.values():
+            clients = value.get('clients') if isinstance(value, dict) else None
+            if isinstance(clients, dict):
+                connections += clients.get('connected_clients', 0)
+                requests += clients.get('requests_processed', 0)
+        loads = [0]
+        if cfg.autoscale_connections:
+            loads.append(connections/cfg.autoscale_connections)
+        lag = info.get('events', {}).get('lag')
+        if lag and cfg.autoscale_lag:
+            loads.append(lag/cfg.autoscale_lag)
+        if previous and cfg.autoscale_requests:
+            rate = (requests - previous[1])/(notified - previous[0])
+            loads.append(max(rate, 0)/cfg.autoscale_requests)
+        load = max(loads)
+        self.actors_load[actor.aid] = (notified, requests, load)
+        return load
+
+    def broadcast(self, monitor, command, *args, broadcast_timeout=None,
+                  **kwargs):
+        '''Send ``command`` with ``args`` and ``kwargs`` to all managed
+        actors.
+
+        The command and its parameters are pickled once and the same
+        payload is sent to every actor. Actors which cannot be reached or
+        do not respond within ``broadcast_timeout`` seconds are reported as
+        failures. The name does not clash with a ``timeout`` parameter of
+        ``command``.
+
+        :return: a :class:`.MultiFuture` called back with a dictionary of
+            results keyed by actor id. Failures are exception instances.
+        '''
+        timeout = broadcast_timeout
+        if timeout is None:
+            timeout = ACTOR_ACTION_TIMEOUT
+        payload = pickle.dumps((command, args, kwargs),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+        loop = monitor._loop
+        requests = {}
+        for aid, actor in self.managed_actors.items():
+            try:
+                request = monitor.send(actor, 'broadcast_payload', payload)
+            except Exception as exc:
+                request = Future(loop=loop)
+                request.set_exception(exc)
+            requests[aid] = asyncio.wait_for(request, timeout, loop=loop)
+        return MultiFuture(requests, loop=loop, raise_on_error=False)
+
+    def _active_actors(self):
+        return [a for a in self.managed_actors.values()
+                if not a.stopping_start]
 
     def _close_actors(self, monitor):
         # Close all managed actors at once and wait for completion
@@ -465,6 +697,7 @@ class MonitorMixin(object):
 
     def _remove_actor(self, monitor, actor, log=True):
         removed = self.managed_actors.pop(actor.aid, None)
+        self.actors_load.pop(actor.aid, None)
         if log and removed:
             log = False
             monitor.logger.warning('Removed %s', actor)
@@ -474,8 +707,14 @@ class MonitorMixin(object):
 
     def _info_monitor(self, actor, info=None):
         if actor.started():
+            spawn_times = [a.spawn_time for a in self.managed_actors.values()
+                           if a.spawn_time is not None]
+            spawn_time = None
+            if spawn_times:
+                spawn_time = sum(spawn_times)/len(spawn_times)
             info['actor'].update({'concurrency': actor.cfg.concurrency,
-                                  'workers': len(self.managed_actors)})
+                                  'workers': len(self.managed_actors),
+                                  'spawn_time': spawn_time})
             info['workers'] = [a.info for a in self.managed_actors.values()
                                if a.info]
         return info
@@ -492,6 +731,9 @@ class MonitorConcurrency(MonitorMixin, Concurrency):
     Monitors live in the **main thread** of the master process and
     therefore do not require to be spawned.
     '''
+    restarting = None
+    _restart_spawned = None
+
     def is_monitor(self):
         return True
 
@@ -519,8 +761,13 @@ class MonitorConcurrency(MonitorMixin, Concurrency):
             self.manage_actors(monitor)
             #
             if monitor.is_running():
-                self.spawn_actors(monitor)
-                self.stop_actors(monitor)
+                if self.restarting is None:
+                    self.autoscale(monitor)
+                    self.spawn_actors(monitor)
+                    self.stop_actors(monitor)
+                else:
+                    self.spawn_actors(monitor)
+                    self.rolling_restart(monitor)
             elif monitor.cfg.debug:
                 monitor.logger.debug('still stopping')
             #
@@ -530,6 +777,77 @@ class MonitorConcurrency(MonitorMixin, Concurrency):
             monitor.next_periodic_task = monitor._loop.call_later(
                 interval, self.periodic_task, monitor)
 
+    def restart_actors(self, monitor):
+        '''Start a rolling restart of the managed actors.
+
+        Actors are replaced one at the time by the :meth:`rolling_restart`
+        step of the monitor periodic task.
+        '''
+        if monitor.is_running() and self.restarting is None:
+            self.restarting = set(self._active_actors_ids())
+            monitor.logger.info('Rolling restart of %d workers',
+                                len(self.restarting))
+            return True
+        return False
+
+    def rolling_restart(self, monitor):
+        '''Replace one actor scheduled for restart.
+
+        A fresh actor is spawned first and, once it has notified the
+        monitor, one of the old actors is stopped. The monitor keeps the
+        listening sockets open so that capacity is never reduced.
+        '''
+        managed = self.managed_actors
+        old = [aid for aid in self._active_actors_ids()
+               if aid in self.restarting]
+        self.restarting = set(old)
+        if not old:
+            self.restarting = None
+            self._restart_spawned = None
+            monitor.logger.info('Rolling restart completed')
+            return
+        spawned = self._restart_spawned
+        if spawned is not None:
+            proxy = managed.get(spawned)
+            if proxy is None:
+                monitor.logger.error('Rolling restart aborted, new worker '
+                                     'did not start')
+                self.restarting = None
+                self._restart_spawned = None
+            elif proxy.notified:
+                self._restart_spawned = None
+                self.manage_actor(monitor, managed[old[0]], True)
+            return
+        before = set(managed)
+        monitor.spawn()
+        for aid in managed:
+            if aid not in before:
+                self._restart_spawned = aid
+
+    def recycle_actor(self, monitor, actor, reason=None):
+        '''Gracefully stop ``actor`` so that it is replaced by a fresh one.
+
+        Only one actor at the time is recycled: the request is refused while
+        other actors are stopping or during a rolling restart.
+
+        :return: ``True`` if ``actor`` is being recycled.
+        '''
+        if actor.aid not in self.managed_actors or not monitor.is_running():
+            return False
+        if actor.stopping_start:
+            return True
+        if self.restarting is not None:
+            return False
+        for other in self.managed_actors.values():
+            if other.stopping_start:
+                return False
+        monitor.logger.info('Recycling %s, %s', actor, reason)
+        self.manage_actor(monitor, actor, True)
+        return True
+
+    def _active_actors_ids(self):
+        return [a.aid for a in self._active_actors()]
+
     def _stop_actor(self, actor, finished=False):
         if finished:
             return
@@ -550,6 +868,7 @@ class ArbiterConcurrency(MonitorMixin, ProcessMixin, Concurrency):
     '''Concurrency implementation for the ``arbiter``
     '''
     pidfile = None
+    process_pool = None
 
     def is_arbiter(self):
         return True
@@ -609,20 +928,91 @@ class ArbiterConcurrency(MonitorMixin, ProcessMixin, Concurrency):
                 return
         actor.start_coverage()
         self._install_signals(actor)
+        if signal and hasattr(signal, 'SIGHUP'):
+            try:
+                actor._loop.add_signal_handler(
+                    signal.SIGHUP, self.handle_restart_signal, actor)
+            except (ValueError, RuntimeError):
+                # not in the main thread
+                pass
+        if signal and hasattr(signal, 'SIGCHLD'):
+            try:
+                actor._loop.add_signal_handler(
+                    signal.SIGCHLD, self.handle_child_signal, actor)
+            except (ValueError, RuntimeError):
+                # not in the main thread
+                pass
+
+    def handle_child_signal(self, actor):
+        '''A child process exited, reap it from the arbiter and
+        the monitors.
+
+        An event loop has only one ``SIGCHLD`` handler. An asyncio child
+        watcher attached to the arbiter event loop, for example by
+        ``asyncio.create_subprocess_exec``, replaces this handler, and
+        this handler replaces the one of a watcher attached before the
+        arbiter starts. Subprocesses should therefore be created by
+        actors other than the arbiter. Without this handler, exited
+        workers are still reaped by the
+        :ref:`periodic task <actor-periodic-task>`.
+        '''
+        self.reap_actors(actor)
+        for monitor in list(self.monitors.values()):
+            if not monitor.closed():
+                monitor.impl.reap_actors(monitor)
+
+    def handle_restart_signal(self, actor):
+        actor.logger.warning('Got SIGHUP. Restarting workers.')
+        self.restart_monitors(actor)
+
+    def restart_monitors(self, actor, name=None):
+        '''Rolling restart of the workers of all monitors or of the
+        monitor ``name``.
+
+        :return: the list of monitor names which started a rolling restart.
+        '''
+        if name is not None and name not in self.monitors:
+            raise KeyError('Monitor "%s" not available' % name)
+        restarted = []
+        for monitor in list(self.monitors.values()):
+            if name is None or monitor.name == name:
+                if monitor.impl.restart_actors(monitor):
+                    restarted.append(monitor.name)
+        return restarted
 
     def create_mailbox(self, actor, loop):
         '''Override :meth:`.Concurrency.create_mailbox` to create the
         mailbox server.
         '''
-        mailbox = TcpServer(MailboxProtocol, loop, ('127.0.0.1', 0),
-                            name='mailbox')
+        address = ('127.0.0.1', 0)
+        if self.cfg.mailbox_unix_socket and system.platform.has_unix_socket:
+            address = self._unix_address(actor)
+        mailbox = TcpServer(MailboxProtocol, loop, address, name='mailbox')
         # when the mailbox stop, close the event loop too
         mailbox.bind_event('stop', lambda _, **kw: loop.stop())
+        if isinstance(address, str) and not address.startswith('\0'):
+            mailbox.bind_event('stop', lambda _, **kw: self._unlink(address))
         mailbox.bind_event(
             'start',
             lambda _, **kw: loop.call_soon(self.hand_shake, actor))
         return mailbox
 
+    def _unix_address(self, actor):
+        # Unix domain socket address for the mailbox server. Use the
+        # abstract namespace on linux so that there is no file to clean up
+        name = 'pulsar-mailbox-%s' % actor.pid
+        if system.platform.is_linux:
+            return '\0%s' % name
+        address = os.path.join(tempfile.gettempdir(), '%s.sock' % name)
+        self._unlink(address)
+        return address
+
+    def _unlink(self, address):
+        try:
+            os.unlink(address)
+        except OSError:
+            pass
+
     def periodic_task(self, actor, **kw):
         '''Override the :meth:`.Concurrency.periodic_task` to implement
         the :class:`.Arbiter` :ref:`periodic task <actor-periodic-task>`.'''
@@ -663,6 +1053,20 @@ class ArbiterConcurrency(MonitorMixin, ProcessMixin, Concurrency):
             actor._loop.call_soon(self._exit_arbiter, actor)
             actor._run(False)
 
+    def run_in_process(self, actor, callable, *args, **kwargs):
+        '''Run ``callable`` in the :class:`.ProcessPool` shared by all
+        actors. The pool is created the first time this method is called.
+
+        :return: a :class:`~asyncio.Future` called back with the result
+            of ``callable``.
+        '''
+        if self.process_pool is None:
+            cfg = actor.cfg
+            self.process_pool = ProcessPool(cfg.process_workers or None,
+                                            cfg.process_max_tasks)
+        return self.process_pool.submit(actor._loop, callable, *args,
+                                        **kwargs)
+
     def _exit_arbiter(self, actor, done=False):
         if done:
             actor.logger.debug('Closing mailbox server')
@@ -702,6 +1106,8 @@ class ArbiterConcurrency(MonitorMixin, ProcessMixin, Concurrency):
 
     def _stop_arbiter(self, actor):     # pragma    nocover
         self._remove_signals(actor)
+        if self.process_pool is not None:
+            self.process_pool.close()
         p = self.pidfile
         if p is not None:
             actor.logger.debug('Removing %s' % p.fname)
@@ -755,6 +1161,8 @@ class ArbiterConcurrency(MonitorMixin, ProcessMixin, Concurrency):
         server.pop('ppid', None)
         server.pop('actor_id', None)
         server.pop('age', None)
+        if self.process_pool is not None:
+            server['process_pool'] = self.process_pool.info()
         data['server'] = server
         data['workers'] = [a.info for a in self.managed_actors.values()]
         data['monitors'] = monitors
@@ -793,6 +1201,26 @@ class ActorProcess(ProcessMixin, Concurrency, Process):
         actor.stop_coverage()
 
 
+class ActorForkServerProcess(ActorProcess):
+    '''Actor on a process forked by the multiprocessing fork server.
+
+    The fork server is started when the first actor is spawned and it
+    imports the ``__main__`` module, pulsar and the application module.
+    Used when the :ref:`fork_server <setting-fork_server>` setting is on.
+    '''
+    _start_method = 'forkserver'
+
+    @staticmethod
+    def _Popen(process_obj):
+        modules = ['__main__', 'pulsar']
+        application = process_obj.cfg.application
+        if application:
+            modules.append(application.__module__)
+        # No effect once the fork server is running
+        forkserver.set_forkserver_preload(modules)
+        return ForkServerProcess._Popen(process_obj)
+
+
 class ActorThread(Concurrency, Thread):
     '''Actor on a thread of the master process
     '''
@@ -854,6 +1282,8 @@ def _spawn_actor(kind, monitor, cfg=None, name=None, aid=None, **kw):
         raise TypeError('Cannot spawn')
 
     maker = concurrency_models.get(kind)
+    if kind == 'process' and cfg.fork_server and ForkServerProcess:
+        maker = ActorForkServerProcess
     if maker:
         c = maker()
         return c.make(kind, cfg, name, aid, monitor=monitor, **params)
@@ -49,3 +49,6 @@ ACTOR_JOIN_THREAD_POOL_TIMEOUT = 5  # TIMEOUT WHEN JOINING THE THREAD POOL
 MONITOR_TASK_PERIOD = 1
 '''Interval for :class:`pulsar.Monitor` and :class:`pulsar.Arbiter`
 periodic task.'''
+AUTOSCALE_DOWN_LOAD = 0.7
+'''When autoscaling, a :class:`pulsar.Monitor` retires a worker only if the
+load of the remaining workers would stay below this value.'''
@@ -164,7 +164,8 @@ class EventHandler(AsyncObject):
     '''A Mixin for handling events on :ref:`async objects <async-object>`.
 
     It handles :class:`OneTime` events and :class:`Event` that occur
-    several times.
+    several times. Events are created lazily, the first time they are
+    accessed or fired.
     '''
     ONE_TIME_EVENTS = ()
     '''Event names which occur once only.'''
@@ -174,22 +175,20 @@ class EventHandler(AsyncObject):
                  many_times_events=None):
         assert isinstance(loop, _EVENT_LOOP_CLASSES)
         self._loop = loop
-        one = self.ONE_TIME_EVENTS
         if one_time_events:
-            one = set(one)
-            one.update(one_time_events)
-        events = dict(((name, OneTime(loop=loop, name=name)) for name in one))
-        many = self.MANY_TIMES_EVENTS
+            self.ONE_TIME_EVENTS = tuple(set(self.ONE_TIME_EVENTS).union(
+                one_time_events))
         if many_times_events:
-            many = set(many)
-            many.update(many_times_events)
-        events.update(((name, Event(loop=loop, name=name)) for name in many))
-        self._events = events
+            self.MANY_TIMES_EVENTS = tuple(set(self.MANY_TIMES_EVENTS).union(
+                many_times_events))
+        self._events = {}
 
     @property
     def events(self):
         '''The dictionary of all events.
         '''
+        for name in self.ONE_TIME_EVENTS + self.MANY_TIMES_EVENTS:
+            self.event(name)
         return self._events
 
     def event(self, name):
@@ -197,7 +196,16 @@ class EventHandler(AsyncObject):
 
         If no event is registered for ``name`` returns nothing.
         '''
-        return self._events.get(name)
+        event = self._events.get(name)
+        if event is None:
+            if name in self.ONE_TIME_EVENTS:
+                event = OneTime(loop=self._loop, name=name)
+            elif name in self.MANY_TIMES_EVENTS:
+                event = Event(loop=self._loop, name=name)
+            else:
+                return
+            self._events[name] = event
+        return event
 
     def fired_event(self, name):
         event = self._events.get(name)
@@ -223,9 +231,9 @@ class EventHandler(AsyncObject):
             can also be a list/tuple of callables.
         :return: nothing.
         '''
-        if name not in self._events:
-            self._events[name] = Event()
-        event = self._events[name]
+        event = self.event(name)
+        if event is None:
+            event = self._events[name] = Event(loop=self._loop, name=name)
         event.bind(callback)
 
     def remove_callback(self, name, callback):
@@ -241,7 +249,7 @@ class EventHandler(AsyncObject):
         The events callbacks can be specified as a single callable or as
         list/tuple of callabacks or (callback, erroback) tuples.
         '''
-        for name in self._events:
+        for name in self.events:
             if name in events:
                 self.bind_event(name, events[name])
 
@@ -265,7 +273,12 @@ class EventHandler(AsyncObject):
         else:
             raise TypeError('fire_event expected at most 1 argument got %s' %
                             len(args))
-        event = self.event(name)
+        event = self._events.get(name)
+        if event is None:
+            if name in self.MANY_TIMES_EVENTS:
+                # nobody is listening, no need to create the event
+                return
+            event = self.event(name)
         if event:
             try:
                 event.fire(arg, **kwargs)
@@ -281,7 +294,7 @@ class EventHandler(AsyncObject):
         This causes the event not to fire at the :meth:`fire_event` method
         is invoked with the event ``name``.
         '''
-        event = self._events.get(name)
+        event = self.event(name)
         if event:
             event.silence()
 
@@ -292,10 +305,9 @@ class EventHandler(AsyncObject):
         provided the events handlers already exist.
         '''
         if isinstance(other, EventHandler):
-            events = self._events
             for name, event in other._events.items():
                 if isinstance(event, Event) and event._handlers:
-                    ev = events.get(name)
+                    ev = self.event(name)
                     # If the event is available add it
                     if ev:
                         for callback in event._handlers:
@@ -0,0 +1,147 @@
+import sys
+import threading
+from collections import deque
+
+from asyncio.events import Handle
+
+
+__all__ = ['LoopLagMonitor']
+
+
+_run_code = Handle._run.__code__
+
+
+class LoopLagMonitor(object):
+    '''Sample the scheduling lag of an event loop.
+
+    Every :attr:`interval` seconds a timer measures how late the loop
+    runs it and stores the lag in a fixed size window. A daemon thread
+    checks the same timer and, when the loop is stalled for more than
+    :attr:`slow_callback` seconds, records the source location of the
+    callback blocking the loop. The stall duration is accounted to that
+    location once the loop resumes.
+
+    The monitor must be started from the thread running the loop.
+    '''
+    samples = 600
+    '''Number of lag samples used to evaluate percentiles.'''
+    locations = 100
+    '''Maximum number of slow callback locations stored.'''
+
+    def __init__(self, loop, interval=0.1, slow_callback=0.1):
+        self._loop = loop
+        self.interval = interval
+        self.slow_callback = slow_callback
+        self.slow_callbacks = 0
+        self._lags = deque(maxlen=self.samples)
+        self._slow = {}
+        self._handle = None
+        self._beat = None
+        self._stalled = None
+        self._culprit = None
+        self._thread_id = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self):
+        return self._handle is not None
+
+    def start(self):
+        '''Start sampling the loop.'''
+        if self._handle is None:
+            self._thread_id = threading.get_ident()
+            self._stopped.clear()
+            self._schedule(self._loop.time())
+            watcher = threading.Thread(target=self._watch,
+                                       name='pulsar-loop-lag')
+            watcher.daemon = True
+            watcher.start()
+
+    def stop(self):
+        '''Stop sampling.'''
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._stopped.set()
+
+    def info(self):
+        '''Dictionary of loop health information added to the ``events``
+        entry of :meth:`.Actor.info`.
+
+        ``lag`` is the 90th percentile of the lag samples, in seconds.
+        ``slow_locations`` contains the five locations which blocked the
+        loop for longer as ``[location, count, total, max]`` lists.
+        '''
+        lags = sorted(self._lags)
+        info = {'lag': 0, 'lag_p50': 0, 'lag_p99': 0, 'lag_max': 0,
+                'slow_callbacks': self.slow_callbacks}
+        if lags:
+            n = len(lags)
+            info.update({'lag': round(lags[int(0.9*n)], 4),
+                         'lag_p50': round(lags[int(0.5*n)], 4),
+                         'lag_p99': round(lags[int(0.99*n)], 4),
+                         'lag_max': round(lags[-1], 4)})
+        slow = sorted(self._slow.items(), key=lambda s: s[1][1],
+                      reverse=True)[:5]
+        info['slow_locations'] = [[location, count, round(total, 4),
+                                   round(dt, 4)]
+                                  for location, (count, total, dt) in slow]
+        return info
+
+    # INTERNALS
+    def _schedule(self, expected):
+        self._beat = expected
+        self._handle = self._loop.call_at(expected + self.interval,
+                                          self._sample,
+                                          expected + self.interval)
+
+    def _sample(self, expected):
+        lag = max(self._loop.time() - expected, 0)
+        self._lags.append(lag)
+        if lag >= self.slow_callback:
+            self.slow_callbacks += 1
+        culprit, self._culprit = self._culprit, None
+        if culprit:
+            self._add_slow(culprit, lag)
+        self._schedule(self._loop.time())
+
+    def _add_slow(self, location, dt):
+        slow = self._slow
+        if location in slow:
+            count, total, max_dt = slow[location]
+            slow[location] = (count + 1, total + dt, max(max_dt, dt))
+        else:
+            if len(slow) >= self.locations:
+                smaller = min(slow, key=lambda k: slow[k][1])
+                slow.pop(smaller)
+            slow[location] = (1, dt, dt)
+
+    def _watch(self):
+        # Runs in the watcher thread
+        time = self._loop.time
+        while not self._stopped.wait(self.interval):
+            beat = self._beat
+            if beat is None or beat == self._stalled:
+                continue
+            if time() - beat > self.interval + self.slow_callback:
+                frame = sys._current_frames().get(self._thread_id)
+                if frame is not None:
+                    self._stalled = beat
+                    self._culprit = self._location(frame)
+
+    def _location(self, frame):
+        innermost = frame
+        while frame is not None:
+            back = frame.f_back
+            if back is not None and back.f_code is _run_code:
+                break
+            frame = back
+        callback = frame or innermost
+        code = callback.f_code
+        location = '%s:%s %s' % (code.co_filename, code.co_firstlineno,
+                                 code.co_name)
+        if callback is not innermost:
+            location = '%s (%s:%s)' % (location,
+                                       innermost.f_code.co_filename,
+                                       innermost.f_lineno)
+        return location
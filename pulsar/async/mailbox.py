@@ -26,7 +26,25 @@ The implementation details are outlined below:
 * Communication is bidirectional and there is **only one connection** between
   the arbiter and any given actor.
 * Messages are encoded and decoded using the unmasked websocket protocol
-  implemented in :func:`.frame_parser`.
+  implemented in :func:`.frame_parser`. The frame body is produced by the
+  :class:`MailboxSerializer` selected via the
+  :ref:`mailbox_serializer <setting-mailbox_serializer>` setting.
+* When the :ref:`mailbox_batch <setting-mailbox_batch>` setting is on,
+  messages written during the same event loop iteration are packed into
+  a single frame and sent with one write.
+* When the :ref:`mailbox_peers <setting-mailbox_peers>` setting is on,
+  each actor listens for direct connections from other actors and
+  advertises its :attr:`~.Actor.peer_address` to its monitor via the
+  ``notify`` command. The response carries the peer addresses of the other
+  actors of the same monitor, which also pushes a new address to the other
+  actors as soon as it is advertised. Messages to these actors, either by
+  proxy or by id, are sent via a lazy :class:`PeerMailboxClient`,
+  bypassing the arbiter. Routing via the arbiter remains the fallback.
+* Messages travel in two lanes. Commands declared with ``control=True``,
+  such as ``notify``, ``ping`` and ``stop``, and their responses are
+  written ahead of any queued data message. Data messages are queued while
+  the transport is paused and :func:`.send` waits when more than
+  :ref:`mailbox_queue <setting-mailbox_queue>` data messages are queued.
 * If, for some reasons, the connection between an actor and the arbiter
   get broken, the actor will eventually stop running and garbaged collected.
 
@@ -49,24 +67,49 @@ Client
   :members:
   :member-order: bysource
 
+Peer Client
+~~~~~~~~~~~~
+
+.. autoclass:: PeerMailboxClient
+  :members:
+  :member-order: bysource
+
+Serializers
+~~~~~~~~~~~~
+
+.. autoclass:: MailboxSerializer
+  :members:
+  :member-order: bysource
+
+.. autoclass:: PickleSerializer
+
+.. autoclass:: CompactSerializer
+
+.. autofunction:: register_serializer
+
+.. autofunction:: get_serializer
+
 '''
 import socket
 import pickle
-from collections import namedtuple
+from collections import namedtuple, deque
 
-from pulsar import ProtocolError, CommandError
+from pulsar import ProtocolError, CommandError, ImproperlyConfigured
 from pulsar.utils.internet import nice_address
+from pulsar.utils.importer import module_attribute
 from pulsar.utils.websocket import frame_parser
 from pulsar.utils.string import gen_unique_id
 
 from .access import get_actor, is_async
 from .futures import Future, task
-from .proxy import actor_identity, get_proxy, get_command, ActorProxy
-from .protocols import Protocol
+from .proxy import (actor_identity, get_proxy, get_command, ActorProxy,
+                    global_commands_table)
+from .protocols import Protocol, TcpServer
 from .clients import AbstractClient
 
 
 CommandRequest = namedtuple('CommandRequest', 'actor caller connection')
+mailbox_serializers = {}
 
 
 def create_aid():
@@ -84,6 +127,119 @@ def command_in_context(command, caller, target, args, kwargs, connection=None):
     return result
 
 
+def register_serializer(name, serializer):
+    '''Register a new :class:`MailboxSerializer` with ``name``.
+
+    The ``serializer`` is either a :class:`MailboxSerializer` class or
+    the python dotted path to it. Registered serializers can be selected
+    via the :ref:`mailbox_serializer <setting-mailbox_serializer>` setting.
+    '''
+    mailbox_serializers[name] = serializer
+
+
+def get_serializer(name):
+    '''Return a :class:`MailboxSerializer` instance for ``name``.
+
+    ``name`` is either a registered serializer name or a python dotted path.
+    '''
+    serializer = mailbox_serializers.get(name, name)
+    if isinstance(serializer, str):
+        serializer = module_attribute(serializer, safe=True)
+    if not serializer:
+        raise ImproperlyConfigured('mailbox serializer "%s" not available'
+                                   % name)
+    return serializer()
+
+
+class MailboxSerializer(object):
+    '''Encode and decode the body of messages travelling between actors.
+
+    A message is a dictionary or a list of dictionaries (a batch).
+    Both actors of a mailbox connection must use the same serializer.
+    '''
+    def encode(self, message):
+        '''Encode a ``message`` into bytes.'''
+        raise NotImplementedError
+
+    def decode(self, data):
+        '''Decode bytes ``data`` into a message.'''
+        raise NotImplementedError
+
+
+class PickleSerializer(MailboxSerializer):
+    '''Serialize messages with the highest available pickle protocol.
+    '''
+    protocol = pickle.HIGHEST_PROTOCOL
+
+    def encode(self, message):
+        return pickle.dumps(message, protocol=self.protocol)
+
+    def decode(self, data):
+        return pickle.loads(data)
+
+
+class CompactSerializer(PickleSerializer):
+    '''A :class:`PickleSerializer` which encodes the most common messages
+    as fixed layout tuples rather than dictionaries with string keys.
+
+    Callbacks are encoded as ``(0, ack, result)`` while the commands in
+    :attr:`commands` are encoded as
+    ``(code, sender, target, args, kwargs, ack)``. All other messages are
+    pickled unchanged.
+    '''
+    commands = ('callback', 'notify', 'ping', 'run')
+
+    def __init__(self):
+        self.codes = dict(((c, i) for i, c in enumerate(self.commands)))
+
+    def encode(self, message):
+        if isinstance(message, list):
+            message = [self._pack(m) for m in message]
+        else:
+            message = self._pack(message)
+        return super(CompactSerializer, self).encode(message)
+
+    def decode(self, data):
+        message = super(CompactSerializer, self).decode(data)
+        if isinstance(message, list):
+            return [self._unpack(m) for m in message]
+        else:
+            return self._unpack(message)
+
+    def _pack(self, message):
+        code = self.codes.get(message.get('command'))
+        if code == 0:
+            return (0, message['ack'], message.get('result'))
+        elif code is not None:
+            return (code, message['sender'], message['target'],
+                    message['args'], message['kwargs'], message.get('ack'))
+        else:
+            return message
+
+    def _unpack(self, message):
+        if isinstance(message, tuple):
+            if message[0] == 0:
+                return {'command': 'callback',
+                        'ack': message[1],
+                        'result': message[2]}
+            else:
+                code, sender, target, args, kwargs, ack = message
+                data = {'command': self.commands[code],
+                        'sender': sender,
+                        'target': target,
+                        'args': args,
+                        'kwargs': kwargs}
+                if ack:
+                    data['ack'] = ack
+                return data
+        else:
+            return message
+
+
+register_serializer('pickle', PickleSerializer)
+register_serializer('compact', CompactSerializer)
+
+
 class ProxyMailbox(object):
     '''A proxy for the arbiter :class:`Mailbox`.
     '''
@@ -114,9 +270,10 @@ class ProxyMailbox(object):
 class Message(object):
     '''A message which travels from actor to actor.
     '''
-    def __init__(self, data, waiter=None):
+    def __init__(self, data, waiter=None, control=False):
         self.data = data
         self.waiter = waiter
+        self.control = control
 
     def __repr__(self):
         return self.data.get('command', 'unknown')
@@ -135,46 +292,105 @@ class Message(object):
             data['ack'] = create_aid()
         else:
             waiter.set_result(None)
-        return cls(data, waiter)
+        return cls(data, waiter, command.control)
 
     @classmethod
-    def callback(cls, result, ack):
+    def callback(cls, result, ack, command=None):
+        '''The response to ``command``, in the same lane as the command.'''
         data = {'command': 'callback', 'result': result, 'ack': ack}
-        return cls(data)
+        command = global_commands_table.get(command)
+        return cls(data, control=getattr(command, 'control', False))
 
 
 class MailboxProtocol(Protocol):
     '''The :class:`.Protocol` for internal message passing between actors.
 
     Encoding and decoding uses the unmasked websocket protocol.
+
+    :param batch: if ``True`` messages written during the same event loop
+        iteration are coalesced into one frame. If not provided the
+        :ref:`mailbox_batch <setting-mailbox_batch>` setting is used.
+    :param serializer: the :class:`MailboxSerializer` for encoding and
+        decoding messages. If not provided it is obtained from the
+        :ref:`mailbox_serializer <setting-mailbox_serializer>` setting.
+    :param max_queue: maximum number of queued data messages before
+        :meth:`request` waits. If not provided the
+        :ref:`mailbox_queue <setting-mailbox_queue>` setting is used.
     '''
-    def __init__(self, **kw):
+    _batch = None
+    _flush_handle = None
+
+    def __init__(self, batch=None, serializer=None, max_queue=None, **kw):
         super(MailboxProtocol, self).__init__(**kw)
         self._pending_responses = {}
+        self._control = deque()
+        self._data = deque()
+        self._senders = deque()
         self._parser = frame_parser(kind=2, pyparser=True)
         actor = get_actor()
+        if serializer is None:
+            serializer = get_serializer(actor.cfg.mailbox_serializer)
+        self._serializer = serializer
+        if batch is None:
+            batch = actor.cfg.mailbox_batch
+        if batch:
+            self._batch = True
+        if max_queue is None:
+            max_queue = actor.cfg.mailbox_queue
+        self._max_queue = max_queue
+        self.bind_event('connection_lost', self._abort_queue)
         if actor.is_arbiter():
             self.bind_event('connection_lost', self._connection_lost)
 
+    @property
+    def queued(self):
+        '''Number of data messages waiting to be written.'''
+        return len(self._data)
+
     def request(self, command, sender, target, args, kwargs):
         '''Used by the server to send messages to the client.'''
         req = Message.command(command, sender, target, args, kwargs)
+        if req.control or not self._full():
+            self._start(req)
+            return req.waiter
+        else:
+            return self._start_when_ready(req)
+
+    def resume_writing(self, exc=None):
+        super(MailboxProtocol, self).resume_writing(exc)
+        if self._data and exc is None and not self.closed:
+            self._flush()
+
+    @task
+    def _start_when_ready(self, req):
+        # Wait for room in the data lane and start the request
+        yield from self._wait_room(req)
         self._start(req)
-        return req.waiter
+        response = yield from req.waiter
+        return response
 
     def data_received(self, data):
-        # Feed data into the parser
+        for message in self._messages(data):
+            self._on_message(message)
+
+    ########################################################################
+    #    INTERNALS
+    def _messages(self, data):
+        # Feed data into the parser and yield decoded messages.
+        # A batched frame carries a list of messages.
         msg = self._parser.decode(data)
         while msg:
             try:
-                message = pickle.loads(msg.body)
+                message = self._serializer.decode(msg.body)
             except Exception as e:
                 raise ProtocolError('Could not decode message body: %s' % e)
-            self._on_message(message)
+            if isinstance(message, list):
+                for m in message:
+                    yield m
+            else:
+                yield message
             msg = self._parser.decode()
 
-    ########################################################################
-    #    INTERNALS
     def _start(self, req):
         if req.waiter and 'ack' in req.data:
             self._pending_responses[req.data['ack']] = req.waiter
@@ -203,7 +419,8 @@ class MailboxProtocol(Protocol):
                 pending = self._pending_responses.pop(ack)
             except KeyError:
                 raise KeyError('Callback %s not in pending callbacks' % ack)
-            pending.set_result(message.get('result'))
+            if not pending.done():
+                pending.set_result(message.get('result'))
         else:
             try:
                 target = actor.get_actor(message['target'])
@@ -235,10 +452,83 @@ class MailboxProtocol(Protocol):
                 self.logger.exception('Unhandled exception')
                 result = None
             if ack:
-                self._start(Message.callback(result, ack))
+                self._start(Message.callback(result, ack, command))
 
     def _write(self, req):
-        obj = pickle.dumps(req.data, protocol=2)
+        if req.control:
+            self._control.append(req)
+        else:
+            self._data.append(req)
+        if not self._batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_soon(self._flush)
+
+    def _flush(self):
+        # Write control messages first and data messages until the
+        # transport is paused. When batching, all messages queued during
+        # the last loop iteration are packed into one frame
+        self._flush_handle = None
+        control, data = self._control, self._data
+        reqs = list(control)
+        control.clear()
+        if self._batch:
+            if not self._paused:
+                reqs.extend(data)
+                data.clear()
+            if reqs:
+                self._send_requests(reqs)
+        else:
+            for req in reqs:
+                self._send_requests((req,))
+            while data and not self._paused:
+                self._send_requests((data.popleft(),))
+        self._wakeup_senders()
+
+    def _send_requests(self, reqs):
+        if len(reqs) == 1:
+            obj = reqs[0].data
+        else:
+            obj = [req.data for req in reqs]
+        try:
+            self._send(obj)
+        except Exception as exc:
+            self._fail(reqs, exc)
+
+    def _fail(self, reqs, exc):
+        for req in reqs:
+            if req.waiter and not req.waiter.done():
+                self._pending_responses.pop(req.data.get('ack'), None)
+                req.waiter.set_exception(exc)
+
+    def _full(self):
+        return self._max_queue and len(self._data) >= self._max_queue
+
+    def _wait_room(self, req):
+        # Wait until the data lane has room for a new data message
+        while not req.control and self._full() and not self.closed:
+            waiter = Future(loop=self._loop)
+            self._senders.append(waiter)
+            yield from waiter
+
+    def _wakeup_senders(self):
+        senders = self._senders
+        while senders and not self._full():
+            waiter = senders.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _abort_queue(self, _, exc=None):
+        data = list(self._data)
+        self._data.clear()
+        self._fail(data, ConnectionResetError('Mailbox connection lost'))
+        while self._senders:
+            waiter = self._senders.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _send(self, obj):
+        obj = self._serializer.encode(obj)
         data = self._parser.encode(obj, opcode=2)
         try:
             self._transport.write(data)
@@ -254,14 +544,31 @@ class MailboxProtocol(Protocol):
 
 class MailboxClient(AbstractClient):
     '''Used by actors to send messages to other actors via the arbiter.
+
+    :param peers: if ``True`` the client listens for direct connections
+        from other actors and sends messages to actors with a known
+        ``peer_address`` via a :class:`PeerMailboxClient`.
     '''
     protocol_factory = MailboxProtocol
 
-    def __init__(self, address, actor, loop):
+    def __init__(self, address, actor, loop, peers=False):
         super(MailboxClient, self).__init__(loop)
         self.address = address
         self.name = 'Mailbox for %s' % actor
+        self._actor = actor
         self._connection = None
+        self._peers = {} if peers else None
+        self._peer_addresses = {}
+        self._peer_socket = None
+        self._peer_server = None
+
+    @property
+    def peer_address(self):
+        '''Address where this mailbox accepts connections from other
+        actors, ``None`` if peer connections are not enabled.
+        '''
+        if self._peer_socket:
+            return self._peer_socket.getsockname()
 
     def response(self, request):
         resp = super(MailboxClient, self).response
@@ -277,22 +584,119 @@ class MailboxClient(AbstractClient):
     @task
     def request(self, command, sender, target, args, kwargs):
         # the request method
-        if self._connection is None:
-            self._connection = yield from self.connect()
-            self._connection.bind_event('connection_lost', self._lost)
+        connection = None
+        peer = self._peer(target)
+        if peer:
+            try:
+                connection = yield from peer._get_connection()
+            except OSError:
+                self._remove_peer(peer)
+        if connection is None:
+            connection = yield from self._get_connection()
         req = Message.command(command, sender, target, args, kwargs)
-        self._connection._start(req)
+        yield from connection._wait_room(req)
+        connection._start(req)
         response = yield from req.waiter
         return response
 
     def start_serving(self):
-        pass
+        if self._peers is not None and self._peer_socket is None:
+            # Bind the socket now so that the address is available
+            # before the first notification to the monitor
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(('127.0.0.1', 0))
+            self._peer_socket = sock
+            self._peer_server = TcpServer(MailboxProtocol, self._loop,
+                                          sockets=[sock], name='peer mailbox')
+            return self._peer_server.start_serving()
+
+    def update_peers(self, peers):
+        '''Update the known peer addresses of other actors.
+
+        :param peers: dictionary mapping actor ids to their ``peer_address``
+            as returned by the ``notify`` command. A ``None`` address
+            removes the actor.
+        '''
+        if self._peers is not None:
+            addresses = self._peer_addresses
+            for aid, address in peers.items():
+                if address:
+                    addresses[aid] = address
+                else:
+                    addresses.pop(aid, None)
 
     def close(self):
+        if self._peers:
+            for peer in list(self._peers.values()):
+                peer.close()
+        if self._peer_server:
+            self._peer_server.close()
         if self._connection:
             self._connection.close()
 
+    def _get_connection(self):
+        if self._connection is None:
+            self._connection = yield from self.connect()
+            self._connection.bind_event('connection_lost', self._lost)
+        return self._connection
+
+    def _peer(self, target):
+        # The PeerMailboxClient for target if available
+        if self._peers is None:
+            return
+        aid = actor_identity(target)
+        address = getattr(target, 'peer_address', None)
+        if address:
+            self._peer_addresses[aid] = address
+        else:
+            address = self._peer_addresses.get(aid)
+        if address and address != self.peer_address:
+            peer = self._peers.get(address)
+            if peer is None:
+                peer = PeerMailboxClient(address, self, self._loop)
+                self._peers[address] = peer
+            return peer
+
+    def _remove_peer(self, peer):
+        if self._peers and self._peers.get(peer.address) is peer:
+            self._peers.pop(peer.address)
+            for aid, address in list(self._peer_addresses.items()):
+                if address == peer.address:
+                    self._peer_addresses.pop(aid)
+
     def _lost(self, _, exc=None):
         # When the connection is lost, stop the event loop
         if self._loop.is_running():
             self._loop.stop()
+
+
+class PeerMailboxClient(MailboxClient):
+    '''A :class:`MailboxClient` connected directly to another actor.
+
+    Created lazily by the :class:`MailboxClient` of an actor when
+    :ref:`mailbox_peers <setting-mailbox_peers>` is on.
+    '''
+    def __init__(self, address, mailbox, loop):
+        super(PeerMailboxClient, self).__init__(address, mailbox._actor, loop)
+        self.name = 'Peer mailbox for %s' % mailbox._actor
+        self.mailbox = mailbox
+
+    @task
+    def request(self, command, sender, target, args, kwargs):
+        connection = yield from self._get_connection()
+        req = Message.command(command, sender, target, args, kwargs)
+        yield from connection._wait_room(req)
+        connection._start(req)
+        response = yield from req.waiter
+        return response
+
+    def _lost(self, connection, exc=None):
+        # A lost peer connection is not fatal, simply forget about it
+        self._connection = None
+        self.mailbox._remove_peer(self)
+        pending = connection._pending_responses
+        while pending:
+            _, waiter = pending.popitem()
+            if not waiter.done():
+                waiter.set_exception(
+                    ConnectionResetError('Lost connection with peer'))
@@ -5,7 +5,8 @@ class FlowControl(object):
     """A protocol mixin for flow control logic.
 
     This implements the protocol methods :meth:`pause_writing`,
-    :meth:`resume_writing`.
+    :meth:`resume_writing`. The protocol invokes the internal callbacks
+    directly when the connection is made, lost and after writing.
     """
     _paused = False
     _write_waiter = None
@@ -13,9 +14,6 @@ class FlowControl(object):
     def __init__(self, low_limit=None, high_limit=None, **kw):
         self._low_limit = low_limit
         self._high_limit = high_limit
-        self.bind_event('connection_made', self._set_flow_limits)
-        self.bind_event('connection_lost', self._wakeup_waiter)
-        self.bind_event('after_write', self._make_write_waiter)
 
     def pause_writing(self):
         '''Called by the transport when the buffer goes over the
@@ -68,11 +66,135 @@ class FlowControl(object):
             self._write_waiter = waiter
 
 
+class TimerWheel(object):
+    '''A coarse timer wheel for idle timeouts.
+
+    Deadlines are grouped into buckets of :attr:`resolution` seconds and
+    a single timer handle per event loop scans the expired buckets.
+    Touching a deadline is an attribute assignment, entries whose deadline
+    moved forward are rescheduled lazily when their bucket expires.
+    Use :meth:`get` to obtain the wheel of an event loop.
+    '''
+    resolution = 0.5
+
+    def __init__(self, loop, resolution=None):
+        self._loop = loop
+        self._buckets = {}
+        self._handle = None
+        self._tick = None
+        if resolution:
+            self.resolution = resolution
+
+    @classmethod
+    def get(cls, loop):
+        '''The :class:`TimerWheel` for ``loop``, created if not
+        available.'''
+        wheel = getattr(loop, '_timer_wheel', None)
+        if wheel is None:
+            wheel = cls(loop)
+            loop._timer_wheel = wheel
+        return wheel
+
+    def __len__(self):
+        return sum((len(b) for b in self._buckets.values()))
+
+    def add(self, entry, timeout):
+        '''Expire ``entry`` in ``timeout`` seconds.
+
+        When the deadline is reached the ``_timed_out`` method of ``entry``
+        is invoked.
+        '''
+        deadline = self._loop.time() + timeout
+        entry._timeout_deadline = deadline
+        bucket = entry._timeout_bucket
+        if bucket is None:
+            self._insert(entry, deadline)
+        elif self._key(deadline) < bucket:
+            self._buckets[bucket].discard(entry)
+            self._insert(entry, deadline)
+
+    def cancel(self, entry):
+        '''Lazily cancel the deadline of ``entry``.'''
+        entry._timeout_deadline = None
+
+    def remove(self, entry):
+        '''Cancel the deadline of ``entry`` and remove it from the wheel.
+        '''
+        entry._timeout_deadline = None
+        bucket = entry._timeout_bucket
+        if bucket is not None:
+            entry._timeout_bucket = None
+            self._buckets[bucket].discard(entry)
+
+    # INTERNALS
+    def _key(self, deadline):
+        key = int(deadline / self.resolution)
+        return key if key*self.resolution >= deadline else key + 1
+
+    def _insert(self, entry, deadline):
+        key = self._key(deadline)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = set()
+        bucket.add(entry)
+        entry._timeout_bucket = key
+        if self._handle is None:
+            if self._tick is None:
+                self._tick = int(self._loop.time() / self.resolution)
+            self._schedule(self._tick)
+
+    def _schedule(self, tick):
+        # scan at the end of the current tick
+        self._handle = self._loop.call_at((tick + 1)*self.resolution,
+                                          self._scan)
+
+    def _scan(self):
+        self._handle = None
+        now = self._loop.time()
+        current = int(now / self.resolution)
+        buckets = self._buckets
+        expired = []
+        keys = range(self._tick + 1, current + 1)
+        self._tick = current
+        for key in keys:
+            bucket = buckets.pop(key, None)
+            if not bucket:
+                continue
+            for entry in bucket:
+                entry._timeout_bucket = None
+                deadline = entry._timeout_deadline
+                if deadline is None:
+                    continue
+                elif deadline <= now:
+                    entry._timeout_deadline = None
+                    expired.append(entry)
+                else:
+                    self._insert(entry, deadline)
+        if buckets:
+            if self._handle is None:
+                self._schedule(current)
+        else:
+            self._tick = None
+        for entry in expired:
+            try:
+                entry._timed_out()
+            except Exception as exc:
+                self._loop.call_exception_handler({
+                    'message': 'Exception in idle timeout of %s' % entry,
+                    'exception': exc})
+
+
 class Timeout(object):
-    '''Adds a timeout for idle connections to protocols
+    '''Adds a timeout for idle connections to protocols.
+
+    Deadlines are registered into the event loop :class:`TimerWheel`
+    rather than creating a new ``call_later`` handle for each event.
+    The :class:`.Connection` invokes the internal callbacks directly
+    when the connection is made, lost, receives data and after writing.
     '''
     _timeout = None
-    _timeout_handler = None
+    _timeout_deadline = None
+    _timeout_bucket = None
 
     @property
     def timeout(self):
@@ -82,15 +204,6 @@ class Timeout(object):
     def timeout(self, timeout):
         '''Set a new :attr:`timeout` for this protocol
         '''
-        if self._timeout is None:
-            self.bind_event('connection_made', self._add_timeout)
-            self.bind_event('connection_lost', self._cancel_timeout)
-            self.bind_event('before_write', self._cancel_timeout)
-            self.bind_event('after_write', self._add_timeout)
-            self.bind_event('data_received', self._cancel_timeout)
-            self.bind_event('data_processed', self._add_timeout)
-        else:
-            self._cancel_timeout(None)
         self._timeout = timeout or 0
         self._add_timeout(None)
 
@@ -101,12 +214,16 @@ class Timeout(object):
 
     def _add_timeout(self, _, exc=None, **kw):
         if not self.closed:
-            self._cancel_timeout(_, exc=exc)
             if self._timeout and not exc:
-                self._timeout_handler = self._loop.call_later(self._timeout,
-                                                              self._timed_out)
+                TimerWheel.get(self._loop).add(self, self._timeout)
+            else:
+                self._timeout_deadline = None
 
     def _cancel_timeout(self, _, exc=None, **kw):
-        if self._timeout_handler:
-            self._timeout_handler.cancel()
-            self._timeout_handler = None
+        self._timeout_deadline = None
+
+    def _remove_timeout(self, _, exc=None, **kw):
+        if self._timeout_bucket is not None:
+            TimerWheel.get(self._loop).remove(self)
+        else:
+            self._timeout_deadline = None
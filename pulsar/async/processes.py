@@ -0,0 +1,140 @@
+from functools import wraps
+from importlib import import_module
+from multiprocessing.util import register_after_fork
+from concurrent.futures import ProcessPoolExecutor
+
+import asyncio
+
+from pulsar.utils import system
+
+from .access import get_actor
+
+try:
+    import signal
+except ImportError:     # pragma    nocover
+    signal = None
+
+
+__all__ = ['ProcessPool', 'run_in_process']
+
+
+class ProcessPool(object):
+    '''A pool of processes for CPU bound work.
+
+    The underlying :class:`~concurrent.futures.ProcessPoolExecutor` is created
+    on first use and replaced, together with its child processes, once
+    ``max_tasks`` tasks have been submitted to it. Tasks already submitted
+    to a replaced executor complete before its children exit.
+
+    Children forked from an actor which installed signal handlers start
+    with the default signal handling, so that a signal sent to a child
+    neither is ignored nor wakes up the event loop of the actor.
+
+    :param max_workers: number of child processes, if not provided
+        the number of CPUs.
+    :param max_tasks: number of tasks after which the children are recycled.
+        If zero children are never recycled.
+    '''
+    def __init__(self, max_workers=None, max_tasks=0):
+        self.max_workers = max_workers
+        self.max_tasks = max_tasks
+        self.tasks = 0
+        self.pending = 0
+        self.recycled = 0
+        self._executor = None
+        self._submitted = 0
+        register_after_fork(self, _default_signals)
+
+    def submit(self, loop, func, *args, **kwargs):
+        '''Run ``func`` with ``args`` and ``kwargs`` in a child process.
+
+        :return: a :class:`~asyncio.Future` bound to ``loop``.
+        '''
+        executor = self._get_executor()
+        future = executor.submit(func, *args, **kwargs)
+        self.tasks += 1
+        self._submitted += 1
+        self.pending += 1
+        future = asyncio.wrap_future(future, loop=loop)
+        future.add_done_callback(self._task_done)
+        return future
+
+    def info(self):
+        return {'process_workers': self.max_workers,
+                'max_tasks': self.max_tasks,
+                'tasks': self.tasks,
+                'pending': self.pending,
+                'recycled': self.recycled}
+
+    def close(self):
+        '''Shutdown the executor without waiting for pending tasks.'''
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self):
+        if (self._executor is not None and self.max_tasks and
+                self._submitted >= self.max_tasks):
+            self.close()
+            self.recycled += 1
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers)
+            self._submitted = 0
+        return self._executor
+
+    def _task_done(self, future):
+        # Called in the event loop thread, never by the executor thread
+        self.pending -= 1
+
+
+def _default_signals(pool):
+    # Called in a child process after the fork. The child inherits the
+    # wakeup fd of the parent event loop and its python signal handlers
+    if signal:
+        try:
+            signal.set_wakeup_fd(-1)
+        except ValueError:
+            pass
+        signals = list(system.EXIT_SIGNALS)
+        signals.extend(getattr(signal, name) for name in ('SIGHUP', 'SIGCHLD')
+                       if hasattr(signal, name))
+        for sig in signals:
+            signal.signal(sig, signal.SIG_DFL)
+
+
+class ProcessCallable(object):
+    '''Pickle a function decorated with :func:`run_in_process` by reference
+    and call the undecorated function in the child process.'''
+    def __init__(self, func):
+        self.module = func.__module__
+        self.name = func.__qualname__
+
+    def __call__(self, *args, **kwargs):
+        target = import_module(self.module)
+        for name in self.name.split('.'):
+            target = getattr(target, name)
+        return target.__wrapped__(*args, **kwargs)
+
+
+def run_in_process(callable):
+    '''Decorator which runs ``callable`` in the arbiter
+    :class:`ProcessPool` via the :meth:`.Actor.run_in_process` method.
+
+    The decorated function must be defined at module level and returns a
+    :class:`~asyncio.Future`. Useful for CPU bound work in wsgi handlers::
+
+        @run_in_process
+        def resize(data, size):
+            ...
+
+        def thumbnail(request):
+            data = yield from resize(request.body, (120, 120))
+            ...
+    '''
+    target = ProcessCallable(callable)
+
+    @wraps(callable)
+    def _(*args, **kwargs):
+        return get_actor().run_in_process(target, *args, **kwargs)
+
+    return _
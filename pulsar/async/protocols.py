@@ -1,4 +1,5 @@
 import sys
+from itertools import islice
 
 import pulsar
 from pulsar.utils.internet import nice_address, format_address
@@ -18,6 +19,44 @@ __all__ = ['ProtocolConsumer',
            'DatagramServer']
 
 
+def writev(transport, chunks):
+    '''Write a list of bytes ``chunks`` into ``transport``.
+
+    Several chunks are passed to ``transport.writelines`` in one call,
+    leaving the transport to send them and to handle socket errors.
+    '''
+    if len(chunks) == 1:
+        transport.write(chunks[0])
+    else:
+        transport.writelines(chunks)
+
+
+def object_memory(obj):
+    '''Approximate memory, in bytes, used by an :class:`.EventHandler`
+    ``obj``, its attributes dictionary and its events.
+
+    Objects referenced by ``obj`` are not included.
+    '''
+    size = sys.getsizeof(obj) + _dict_memory(obj)
+    events = getattr(obj, '_events', None)
+    if events:
+        size += sys.getsizeof(events)
+        for event in events.values():
+            size += sys.getsizeof(event) + _dict_memory(event)
+            if event._handlers:
+                size += sys.getsizeof(event._handlers)
+    return size
+
+
+def _dict_memory(obj):
+    # The attributes dictionary of a subclass of a C type, such as the
+    # OneTime event subclassing the C Future, may not be readable
+    try:
+        return sys.getsizeof(obj.__dict__)
+    except (AttributeError, TypeError):
+        return 0
+
+
 class ProtocolConsumer(EventHandler):
     '''The consumer of data for a server or client :class:`.Connection`.
 
@@ -57,6 +96,10 @@ class ProtocolConsumer(EventHandler):
     '''
     _connection = None
     _data_received_count = 0
+    reusable = False
+    '''When ``True`` the :class:`Connection` reuses this consumer, via the
+    :meth:`reset` method, for the next request once the current one is
+    finished, rather than building a new consumer.'''
     ONE_TIME_EVENTS = ('pre_request', 'post_request')
     MANY_TIMES_EVENTS = ('data_received', 'data_processed')
 
@@ -177,6 +220,18 @@ class ProtocolConsumer(EventHandler):
         if not self.event('post_request').fired():
             return self.fire_event('post_request', *arg, **kw)
 
+    def reset(self):
+        '''Reset this consumer so that it can handle a new request.
+
+        Invoked for :attr:`reusable` consumers only, before handling a new
+        request on the same :attr:`connection`. Subclasses storing
+        request specific data should override this method and
+        reset their state too.
+        '''
+        self._events = {}
+        self._data_received_count = 0
+        self.__dict__.pop('_request', None)
+
     def write(self, data):
         '''Delegate writing to the underlying :class:`.Connection`
 
@@ -204,6 +259,8 @@ class ProtocolConsumer(EventHandler):
         c = self._connection
         if c and c._current_consumer is self:
             c._current_consumer = None
+            if self.reusable and not exc:
+                c._idle_consumer = self
 
 
 class PulsarProtocol(EventHandler, FlowControl):
@@ -301,12 +358,14 @@ class PulsarProtocol(EventHandler, FlowControl):
             self._type = 'client'
             addr = self._transport.get_extra_info('sockname')
         self._address = addr
+        self._set_flow_limits(self)
         # let everyone know we have a connection with endpoint
         self.fire_event('connection_made')
 
     def connection_lost(self, exc=None):
         '''Fires the ``connection_lost`` event.
         '''
+        self._wakeup_waiter(self)
         self.fire_event('connection_lost')
 
     def eof_received(self):
@@ -321,8 +380,54 @@ class PulsarProtocol(EventHandler, FlowControl):
 
 class Protocol(PulsarProtocol, asyncio.Protocol):
     '''An :class:`asyncio.Protocol` with :ref:`events <event-handling>`
+
+    :param autocork: when ``True`` data written during an event loop
+        iteration is accumulated and written at the next iteration,
+        see :meth:`cork`.
     '''
     _data_received_count = 0
+    _autocork = False
+    _cork = None
+
+    def __init__(self, *args, autocork=False, **kw):
+        super(Protocol, self).__init__(*args, **kw)
+        self._autocork = autocork
+
+    @property
+    def corked(self):
+        '''``True`` when written data is being accumulated, see
+        :meth:`cork`.'''
+        return self._cork is not None
+
+    def cork(self):
+        '''Start accumulating data passed to the ``write`` method.
+
+        The data is written into the :attr:`transport`, with a single
+        ``writelines`` call, once :meth:`uncork` is called.
+        '''
+        if self._cork is None:
+            self._cork = []
+
+    def uncork(self):
+        '''Write data accumulated since the last :meth:`cork` call and
+        stop accumulating.'''
+        chunks, self._cork = self._cork, None
+        if chunks:
+            t = self._transport
+            if t and not t._closing:
+                self._write_chunks(t, chunks)
+
+    def close(self):
+        '''Write data accumulated by :meth:`cork` and close the
+        :attr:`transport`.'''
+        self.uncork()
+        super(Protocol, self).close()
+
+    def abort(self):
+        '''Discard data accumulated by :meth:`cork` and abort the
+        :attr:`transport`.'''
+        self._cork = None
+        super(Protocol, self).abort()
 
     def write(self, data):
         '''Write ``data`` into the wire.
@@ -334,22 +439,33 @@ class Protocol(PulsarProtocol, asyncio.Protocol):
         if t:
             if t._closing:  # Uses private variable.
                 raise ConnectionResetError('Connection lost')
-            if self._paused:
-                # # Uses private variable once again!
-                # This occurs when the protocol is paused from writing
-                # but another data ready callback is fired in the same
-                # event-loop frame
-                self.logger.debug('protocol cannot write, add data to the '
-                                  'transport buffer')
-                t._buffer.extend(data)
+            if self._cork is not None:
+                self._cork.append(data)
+            elif self._autocork:
+                self._cork = [data]
+                self._loop.call_soon(self.uncork)
             else:
-                self.fire_event('before_write')
-                t.write(data)
-                self.fire_event('after_write')
+                self._write_chunks(t, (data,))
             return self._write_waiter or ()
         else:
             raise ConnectionResetError('No Transport')
 
+    def _write_chunks(self, t, chunks):
+        if self._paused:
+            # # Uses private variable once again!
+            # This occurs when the protocol is paused from writing
+            # but another data ready callback is fired in the same
+            # event-loop frame
+            self.logger.debug('protocol cannot write, add data to the '
+                              'transport buffer')
+            for data in chunks:
+                t._buffer.extend(data)
+        else:
+            self.fire_event('before_write')
+            writev(t, chunks)
+            self._make_write_waiter(self)
+            self.fire_event('after_write')
+
 
 class DatagramProtocol(PulsarProtocol, asyncio.DatagramProtocol):
     '''An ``asyncio.DatagramProtocol`` with events`'''
@@ -371,10 +487,11 @@ class Connection(Protocol, Timeout):
 
         number of separate requests processed.
     '''
+    _idle_consumer = None
+
     def __init__(self, consumer_factory=None, timeout=None,
                  low_limit=None, high_limit=None, **kw):
         super(Connection, self).__init__(**kw)
-        self.bind_event('connection_lost', self._connection_lost)
         self._processed = 0
         self._current_consumer = None
         self._consumer_factory = consumer_factory
@@ -404,6 +521,7 @@ class Connection(Protocol, Timeout):
         :attr:`~Protocol.timeout` is a positive number (of seconds).
         '''
         self._data_received_count = self._data_received_count + 1
+        self._cancel_timeout(None)
         self.fire_event('data_received', data=data)
         while data:
             consumer = self.current_consumer()
@@ -412,6 +530,28 @@ class Connection(Protocol, Timeout):
                 break
         self.fire_event('data_received', data=data)
 
+    def connection_made(self, transport):
+        '''Override :meth:`PulsarProtocol.connection_made` to add the
+        :attr:`~.Timeout.timeout` for idle connections.
+        '''
+        super(Connection, self).connection_made(transport)
+        self._add_timeout(None)
+
+    def connection_lost(self, exc=None):
+        '''Override :meth:`PulsarProtocol.connection_lost` to invoke
+        the :meth:`_connection_lost` method.
+        '''
+        self._connection_lost(self)
+        super(Connection, self).connection_lost(exc)
+
+    def write(self, data):
+        '''Override :meth:`Protocol.write` to reset the
+        :attr:`~.Timeout.timeout` for idle connections.
+        '''
+        result = super(Connection, self).write(data)
+        self._add_timeout(None)
+        return result
+
     def upgrade(self, consumer_factory):
         '''Upgrade the :func:`_consumer_factory` callable.
 
@@ -430,9 +570,19 @@ class Connection(Protocol, Timeout):
         self._consumer_factory = consumer_factory
         consumer = self._current_consumer
         if consumer:
-            consumer.bind_event('post_request', self._build_consumer)
+            consumer.bind_event('post_request', self._upgraded)
         else:
-            self._build_consumer(None)
+            self._upgraded(None)
+
+    def release_consumer(self, consumer):
+        '''Stop routing incoming data to ``consumer``.
+
+        Data received afterwards is handled by a new consumer while
+        ``consumer`` carries on with its request. Used by protocols which
+        process pipelined requests concurrently.
+        '''
+        if self._current_consumer is consumer:
+            self._current_consumer = None
 
     def info(self):
         info = super(Connection, self).info()
@@ -442,23 +592,41 @@ class Connection(Protocol, Timeout):
         c['timeout'] = self.timeout
         return info
 
+    def memory(self):
+        '''Approximate memory in bytes used by this connection and
+        its consumers, see :func:`object_memory`.'''
+        size = object_memory(self)
+        for consumer in (self._current_consumer, self._idle_consumer):
+            if consumer is not None:
+                size += object_memory(consumer)
+        return size
+
     def _build_consumer(self, _, exc=None):
         if not exc:
-            consumer = self._producer.build_consumer(self._consumer_factory)
+            consumer = self._producer.build_consumer(self._consumer_factory,
+                                                     self._idle_consumer)
+            self._idle_consumer = None
             assert self._current_consumer is None, 'Consumer is not None'
             self._current_consumer = consumer
             consumer._connection = self
             consumer.connection_made(self)
 
+    def _upgraded(self, _, exc=None):
+        # consumers built by the previous factory cannot be reused
+        self._idle_consumer = None
+        self._build_consumer(_, exc=exc)
+
     def _connection_lost(self, _, exc=None):
         '''It performs these actions in the following order:
 
-        * Fires the ``connection_lost`` :ref:`one time event <one-time-event>`
-          if not fired before, with ``exc`` as event data.
         * Cancel the idle timeout if set.
         * Invokes the :meth:`ProtocolConsumer.connection_lost` method in the
           :meth:`current_consumer`.
+        * Fires the ``connection_lost`` :ref:`one time event <one-time-event>`
+          if not fired before.
           '''
+        self._remove_timeout(None)
+        self._idle_consumer = None
         if self._current_consumer:
             self._current_consumer.connection_lost(exc)
 
@@ -509,15 +677,21 @@ class Producer(EventHandler):
         kw['loop'] = self._loop
         return self.protocol_factory(**kw)
 
-    def build_consumer(self, consumer_factory):
+    def build_consumer(self, consumer_factory, consumer=None):
         '''Build a consumer for a protocol.
 
         This method can be used by protocols which handle several requests,
         for example the :class:`Connection` class.
 
         :param consumer_factory: consumer factory to use.
+        :param consumer: optional :attr:`~.ProtocolConsumer.reusable`
+            consumer which finished its previous request. When provided it
+            is reset and returned rather than building a new one.
         '''
-        consumer = consumer_factory(loop=self._loop)
+        if consumer is None:
+            consumer = consumer_factory(loop=self._loop)
+        else:
+            consumer.reset()
         consumer.copy_many_times_events(self)
         return consumer
 
@@ -539,12 +713,13 @@ class TcpServer(Producer):
 
     def __init__(self, protocol_factory, loop, address=None,
                  name=None, sockets=None, max_requests=None,
-                 keep_alive=None, logger=None):
+                 keep_alive=None, logger=None, autocork=False):
         super(TcpServer, self).__init__(loop, protocol_factory, name=name,
                                         max_requests=max_requests,
                                         logger=logger)
         self._params = {'address': address, 'sockets': sockets}
         self._keep_alive = max(keep_alive or 0, 0)
+        self._autocork = autocork
         self._concurrent_connections = set()
 
     def __repr__(self):
@@ -596,6 +771,10 @@ class TcpServer(Producer):
                                                           port=address[1],
                                                           backlog=backlog,
                                                           ssl=sslcontext)
+                    elif isinstance(address, (str, bytes)):
+                        server = yield from self._loop.create_unix_server(
+                            self.create_protocol, path=address,
+                            backlog=backlog, ssl=sslcontext)
                     else:
                         raise NotImplementedError
                 self._server = server
@@ -637,10 +816,12 @@ class TcpServer(Producer):
                   'uptime_in_seconds': up,
                   'sockets': sockets,
                   'max_requests': self._max_requests,
-                  'keep_alive': self._keep_alive}
+                  'keep_alive': self._keep_alive,
+                  'autocork': self._autocork}
         clients = {'processed_clients': self._sessions,
                    'connected_clients': len(self._concurrent_connections),
-                   'requests_processed': self._requests_processed}
+                   'requests_processed': self._requests_processed,
+                   'connection_memory': self._connection_memory()}
         if self._server:
             for sock in self._server.sockets:
                 sockets.append({
@@ -651,8 +832,10 @@ class TcpServer(Producer):
     def create_protocol(self):
         '''Override :meth:`Producer.create_protocol`.
         '''
-        protocol = super(TcpServer, self).create_protocol(
-            timeout=self._keep_alive)
+        kw = {'timeout': self._keep_alive}
+        if self._autocork:
+            kw['autocork'] = True
+        protocol = super(TcpServer, self).create_protocol(**kw)
         protocol.bind_event('connection_made', self._connection_made)
         protocol.bind_event('connection_lost', self._connection_lost)
         if (self._server and self._max_requests and
@@ -670,6 +853,14 @@ class TcpServer(Producer):
     def _connection_lost(self, connection, exc=None):
         self._concurrent_connections.discard(connection)
 
+    def _connection_memory(self, sample=10):
+        # Average memory in bytes of a sample of connections
+        connections = [c for c in islice(self._concurrent_connections, sample)
+                       if hasattr(c, 'memory')]
+        if connections:
+            return sum((c.memory() for c in connections)) // len(connections)
+        return 0
+
     def _close_connections(self, connection=None):
         '''Close ``connection`` if specified, otherwise close all connections.
 
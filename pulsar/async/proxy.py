@@ -42,9 +42,13 @@ class command:
 
     :parameter ack: ``True`` if the command acknowledge the sender with a
         response. Usually is set to ``True`` (which is also the default value).
+    :parameter control: ``True`` if the command is a control message.
+        Control messages, and their responses, are written to the mailbox
+        connection ahead of queued data messages.
     '''
-    def __init__(self, ack=True):
+    def __init__(self, ack=True, control=False):
         self.ack = ack
+        self.control = control
 
     def __call__(self, f):
         self.name = f.__name__.lower()
@@ -53,6 +57,7 @@ class command:
             return f(request, *args, **kwargs)
 
         command_function.ack = self.ack
+        command_function.control = self.control
         command_function.__name__ = self.name
         command_function.__doc__ = f.__doc__
         global_commands_table[self.name] = command_function
@@ -97,12 +102,19 @@ class ActorProxy(object):
 
         the socket address of the underlying :attr:`.Actor.mailbox`.
 
+    .. attribute:: peer_address
+
+        the socket address where the remote :class:`.Actor` accepts direct
+        connections from other actors. Available only when the
+        :ref:`mailbox_peers <setting-mailbox_peers>` setting is on.
+
     '''
     def __init__(self, impl):
         self.aid = impl.aid
         self.name = impl.name
         self.cfg = impl.cfg
         self.address = getattr(impl, 'address', None)
+        self.peer_address = getattr(impl, 'peer_address', None)
 
     def __repr__(self):
         return '%s(%s)' % (self.name, self.aid)
@@ -148,8 +160,19 @@ class ActorProxyMonitor(ActorProxy):
         has completed. The :attr:`mailbox` is a server-side
         :class:`.MailboxProtocol` instance and it is used
         by the :func:`.send` function to send messages to the remote actor.
+
+    .. attribute:: spawn_time
+
+        Seconds between the start of the remote actor and its first
+        notification, ``None`` until the first notification is received.
+
+    .. attribute:: peers
+
+        Dictionary of peer addresses of other actors last sent to the
+        remote actor in the ``notify`` response.
     '''
     monitor = None
+    peers = None
 
     def __init__(self, impl):
         self.impl = impl
@@ -158,6 +181,7 @@ class ActorProxyMonitor(ActorProxy):
         self.callback = None
         self.spawning_start = None
         self.stopping_start = None
+        self.spawn_time = None
         super(ActorProxyMonitor, self).__init__(impl)
 
     @property
@@ -1030,6 +1030,89 @@ class PyCares(Global):
     Use this flag to revert to the standard library dns resolver.
     '''
 
+
+class MailboxBatch(Global):
+    name = 'mailbox_batch'
+    flags = ['--mailbox-batch']
+    validator = validate_bool
+    action = "store_true"
+    default = False
+    desc = '''\
+    Coalesce actor messages into batches.
+
+    When set, messages sent by an actor mailbox during the same event loop
+    iteration are packed into one frame and written to the socket once.
+    It reduces the number of system calls when actors exchange many
+    messages.
+    '''
+
+
+class MailboxQueue(Global):
+    name = 'mailbox_queue'
+    flags = ['--mailbox-queue']
+    validator = validate_pos_int
+    type = int
+    default = 1000
+    desc = '''\
+    Maximum number of data messages queued by a mailbox connection.
+
+    Data messages are queued when the connection cannot keep up with the
+    messages sent. Once the queue is full, senders of data messages wait
+    for the queue to drain. Control messages, such as ``notify`` and
+    ``stop``, are never queued behind data messages.
+    If 0 the queue is unbounded.
+    '''
+
+
+class MailboxPeers(Global):
+    name = 'mailbox_peers'
+    flags = ['--mailbox-peers']
+    validator = validate_bool
+    action = "store_true"
+    default = False
+    desc = '''\
+    Allow actors to send messages directly to each other.
+
+    When set, each actor listens for connections from other actors and
+    advertises its address to its monitor. Messages to actors with a known
+    address are sent via a direct connection rather than being routed by
+    the arbiter, which remains the fallback.
+    '''
+
+
+class MailboxSerializer(Global):
+    name = 'mailbox_serializer'
+    flags = ['--mailbox-serializer']
+    meta = "STRING"
+    validator = validate_string
+    default = 'pickle'
+    desc = '''\
+    The codec used to encode and decode actor messages.
+
+    Available codecs are ``pickle``, which uses the highest pickle protocol,
+    and ``compact``, a fixed layout tuple encoding for the most common
+    commands. Custom codecs can be added via the
+    :func:`~pulsar.async.mailbox.register_serializer` function or specified
+    as a python dotted path.
+    '''
+
+
+class MailboxUnixSocket(Global):
+    name = 'mailbox_unix_socket'
+    flags = ['--mailbox-unix-socket']
+    validator = validate_bool
+    action = "store_true"
+    default = False
+    desc = '''\
+    The arbiter mailbox listens on a unix domain socket.
+
+    On linux the socket is created in the abstract namespace, on other
+    posix systems it is a file in the temporary directory. It avoids the
+    loopback TCP stack for messages between actors on the same host and
+    does not use an ephemeral port. Ignored if unix sockets are not
+    available, in which case the mailbox listens on a loopback TCP socket.
+    '''
+
 ############################################################################
 #    Worker Processes
 section_docs['Worker Processes'] = '''
@@ -1058,6 +1141,134 @@ class Workers(Setting):
         """
 
 
+class WorkersMin(Setting):
+    name = "workers_min"
+    section = "Worker Processes"
+    flags = ["--workers-min"]
+    validator = validate_pos_int
+    type = int
+    default = 1
+    desc = """\
+        The minimum number of workers when autoscaling.
+
+        Only used when :ref:`workers_max <setting-workers_max>` is positive.
+        """
+
+
+class WorkersMax(Setting):
+    name = "workers_max"
+    section = "Worker Processes"
+    flags = ["--workers-max"]
+    validator = validate_pos_int
+    type = int
+    default = 0
+    desc = """\
+        The maximum number of workers when autoscaling.
+
+        When positive, the monitor adjusts the number of
+        :ref:`workers <setting-workers>` between
+        :ref:`workers_min <setting-workers_min>` and this value according
+        to the load reported by the workers in their ``notify`` messages.
+        A worker is fully loaded when it reaches any of the
+        :ref:`autoscale_connections <setting-autoscale_connections>`,
+        :ref:`autoscale_lag <setting-autoscale_lag>` or
+        :ref:`autoscale_requests <setting-autoscale_requests>` targets.
+        Workers are added when the mean load exceeds one and gracefully
+        retired, one at the time, when the remaining workers would still
+        be comfortably below their targets.
+
+        If set to zero (the default) autoscaling is disabled.
+        """
+
+
+class AutoscaleConnections(Setting):
+    name = "autoscale_connections"
+    section = "Worker Processes"
+    flags = ["--autoscale-connections"]
+    validator = validate_pos_int
+    type = int
+    default = 100
+    desc = """\
+        Target number of concurrent connections per worker when autoscaling.
+
+        Set to zero to ignore connections.
+        """
+
+
+class AutoscaleLag(Setting):
+    name = "autoscale_lag"
+    section = "Worker Processes"
+    flags = ["--autoscale-lag"]
+    validator = validate_pos_float
+    type = float
+    default = 0.1
+    desc = """\
+        Target event loop lag, in seconds, per worker when autoscaling.
+
+        The lag is only available when the
+        :ref:`lag_interval <setting-lag_interval>` setting is positive.
+        Set to zero to ignore the event loop lag.
+        """
+
+
+class AutoscaleRequests(Setting):
+    name = "autoscale_requests"
+    section = "Worker Processes"
+    flags = ["--autoscale-requests"]
+    validator = validate_pos_float
+    type = float
+    default = 0
+    desc = """\
+        Target number of requests per second per worker when autoscaling.
+
+        If set to zero (the default) the request rate is ignored.
+        """
+
+
+class AutoscaleCooldown(Setting):
+    name = "autoscale_cooldown"
+    section = "Worker Processes"
+    flags = ["--autoscale-cooldown"]
+    validator = validate_pos_float
+    type = float
+    default = 30
+    desc = """\
+        Seconds to wait after scaling up or down before scaling again.
+        """
+
+
+class LagInterval(Setting):
+    name = "lag_interval"
+    section = "Worker Processes"
+    flags = ["--lag-interval"]
+    validator = validate_pos_float
+    type = float
+    default = 0
+    desc = """\
+        Interval in seconds for sampling the event loop lag of actors.
+
+        Lag percentiles and the callbacks which blocked the loop for more
+        than :ref:`slow_callback <setting-slow_callback>` seconds are
+        available in the ``events`` entry of the actor info.
+        The sampler is disabled by default since, when enabled, it runs a
+        daemon watcher thread and a repeating loop timer in every actor.
+        """
+
+
+class SlowCallback(Setting):
+    name = "slow_callback"
+    section = "Worker Processes"
+    flags = ["--slow-callback"]
+    validator = validate_pos_float
+    type = float
+    default = 0.1
+    desc = """\
+        Callbacks blocking the event loop for longer than this many seconds
+        are recorded, together with their source location, by the
+        event loop lag sampler.
+        """
+
+
 class Concurrency(Setting):
     name = "concurrency"
     section = "Worker Processes"
@@ -1067,6 +1278,46 @@ class Concurrency(Setting):
     desc = """The type of concurrency to use."""
 
 
+class PreloadApp(Setting):
+    name = "preload_app"
+    section = "Worker Processes"
+    flags = ["--preload-app"]
+    validator = validate_bool
+    action = "store_true"
+    default = False
+    desc = """\
+        Load the application callable before spawning workers.
+
+        The :meth:`.Application.preload` hook builds the application in the
+        arbiter and process workers inherit it when forked, sharing its
+        read-only memory copy-on-write and skipping the loading step.
+        Requires the ``fork`` start method, it is the default on posix.
+        Ignored when the concurrency is not ``process``.
+        """
+
+
+class ForkServer(Setting):
+    name = "fork_server"
+    section = "Worker Processes"
+    flags = ["--fork-server"]
+    validator = validate_bool
+    action = "store_true"
+    default = False
+    desc = """\
+        Fork process workers from a fork server.
+
+        The fork server is a template process, started with the first
+        worker, which has pulsar, the ``__main__`` module and the application
+        module already imported. New workers are forked from it rather
+        than from the arbiter, so that they do not inherit the memory,
+        threads and file descriptors of the arbiter. The time between
+        spawning a worker and its first notification is available as
+        ``spawn_time`` in the monitor :ref:`info <actor_info_command>`.
+        Posix only. When on, the :ref:`preload_app <setting-preload_app>`
+        setting is ignored.
+        """
+
+
 class MaxRequests(Setting):
     name = "max_requests"
     section = "Worker Processes"
@@ -1086,6 +1337,45 @@ class MaxRequests(Setting):
         """
 
 
+class MaxWorkerMemory(Setting):
+    name = "max_worker_memory"
+    section = "Worker Processes"
+    flags = ["--max-worker-memory"]
+    validator = validate_pos_int
+    type = int
+    default = 0
+    desc = """\
+        The maximum resident memory, in megabytes, of a worker before
+        restarting.
+
+        Workers check their memory in the
+        :ref:`periodic task <actor-periodic-task>` and, once the limit is
+        exceeded, ask their monitor to be gracefully stopped and replaced.
+        The monitor recycles one worker at the time.
+
+        If this is set to zero (the default) memory based restarts are
+        disabled.
+        """
+
+
+class MaxWorkerAge(Setting):
+    name = "max_worker_age"
+    section = "Worker Processes"
+    flags = ["--max-worker-age"]
+    validator = validate_pos_int
+    type = int
+    default = 0
+    desc = """\
+        The maximum number of seconds a worker lives before restarting.
+
+        A random jitter is applied to each worker so that workers started
+        together are not recycled together.
+
+        If this is set to zero (the default) age based restarts are
+        disabled.
+        """
+
+
 class Timeout(Setting):
     name = "timeout"
     section = "Worker Processes"
@@ -1115,6 +1405,41 @@ class ThreadWorkers(Setting):
         """
 
 
+class ProcessWorkers(Setting):
+    name = "process_workers"
+    section = "Worker Processes"
+    flags = ["--process-workers"]
+    validator = validate_pos_int
+    type = int
+    default = 0
+    desc = """\
+        Number of processes in the arbiter process pool.
+
+        The process pool is shared by all actors and it is used to offload
+        CPU bound work via the :meth:`.Actor.run_in_process` method.
+        The pool is created the first time it is used.
+        If 0, the number of CPUs in the system.
+        """
+
+
+class ProcessMaxTasks(Setting):
+    name = "process_max_tasks"
+    section = "Worker Processes"
+    flags = ["--process-max-tasks"]
+    validator = validate_pos_int
+    type = int
+    default = 1000
+    desc = """\
+        Number of tasks after which the process pool is recycled.
+
+        Once the process pool has run this number of tasks, its processes
+        finish the tasks already submitted and exit, while new tasks are
+        executed by a fresh set of processes. Useful to limit the damage
+        of memory leaks in CPU bound libraries.
+        If 0, processes are never recycled.
+        """
+
+
 ############################################################################
 #    APPLICATION HOOKS
 section_docs['Application Hooks'] = '''
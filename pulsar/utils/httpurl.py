@@ -51,7 +51,7 @@ from uuid import uuid4
 from email.utils import formatdate
 from io import BytesIO
 import zlib
-from collections import deque, OrderedDict
+from collections import OrderedDict
 from urllib import request as urllibr
 from http import client as httpclient
 from urllib.parse import (quote, unquote, urlencode, urlparse, urlsplit,
@@ -351,17 +351,39 @@ def header_field(name, HEADERS_SET=None, strict=False):
 
     If ``header_set`` is given, only return headers included in the set.
     '''
-    name = name.lower()
-    if name.startswith('x-'):
-        return capheader(name)
-    else:
-        header = ALL_HEADER_FIELDS_DICT.get(name)
-        if header and HEADERS_SET:
+    try:
+        header, standard = _header_fields[name]
+    except KeyError:
+        header, standard = _intern_header_field(name)
+    if standard:
+        if HEADERS_SET:
             return header if header in HEADERS_SET else None
-        elif header:
-            return header
-        elif not strict:
-            return capheader(name)
+        return header
+    elif standard is None or not strict:
+        return header
+
+
+def _intern_header_field(name):
+    # Canonical name of header ``name`` and whether it is a standard
+    # header (True), an extension header (None) or unknown (False).
+    # Results are cached, up to MAX_HEADER_FIELDS_CACHE names, so that
+    # repeated lookups return the same interned string
+    lname = name.lower()
+    if lname.startswith('x-'):
+        field = (sys.intern(capheader(lname)), None)
+    else:
+        header = ALL_HEADER_FIELDS_DICT.get(lname)
+        if header:
+            field = (header, True)
+        else:
+            field = (sys.intern(capheader(lname)), False)
+    if len(_header_fields) < MAX_HEADER_FIELDS_CACHE:
+        _header_fields[name] = field
+    return field
+
+
+MAX_HEADER_FIELDS_CACHE = 1000
+_header_fields = {}
 
 
 #    HEADERS UTILITIES
@@ -675,10 +697,17 @@ class Headers(object):
             else:
                 return self._headers.pop(key, None)
 
-    def flat(self, version, status):
-        '''Full headers bytes representation'''
+    def flat(self, version, status, extra=None):
+        '''Full headers bytes representation.
+
+        :param extra: optional bytes of already serialized header lines,
+            each terminated by ``\\r\\n``, added after the status line.
+        '''
         vs = version + (status, self)
-        return ('HTTP/%s.%s %s\r\n%s' % vs).encode(DEFAULT_CHARSET)
+        if not extra:
+            return ('HTTP/%s.%s %s\r\n%s' % vs).encode(DEFAULT_CHARSET)
+        line = ('HTTP/%s.%s %s\r\n' % vs[:3]).encode(DEFAULT_CHARSET)
+        return b''.join((line, extra, bytes(self)))
 
     def __iter__(self):
         dj = ', '
@@ -742,9 +771,27 @@ class InvalidChunkSize(Exception):
     """ error raised when we parse an invalid chunk size """
 
 
+def _parse_header_name(raw):
+    name = raw.rstrip(" \t")
+    if HEADER_RE.search(name):
+        raise InvalidHeader("invalid header name %s" % name.upper())
+    name = header_field(name.strip())
+    if len(_parsed_header_names) < MAX_HEADER_FIELDS_CACHE:
+        _parsed_header_names[sys.intern(raw)] = name
+    return name
+
+
+_parsed_header_names = {}
+
+
 class HttpParser(object):
     '''A python HTTP parser.
 
+    Incoming data is appended to a single ``bytearray`` buffer which is
+    consumed via a read offset, so that each byte is examined a bounded
+    number of times regardless of how the message is split across calls
+    to :meth:`execute`.
+
     Original code from https://github.com/benoitc/http-parser
 
     2011 (c) Benoit Chesneau <benoitc@e-engura.org>
@@ -755,7 +802,9 @@ class HttpParser(object):
         self.errno = None
         self.errstr = ""
         # protected variables
-        self._buf = []
+        self._buf = bytearray()
+        self._pos = 0
+        self._scan = 0
         self._version = None
         self._method = method
         self._status_code = None
@@ -768,6 +817,7 @@ class HttpParser(object):
         self._fragment = None
         self._headers = OrderedDict()
         self._chunked = False
+        self._chunk_rest = None
         self._body = []
         self._trailers = None
         self._partial_body = False
@@ -838,80 +888,95 @@ class HttpParser(object):
         return self._chunked
 
     def execute(self, data, length):
+        """Parse ``data`` and return the number of bytes consumed.
+
+        Bytes following a complete message are not consumed, they belong
+        to the next message.
+        """
         # end of body can be passed manually by putting a length of 0
         if length == 0:
             self.__on_message_complete = True
             return length
-        #
-        data = bytes(data)
-        # start to parse
-        nb_parsed = 0
-        while True:
+        elif self.__on_message_complete:
+            return 0
+        buf = self._buf
+        buf += data
+        try:
+            self._parse()
+        except InvalidRequestLine as e:
+            self.errno = BAD_FIRST_LINE
+            self.errstr = str(e)
+            return 0
+        except InvalidHeader as e:
+            self.errno = INVALID_HEADER
+            self.errstr = str(e)
+            return 0
+        except InvalidChunkSize as e:
+            self.errno = INVALID_CHUNK
+            self.errstr = "invalid chunk size [%s]" % str(e)
+            return 0
+        if self.__on_message_complete:
+            rest = len(buf) - self._pos
+            self._buf = bytearray()
+            self._pos = self._scan = 0
+            return length - rest
+        # Drop consumed bytes, deleting from the front of a
+        # bytearray does not move the remaining bytes
+        pos = self._pos
+        if pos:
+            del buf[:pos]
+            self._pos = 0
+            self._scan = max(self._scan - pos, 0)
+        return length
+
+    def _parse(self):
+        buf = self._buf
+        while not self.__on_message_complete:
+            pos = self._pos
             if not self.__on_firstline:
-                idx = data.find(b'\r\n')
+                idx = buf.find(b'\r\n', self._scan)
                 if idx < 0:
-                    self._buf.append(data)
-                    return len(data)
-                else:
-                    self.__on_firstline = True
-                    self._buf.append(data[:idx])
-                    first_line = to_string(b''.join(self._buf),
-                                           DEFAULT_CHARSET)
-                    rest = data[idx+2:]
-                    data = b''
-                    if self._parse_firstline(first_line):
-                        nb_parsed = nb_parsed + idx + 2
-                        self._buf = [rest]
-                    else:
-                        return nb_parsed
+                    self._scan = max(len(buf) - 1, pos)
+                    return
+                line = buf[pos:idx].decode(DEFAULT_CHARSET)
+                self._pos = self._scan = idx + 2
+                self.__on_firstline = True
+                self._parse_firstline(line)
             elif not self.__on_headers_complete:
-                if data:
-                    self._buf.append(data)
-                    data = b''
-                try:
-                    to_parse = b''.join(self._buf)
-                    ret = self._parse_headers(to_parse)
-                    if ret is False:
-                        return length
-                    nb_parsed = nb_parsed + (len(to_parse) - ret)
-                except InvalidHeader as e:
-                    self.errno = INVALID_HEADER
-                    self.errstr = str(e)
-                    return nb_parsed
-            elif not self.__on_message_complete:
-                self.__on_message_begin = True
-                if data:
-                    self._buf.append(data)
-                    data = b''
-                ret = self._parse_body()
-                if ret is None:
-                    return length
-                elif ret < 0:
-                    return ret
-                elif ret == 0:
-                    self.__on_message_complete = True
-                    return length
+                if buf[pos:pos+2] == b'\r\n':
+                    idx = pos
                 else:
-                    nb_parsed = max(length, ret)
+                    idx = buf.find(b'\r\n\r\n', self._scan)
+                    if idx < 0:
+                        self._scan = max(len(buf) - 3, pos)
+                        return
+                self._parse_headers(buf[pos:idx])
+                self._pos = self._scan = idx + 4 if idx > pos else idx + 2
+            elif self._chunked:
+                if not self._parse_chunk():
+                    return
+            elif self._clen is None and not self._status:
+                # a request without content-length has no body
+                self.__on_message_complete = True
             else:
-                return 0
+                size = min(len(buf) - pos, self._clen_rest)
+                if size:
+                    self._add_body(pos, pos + size)
+                    self._clen_rest -= size
+                if self._clen_rest <= 0:
+                    self.__on_message_complete = True
+                return
 
     def _parse_firstline(self, line):
-        try:
-            if self.kind == 2:  # auto detect
-                try:
-                    self._parse_request_line(line)
-                except InvalidRequestLine:
-                    self._parse_response_line(line)
-            elif self.kind == 1:
-                self._parse_response_line(line)
-            elif self.kind == 0:
+        if self.kind == 2:  # auto detect
+            try:
                 self._parse_request_line(line)
-        except InvalidRequestLine as e:
-            self.errno = BAD_FIRST_LINE
-            self.errstr = str(e)
-            return False
-        return True
+            except InvalidRequestLine:
+                self._parse_response_line(line)
+        elif self.kind == 1:
+            self._parse_response_line(line)
+        elif self.kind == 0:
+            self._parse_request_line(line)
 
     def _parse_response_line(self, line):
         bits = line.split(None, 1)
@@ -954,36 +1019,7 @@ class HttpParser(object):
         self._version = (int(match.group(1)), int(match.group(2)))
 
     def _parse_headers(self, data):
-        if data == b'\r\n':
-            self.__on_headers_complete = True
-            self._buf = []
-            return 0
-        idx = data.find(b'\r\n\r\n')
-        if idx < 0:  # we don't have all headers
-            return False
-        chunk = to_string(data[:idx], DEFAULT_CHARSET)
-        # Split lines on \r\n keeping the \r\n on each line
-        lines = deque(('%s\r\n' % line for line in chunk.split('\r\n')))
-        # Parse headers into key/value pairs paying attention
-        # to continuation lines.
-        while len(lines):
-            # Parse initial header name : value pair.
-            curr = lines.popleft()
-            if curr.find(":") < 0:
-                continue
-            name, value = curr.split(":", 1)
-            name = name.rstrip(" \t").upper()
-            if HEADER_RE.search(name):
-                raise InvalidHeader("invalid header name %s" % name)
-            name, value = header_field(name.strip()), [value.lstrip()]
-            # Consume value continuation lines
-            while len(lines) and lines[0].startswith((" ", "\t")):
-                value.append(lines.popleft())
-            value = ''.join(value).rstrip()
-            if name in self._headers:
-                self._headers[name].append(value)
-            else:
-                self._headers[name] = [value]
+        self._parse_fields(data, self._headers)
         # detect now if body is sent by chunks.
         clen = self._headers.get('Content-Length')
         if 'Transfer-Encoding' in self._headers:
@@ -1021,74 +1057,85 @@ class HttpParser(object):
             elif encoding == "deflate":
                 self.__decompress_obj = zlib.decompressobj()
 
-        rest = data[idx+4:]
-        self._buf = [rest]
         self.__on_headers_complete = True
         self.__on_message_begin = True
-        return len(rest)
 
-    def _parse_body(self):
-        data = b''.join(self._buf)
-        #
-        if not self._chunked:
-            #
-            if not data and self._clen is None:
-                if not self._status:    # message complete only for servers
-                    self.__on_message_complete = True
+    def _parse_fields(self, data, headers):
+        name = None
+        for line in data.decode(DEFAULT_CHARSET).split('\r\n'):
+            # Consume value continuation lines
+            if name and line[:1] in (' ', '\t'):
+                values = headers[name]
+                values[-1] = '%s\r\n%s' % (values[-1], line.rstrip())
+                continue
+            # Parse initial header name : value pair.
+            idx = line.find(':')
+            if idx < 0:
+                name = None
+                continue
+            name = _parsed_header_names.get(line[:idx])
+            if name is None:
+                name = _parse_header_name(line[:idx])
+            value = line[idx+1:].strip()
+            if name in headers:
+                headers[name].append(value)
             else:
-                if self._clen_rest is not None:
-                    self._clen_rest -= len(data)
-
-                # maybe decompress
-                data = self._decompress(data)
-
-                self._partial_body = True
-                if data:
-                    self._body.append(data)
-                self._buf = []
-                if self._clen_rest <= 0:
-                    self.__on_message_complete = True
-            return
-        else:
+                headers[name] = [value]
+        return headers
+
+    def _parse_chunk(self):
+        # Parse the next piece of a chunked body. Return True if
+        # progress was made, False if more data is needed.
+        # _chunk_rest is None when waiting for the chunk size line, the
+        # number of data bytes still to read, 0 when waiting for the
+        # CRLF after the data or -1 when waiting for the trailers
+        buf = self._buf
+        pos = self._pos
+        rest = self._chunk_rest
+        if rest is None:
+            idx = buf.find(b'\r\n', pos)
+            if idx < 0:
+                return False
+            size = bytes(buf[pos:idx]).split(b';', 1)[0].strip()
             try:
-                size, rest = self._parse_chunk_size(data)
-            except InvalidChunkSize as e:
-                self.errno = INVALID_CHUNK
-                self.errstr = "invalid chunk size [%s]" % str(e)
-                return -1
-            if size == 0:
-                return size
-            if size is None or len(rest) < size + 2:
-                return None
-            body_part, rest = rest[:size], rest[size:]
-
-            # maybe decompress
-            body_part = self._decompress(body_part)
-            self._partial_body = True
-            self._body.append(body_part)
-            rest = rest[2:]
-            self._buf = [rest] if rest else []
-            return len(rest) + 2
-
-    def _parse_chunk_size(self, data):
-        idx = data.find(b'\r\n')
-        if idx < 0:
-            return None, None
-        line, rest_chunk = data[:idx], data[idx+2:]
-        chunk_size = line.split(b';', 1)[0].strip()
-        try:
-            chunk_size = int(chunk_size, 16)
-        except ValueError:
-            raise InvalidChunkSize(chunk_size)
-        if chunk_size == 0:
-            self._parse_trailers(rest_chunk)
-            return 0, None
-        return chunk_size, rest_chunk
-
-    def _parse_trailers(self, data):
-        idx = data.find(b'\r\n\r\n')
-        if data[:2] == b'\r\n':
-            self._trailers = self._parse_headers(data[:idx])
+                size = int(size, 16)
+            except ValueError:
+                raise InvalidChunkSize(size)
+            self._pos = idx + 2
+            self._chunk_rest = size or -1
+        elif rest > 0:
+            size = min(len(buf) - pos, rest)
+            if not size:
+                return False
+            self._add_body(pos, pos + size)
+            self._chunk_rest -= size
+        elif rest == 0:
+            if len(buf) - pos < 2:
+                return False
+            self._pos += 2
+            self._chunk_rest = None
+        else:
+            if buf[pos:pos+2] == b'\r\n':
+                self._pos += 2
+            else:
+                idx = buf.find(b'\r\n\r\n', pos)
+                if idx < 0:
+                    return False
+                self._trailers = self._parse_fields(buf[pos:idx],
+                                                    OrderedDict())
+                self._pos = idx + 4
+            self.__on_message_complete = True
+        return True
+
+    def _add_body(self, start, end):
+        with memoryview(self._buf) as view:
+            data = view[start:end].tobytes()
+        self._pos = end
+        # maybe decompress
+        data = self._decompress(data)
+        self._partial_body = True
+        if data:
+            self._body.append(data)
 
     def _decompress(self, data):
         deco = self.__decompress_obj
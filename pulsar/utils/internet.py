@@ -149,6 +149,28 @@ def close_socket(sock):
             pass
 
 
+def reuse_port_socket(address, type=socket.SOCK_STREAM):
+    '''Create a socket bound to ``address`` with the ``SO_REUSEPORT``
+    option.
+
+    Several sockets, possibly owned by different processes, can be bound to
+    the same address and the kernel distributes incoming connections, or
+    datagrams, among them. The returned socket is not listening.
+    '''
+    family = socket.AF_INET6 if len(address) == 4 else socket.AF_INET
+    sock = socket.socket(family, type)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        if family == socket.AF_INET6:
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+        sock.bind(address)
+    except Exception:
+        sock.close()
+        raise
+    return sock
+
+
 def nice_address(address, family=None):
     if isinstance(address, tuple):
         address = ':'.join((str(s) for s in address[:2]))
@@ -53,4 +53,4 @@ from .zset import Zset
 from .misc import (MultiValueDict, AttributeDictionary, FrozenDict,
                    Dict, Deque, merge_prefix, recursive_update,
                    mapping_iterator, inverse_mapping, isgenerator,
-                   aslist)
+                   aslist, flat_mapping, mapping_delta, apply_delta)
@@ -317,3 +317,57 @@ def recursive_update(target, mapping):
                     target[key] = value
             else:
                 target[key] = value
+
+
+def flat_mapping(mapping, prefix=()):
+    '''Flatten a nested ``mapping`` into a dictionary keyed by paths.
+
+    Each key is a tuple of keys leading to a leaf value. Values which are
+    not mappings, including lists, are leaves.
+    '''
+    flat = {}
+    for key, value in mapping.items():
+        path = prefix + (key,)
+        if isinstance(value, Mapping) and value:
+            flat.update(flat_mapping(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def mapping_delta(old, new):
+    '''Changes between two :func:`flat_mapping`.
+
+    Return a two-elements tuple ``(changed, removed)`` where ``changed``
+    is a dictionary of paths whose values were added or modified
+    and ``removed`` a list of paths no longer in ``new``.
+    '''
+    changed = {}
+    for path, value in new.items():
+        if path not in old or old[path] != value:
+            changed[path] = value
+    removed = [path for path in old if path not in new]
+    return changed, removed
+
+
+def apply_delta(target, delta):
+    '''Apply a ``delta`` obtained from :func:`mapping_delta` to the
+    nested ``target`` mapping.'''
+    changed, removed = delta
+    for path in removed:
+        cont = target
+        for key in path[:-1]:
+            cont = cont.get(key)
+            if not isinstance(cont, Mapping):
+                break
+        else:
+            cont.pop(path[-1], None)
+    for path, value in changed.items():
+        cont = target
+        for key in path[:-1]:
+            child = cont.get(key)
+            if not isinstance(child, Mapping):
+                child = cont[key] = {}
+            cont = child
+        cont[path[-1]] = value
+    return target
@@ -41,6 +41,26 @@ kilo, mega, giga, tera, peta, exa, zetta, yotta'''
     return "%sB" % b
 
 
+def memory_usage(pid=None):
+    '''Resident memory, in bytes, of the process ``pid``.
+
+    It uses the psutil_ module if available, otherwise the ``proc``
+    file system. Returns ``None`` if the information is not available.
+    '''
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.NoSuchProcess:  # pragma    nocover
+            return None
+    try:  # pragma    nocover
+        with open('/proc/%s/statm' % pid) as f:
+            pages = int(f.read().split()[1])
+        return pages*os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
 def process_info(pid=None):
     '''Returns a dictionary of system information for the process ``pid``.
 
@@ -60,6 +80,7 @@ def process_info(pid=None):
     else:
         mem = p.memory_info()
         return {'memory': mem.rss,
+                'memory_shared': getattr(mem, 'shared', 0),
                 'memory_virtual': mem.vms,
                 'cpu_percent': p.cpu_percent(),
                 'nice': p.nice(),
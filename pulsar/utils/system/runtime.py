@@ -54,6 +54,10 @@ class Platform(object):
     def is_posix(self):
         return self.type == 'posix'
 
+    @property
+    def is_linux(self):
+        return sys.platform.startswith('linux')
+
     @property
     def isMacOSX(self):
         """Return if we are runnng on Mac OS X."""
@@ -100,3 +104,15 @@ class Platform(object):
         '''Indicates if support for multiprocess sockets is available.
         '''
         return hasattr(socket, 'fromfd')
+
+    @property
+    def has_unix_socket(self):
+        '''Indicates if unix domain sockets are available.
+        '''
+        return hasattr(socket, 'AF_UNIX')
+
+    @property
+    def has_reuse_port(self):
+        '''Indicates if the ``SO_REUSEPORT`` socket option is available.
+        '''
+        return hasattr(socket, 'SO_REUSEPORT')
@@ -1,13 +1,19 @@
 '''Tests actor and actor proxies.'''
+import os
+import sys
+import ast
+import tempfile
+import subprocess
 import unittest
 import pickle
+import asyncio
 
 from multiprocessing.queues import Queue
 from functools import partial
 
 import pulsar
 from pulsar import (send, get_actor, CommandNotFound, async_while, TcpServer,
-                    Connection)
+                    Connection, platform)
 from pulsar.apps.test import ActorTestMixin, dont_run_with_thread
 
 from examples.echo.manage import Echo, EchoServerProtocol
@@ -17,6 +23,64 @@ def add(actor, a, b):
     return (actor.name, a+b)
 
 
+def sleep(actor, seconds):
+    yield from asyncio.sleep(seconds)
+    return actor.aid
+
+
+def timeout_kwarg(actor, timeout=None):
+    return timeout
+
+
+def parent_pid(actor):
+    return os.getppid()
+
+
+def peer_ping(actor, proxy):
+    result = yield from actor.send(proxy, 'ping')
+    return result, proxy.peer_address in actor.mailbox._peers
+
+
+def peer_send(actor, aid):
+    mailbox = actor.mailbox
+    known = aid in mailbox._peer_addresses
+    result = yield from actor.send(aid, 'run', peer_connections)
+    return known, result, mailbox._peer_addresses.get(aid) in mailbox._peers
+
+
+def peer_connections(actor):
+    return len(actor.mailbox._peer_server._concurrent_connections)
+
+
+def ping_arbiter(actor):
+    result = yield from send('arbiter', 'ping')
+    return result, actor.mailbox.address
+
+
+def unix_mailbox_start(arbiter, **kw):
+    # The start hook must not wait, ping from a separate task
+    asyncio.ensure_future(unix_mailbox_ping(arbiter), loop=arbiter._loop)
+
+
+def unix_mailbox_ping(arbiter):
+    try:
+        yield from async_while(10, lambda: not arbiter.is_running())
+        proxy = yield from pulsar.spawn(name='unix-mailbox',
+                                        concurrency='process')
+        result, address = yield from send(proxy, 'run', ping_arbiter)
+        print('unix-mailbox %s %r' % (result, address))
+    finally:
+        arbiter.stop()
+
+
+def unix_mailbox_arbiter():
+    '''Run an arbiter with a unix socket mailbox, spawn a process actor
+    which pings the arbiter and print the result.'''
+    cfg = pulsar.Config()
+    cfg.set('mailbox_unix_socket', True)
+    pulsar.arbiter(cfg=cfg, start=unix_mailbox_start).start()
+
+
 class create_echo_server(object):
     '''partial is not picklable in python 2.6'''
     def __init__(self, address):
@@ -52,6 +116,31 @@ class TestActorThread(ActorTestMixin, unittest.TestCase):
         self.assertEqual(n, name)
         self.assertEqual(result, 4)
 
+    def test_broadcast(self):
+        a = yield from self.spawn_actor(name='bcast-a-%s' % self.concurrency)
+        b = yield from self.spawn_actor(name='bcast-b-%s' % self.concurrency)
+        # Actors spawned by other tests may be busy, do not wait for them
+        results = yield from send('arbiter', 'broadcast', 'echo', 'Hello!',
+                                  broadcast_timeout=1)
+        self.assertEqual(results[a.aid], 'Hello!')
+        self.assertEqual(results[b.aid], 'Hello!')
+        results = yield from send('arbiter', 'broadcast', 'run', sleep, 0,
+                                  broadcast_timeout=1)
+        self.assertEqual(results[a.aid], a.aid)
+        self.assertEqual(results[b.aid], b.aid)
+        # a timeout parameter is passed to the command
+        results = yield from send('arbiter', 'broadcast', 'run',
+                                  timeout_kwarg, timeout=3,
+                                  broadcast_timeout=1)
+        self.assertEqual(results[a.aid], 3)
+
+    def test_broadcast_timeout(self):
+        proxy = yield from self.spawn_actor(
+            name='bcast-slow-%s' % self.concurrency)
+        results = yield from send('arbiter', 'broadcast', 'run', sleep, 1,
+                                  broadcast_timeout=0.2)
+        self.assertIsInstance(results[proxy.aid], asyncio.TimeoutError)
+
     def test_info(self):
         name = 'pippo-%s' % self.concurrency
         proxy = yield from self.spawn_actor(name=name)
@@ -78,7 +167,102 @@ class TestActorThread(ActorTestMixin, unittest.TestCase):
         is_alive = yield from async_while(3, proxy_monitor.is_alive)
         self.assertFalse(is_alive)
 
+    def test_peer_mailbox(self):
+        a = yield from self.spawn_actor(
+            name='peer-a-%s' % self.concurrency, mailbox_peers=True)
+        b = yield from self.spawn_actor(
+            name='peer-b-%s' % self.concurrency, mailbox_peers=True)
+        self.assertTrue(a.peer_address)
+        self.assertTrue(b.peer_address)
+        self.assertNotEqual(a.peer_address, b.peer_address)
+        result, direct = yield from send(a, 'run', peer_ping, b)
+        self.assertEqual(result, 'pong')
+        self.assertTrue(direct)
+
+    def test_peer_mailbox_by_aid(self):
+        a = yield from self.spawn_actor(
+            name='peer-aid-a-%s' % self.concurrency, mailbox_peers=True)
+        b = yield from self.spawn_actor(
+            name='peer-aid-b-%s' % self.concurrency, mailbox_peers=True)
+        # the address of b was pushed to a when b first notified
+        known, connections, direct = yield from send(a, 'run', peer_send,
+                                                     b.aid)
+        self.assertTrue(known)
+        self.assertTrue(direct)
+        # b got the message from a via its peer mailbox server
+        self.assertEqual(connections, 1)
+
 
 @dont_run_with_thread
 class TestActorProcess(TestActorThread):
     concurrency = 'process'
+
+    @unittest.skipUnless(platform.is_posix, 'Requires posix')
+    def test_fork_server(self):
+        proxy = yield from self.spawn_actor(name='forked', fork_server=True)
+        yield from self.async.assertEqual(send(proxy, 'ping'), 'pong')
+        # forked by the fork server, not by the arbiter
+        ppid = yield from send(proxy, 'run', parent_pid)
+        self.assertNotEqual(ppid, os.getppid())
+        info = yield from send('arbiter', 'info')
+        workers = [w for w in info['workers']
+                   if w.get('actor', {}).get('actor_id') == proxy.aid]
+        self.assertTrue(workers[0]['spawn_time'] > 0)
+
+
+@unittest.skipUnless(platform.has_unix_socket, 'Requires unix sockets')
+class TestUnixSocketServer(unittest.TestCase):
+
+    def address(self):
+        name = 'pulsar-test-%s' % os.getpid()
+        if platform.is_linux:
+            return '\0%s' % name
+        else:
+            return os.path.join(tempfile.gettempdir(), '%s.sock' % name)
+
+    def test_echo(self):
+        loop = get_actor()._loop
+        server = TcpServer(partial(Connection, EchoServerProtocol),
+                           loop, self.address())
+        yield from server.start_serving()
+        self.assertTrue(server.address)
+        echo = Echo(server.address, loop=loop)
+        result = yield from echo(b'Hello!')
+        self.assertEqual(result, b'Hello!')
+        yield from server.close()
+
+
+@unittest.skipUnless(platform.has_unix_socket, 'Requires unix sockets')
+class TestUnixSocketMailbox(unittest.TestCase):
+
+    def run_arbiter(self):
+        # A new arbiter is needed, run it in a separate python process
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        code = ('from tests.async.actor import unix_mailbox_arbiter; '
+                'unix_mailbox_arbiter()')
+        try:
+            return subprocess.check_output([sys.executable, '-c', code],
+                                           cwd=root, timeout=30,
+                                           stderr=subprocess.STDOUT)
+        except subprocess.SubprocessError as exc:
+            return exc.output or b''
+
+    def test_ping_arbiter(self):
+        loop = get_actor()._loop
+        output = yield from loop.run_in_executor(None, self.run_arbiter)
+        output = output.decode('utf-8', 'replace')
+        lines = [l for l in output.splitlines()
+                 if l.startswith('unix-mailbox ')]
+        self.assertEqual(len(lines), 1, output)
+        _, result, address = lines[0].split(' ', 2)
+        self.assertEqual(result, 'pong')
+        address = ast.literal_eval(address)
+        # abstract namespace addresses are returned as bytes
+        if isinstance(address, bytes):
+            address = address.decode('utf-8')
+        self.assertIsInstance(address, str)
+        if platform.is_linux:
+            self.assertTrue(address.startswith('\0pulsar-mailbox-'))
+        else:
+            self.assertTrue(address.endswith('.sock'))
@@ -0,0 +1,131 @@
+'''Tests load-driven autoscaling of monitor workers.'''
+import unittest
+import logging
+from time import time
+
+from pulsar import Config
+from pulsar.async.concurrency import MonitorConcurrency
+
+
+class Impl(object):
+
+    def __init__(self, age):
+        self.age = age
+
+
+class Proxy(object):
+    stopping_start = None
+
+    def __init__(self, aid, age, connections=0, requests=0, when=None):
+        self.aid = aid
+        self.impl = Impl(age)
+        self.info = {}
+        self.notify(connections, requests, when)
+
+    def notify(self, connections, requests=0, when=None):
+        self.info['last_notified'] = when or time()
+        self.info['events'] = {'callbacks': 0, 'scheduled': 0}
+        self.info['echoserver'] = {
+            'clients': {'connected_clients': connections,
+                        'requests_processed': requests}}
+
+
+class Monitor(object):
+    logger = logging.getLogger('pulsar.test.autoscale')
+
+    def __init__(self, **params):
+        self.cfg = Config(**params)
+
+
+class TestAutoscale(unittest.TestCase):
+
+    def concurrency(self, *actors):
+        concurrency = MonitorConcurrency()
+        concurrency.managed_actors = dict(((a.aid, a) for a in actors))
+        concurrency.actors_load = {}
+        concurrency.next_autoscale = 0
+        return concurrency
+
+    def test_disabled(self):
+        monitor = Monitor(workers=2)
+        concurrency = self.concurrency(Proxy('a', 1, 500), Proxy('b', 2, 500))
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 2)
+
+    def test_workers_bounds(self):
+        monitor = Monitor(workers=10, workers_min=2, workers_max=4)
+        concurrency = self.concurrency()
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 4)
+        monitor.cfg.set('workers', 1)
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 2)
+
+    def test_actor_load(self):
+        monitor = Monitor(autoscale_connections=100, autoscale_requests=10)
+        actor = Proxy('a', 1, 50, 100, when=100)
+        concurrency = self.concurrency(actor)
+        self.assertEqual(concurrency.actor_load(monitor, actor), 0.5)
+        actor.notify(20, 400, when=110)
+        self.assertEqual(concurrency.actor_load(monitor, actor), 3)
+        actor.info['events']['lag'] = 0.5
+        self.assertEqual(concurrency.actor_load(monitor, actor), 3)
+        actor.notify(0, 400, when=120)
+        actor.info['events']['lag'] = 0.5
+        self.assertEqual(concurrency.actor_load(monitor, actor), 5)
+        actor.info.pop('last_notified')
+        self.assertEqual(concurrency.actor_load(monitor, actor), None)
+
+    def test_scale_up(self):
+        monitor = Monitor(workers=2, workers_max=8)
+        concurrency = self.concurrency(Proxy('a', 1, 200), Proxy('b', 2, 100))
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 3)
+        self.assertTrue(concurrency.next_autoscale > time())
+        # cooldown
+        concurrency.managed_actors['c'] = Proxy('c', 3, 300)
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 3)
+        concurrency.next_autoscale = 0
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 6)
+
+    def test_scale_up_max(self):
+        monitor = Monitor(workers=2, workers_max=3)
+        concurrency = self.concurrency(Proxy('a', 1, 900), Proxy('b', 2, 900))
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 3)
+
+    def test_scale_down(self):
+        monitor = Monitor(workers=3, workers_max=8)
+        a, b, c = Proxy('a', 1, 30), Proxy('b', 2, 20), Proxy('c', 3, 10)
+        concurrency = self.concurrency(a, b, c)
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 2)
+        # hysteresis, two workers would be loaded above the threshold
+        concurrency.managed_actors.pop('c')
+        a.notify(70, when=time() + 5)
+        b.notify(70, when=time() + 5)
+        concurrency.next_autoscale = 0
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 2)
+
+    def test_wait_for_notify(self):
+        monitor = Monitor(workers=2, workers_max=8)
+        b = Proxy('b', 2, 500)
+        b.info.pop('last_notified')
+        concurrency = self.concurrency(Proxy('a', 1, 500), b)
+        concurrency.autoscale(monitor)
+        self.assertEqual(monitor.cfg.workers, 2)
+
+    def test_stop_least_loaded(self):
+        monitor = Monitor(workers=1, workers_max=8)
+        a, b = Proxy('a', 1, 60), Proxy('b', 2, 10)
+        concurrency = self.concurrency(a, b)
+        stopped = []
+        concurrency.manage_actor = lambda m, actor, stop: stopped.append(
+            actor)
+        concurrency.actor_load(monitor, a)
+        concurrency.actor_load(monitor, b)
+        concurrency.stop_actors(monitor)
+        self.assertEqual(stopped, [b])
@@ -0,0 +1,57 @@
+'''Tests the event loop lag sampler.'''
+import time
+import unittest
+import asyncio
+
+from pulsar import get_event_loop, get_actor
+from pulsar.async.lag import LoopLagMonitor
+from pulsar.apps.test import sequential
+
+
+def block(seconds):
+    time.sleep(seconds)
+
+
+@sequential
+class TestLoopLagMonitor(unittest.TestCase):
+
+    def monitor(self, **kw):
+        loop = get_event_loop()
+        monitor = LoopLagMonitor(loop, **kw)
+        monitor.start()
+        self.addCleanup(monitor.stop)
+        return monitor
+
+    def test_info(self):
+        monitor = self.monitor(interval=0.02)
+        self.assertTrue(monitor.running)
+        yield from asyncio.sleep(0.1)
+        info = monitor.info()
+        self.assertTrue(info['lag_max'] >= info['lag_p99'] >= info['lag'])
+        self.assertTrue(info['lag'] >= info['lag_p50'] >= 0)
+        self.assertEqual(info['slow_locations'], [])
+        monitor.stop()
+        self.assertFalse(monitor.running)
+
+    def test_slow_callback(self):
+        monitor = self.monitor(interval=0.02, slow_callback=0.05)
+        monitor._loop.call_soon(block, 0.3)
+        yield from asyncio.sleep(0.1)
+        info = monitor.info()
+        self.assertTrue(info['slow_callbacks'] >= 1)
+        self.assertTrue(info['lag_max'] >= 0.25)
+        location, count, total, dt = info['slow_locations'][0]
+        code = block.__code__
+        self.assertEqual(location, '%s:%s block' % (code.co_filename,
+                                                    code.co_firstlineno))
+        self.assertEqual(count, 1)
+        self.assertTrue(dt >= 0.25)
+
+    def test_actor_info(self):
+        actor = get_actor()
+        info = actor.info()
+        if actor.lag_monitor:
+            self.assertTrue('lag' in info['events'])
+            self.assertTrue('slow_locations' in info['events'])
+        else:
+            self.assertFalse('lag' in info['events'])
@@ -0,0 +1,169 @@
+'''Tests the actor mailbox protocol.'''
+import unittest
+
+from pulsar import get_event_loop, Future, ImproperlyConfigured
+from pulsar.async.mailbox import (MailboxProtocol, Message, get_serializer,
+                                  PickleSerializer, CompactSerializer)
+
+
+class Transport(object):
+    _closing = False
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def pause_reading(self):
+        pass
+
+    def resume_reading(self):
+        pass
+
+
+class TestMailboxProtocol(unittest.TestCase):
+
+    def protocol(self, **kw):
+        protocol = MailboxProtocol(loop=get_event_loop(), **kw)
+        protocol._transport = Transport()
+        return protocol
+
+    def next_iteration(self):
+        waiter = Future()
+        waiter._loop.call_soon(waiter.set_result, None)
+        return waiter
+
+    def test_no_batch(self):
+        protocol = self.protocol(batch=False)
+        protocol._start(Message.command('echo', 'a', 'b', ('ciao',), None))
+        protocol._start(Message.command('echo', 'a', 'b', ('luca',), None))
+        writes = protocol._transport.writes
+        self.assertEqual(len(writes), 2)
+        receiver = self.protocol()
+        messages = list(receiver._messages(b''.join(writes)))
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0]['args'], ('ciao',))
+        self.assertEqual(messages[1]['args'], ('luca',))
+
+    def test_batch(self):
+        protocol = self.protocol(batch=True)
+        protocol._start(Message.command('echo', 'a', 'b', ('ciao',), None))
+        protocol._start(Message.command('echo', 'a', 'b', ('luca',), None))
+        protocol._start(Message.callback('pong', 'abcd'))
+        writes = protocol._transport.writes
+        self.assertEqual(len(writes), 0)
+        yield from self.next_iteration()
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(len(protocol._pending_responses), 2)
+        receiver = self.protocol()
+        messages = list(receiver._messages(writes[0]))
+        self.assertEqual(len(messages), 3)
+        self.assertEqual(messages[0]['args'], ('ciao',))
+        self.assertEqual(messages[1]['args'], ('luca',))
+        self.assertEqual(messages[2]['command'], 'callback')
+        self.assertEqual(messages[2]['result'], 'pong')
+
+    def test_batch_single_message(self):
+        protocol = self.protocol(batch=True)
+        protocol._start(Message.command('echo', 'a', 'b', ('ciao',), None))
+        yield from self.next_iteration()
+        writes = protocol._transport.writes
+        self.assertEqual(len(writes), 1)
+        receiver = self.protocol(batch=False)
+        messages = list(receiver._messages(writes[0]))
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0]['command'], 'echo')
+
+    def test_compact_serializer(self):
+        protocol = self.protocol(serializer=CompactSerializer())
+        protocol._start(Message.command('ping', 'a', 'b', None, None))
+        protocol._start(Message.command('echo', 'a', 'b', ('ciao',), None))
+        protocol._start(Message.callback('pong', 'abcd'))
+        writes = protocol._transport.writes
+        receiver = self.protocol(serializer=CompactSerializer())
+        messages = list(receiver._messages(b''.join(writes)))
+        self.assertEqual(len(messages), 3)
+        self.assertEqual(messages[0]['command'], 'ping')
+        self.assertEqual(messages[0]['sender'], 'a')
+        self.assertEqual(messages[0]['target'], 'b')
+        self.assertTrue(messages[0]['ack'])
+        self.assertEqual(messages[1]['command'], 'echo')
+        self.assertEqual(messages[1]['args'], ('ciao',))
+        self.assertEqual(messages[2], {'command': 'callback',
+                                       'ack': 'abcd',
+                                       'result': 'pong'})
+
+    def commands(self, data):
+        receiver = self.protocol()
+        return [m['command'] for m in receiver._messages(data)]
+
+    def test_control_lane(self):
+        protocol = self.protocol(batch=False)
+        protocol.pause_writing()
+        protocol._start(Message.command('echo', 'a', 'b', ('ciao',), None))
+        protocol._start(Message.command('notify', 'a', 'b', ({},), None))
+        protocol._start(Message.callback('pong', 'abcd', 'ping'))
+        writes = protocol._transport.writes
+        self.assertEqual(len(writes), 2)
+        self.assertEqual(protocol.queued, 1)
+        protocol.resume_writing()
+        self.assertEqual(protocol.queued, 0)
+        self.assertEqual(self.commands(b''.join(writes)),
+                         ['notify', 'callback', 'echo'])
+
+    def test_control_lane_batch(self):
+        protocol = self.protocol(batch=True)
+        protocol.pause_writing()
+        protocol._start(Message.command('echo', 'a', 'b', ('ciao',), None))
+        protocol._start(Message.callback('ciao', 'abcd', 'echo'))
+        protocol._start(Message.command('stop', 'a', 'b', None, None))
+        yield from self.next_iteration()
+        writes = protocol._transport.writes
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(self.commands(writes[0]), ['stop'])
+        self.assertEqual(protocol.queued, 2)
+        protocol.resume_writing()
+        self.assertEqual(len(writes), 2)
+        self.assertEqual(self.commands(writes[1]), ['echo', 'callback'])
+
+    def test_backpressure(self):
+        protocol = self.protocol(max_queue=2)
+        protocol.pause_writing()
+        protocol.request('echo', 'a', 'b', ('1',), None)
+        protocol.request('echo', 'a', 'b', ('2',), None)
+        third = protocol.request('echo', 'a', 'b', ('3',), None)
+        yield from self.next_iteration()
+        self.assertEqual(protocol.queued, 2)
+        # control messages do not wait
+        protocol.request('ping', 'a', 'b', None, None)
+        writes = protocol._transport.writes
+        self.assertEqual(len(writes), 1)
+        protocol.resume_writing()
+        yield from self.next_iteration()
+        self.assertEqual(protocol.queued, 0)
+        self.assertEqual(len(writes), 4)
+        receiver = self.protocol()
+        messages = list(receiver._messages(b''.join(writes)))
+        self.assertEqual([m['args'] for m in messages[1:]],
+                         [('1',), ('2',), ('3',)])
+        self.assertFalse(third.done())
+        third.cancel()
+
+
+class TestSerializers(unittest.TestCase):
+
+    def test_get_serializer(self):
+        self.assertIsInstance(get_serializer('pickle'), PickleSerializer)
+        self.assertIsInstance(get_serializer('compact'), CompactSerializer)
+        self.assertIsInstance(
+            get_serializer('pulsar.async.mailbox.CompactSerializer'),
+            CompactSerializer)
+        self.assertRaises(ImproperlyConfigured, get_serializer, 'foo')
+
+    def test_compact_batch(self):
+        serializer = CompactSerializer()
+        batch = [Message.command('notify', 'a', 'b', ({'x': 1},), None).data,
+                 Message.callback(None, 'abcd').data,
+                 {'command': 'foo', 'ack': 'efgh'}]
+        self.assertEqual(serializer.decode(serializer.encode(batch)), batch)
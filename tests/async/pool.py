@@ -0,0 +1,88 @@
+'''Tests the asynchronous connection pool.'''
+import unittest
+import asyncio
+
+from pulsar import Pool, EventHandler, get_event_loop
+
+
+class Connection(EventHandler):
+    ONE_TIME_EVENTS = ('connection_lost',)
+    closed = False
+
+    def __init__(self, loop):
+        super(Connection, self).__init__(loop)
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._loop.call_soon(self.fire_event, 'connection_lost')
+
+
+class TestPool(unittest.TestCase):
+
+    def pool(self, **kw):
+        loop = get_event_loop()
+
+        def creator():
+            yield None
+            return Connection(loop)
+
+        return Pool(creator, loop=loop, **kw)
+
+    def test_connection_lost(self):
+        pool = self.pool(pool_size=2)
+        c1 = yield from pool.connect()
+        c2 = yield from pool.connect()
+        conn1, conn2 = c1.connection, c2.connection
+        c1.close()
+        c2.close()
+        self.assertEqual(pool.available, 2)
+        conn1.close()
+        yield from conn1.event('connection_lost')
+        self.assertEqual(pool.available, 1)
+        self.assertFalse(conn1 in pool)
+        c = yield from pool.connect()
+        self.assertEqual(c.connection, conn2)
+        c.close()
+        info = pool.info()
+        self.assertEqual(info['created'], 2)
+        self.assertEqual(info['lost'], 1)
+        self.assertEqual(info['checkouts'], 3)
+        self.assertEqual(info['waiting'], 0)
+        self.assertTrue(info['max_wait_time'] >= info['mean_wait_time'])
+        pool.close()
+
+    def test_max_idle(self):
+        pool = self.pool(max_idle=0.1)
+        c = yield from pool.connect()
+        connection = c.connection
+        c.close()
+        self.assertEqual(pool.available, 1)
+        yield from asyncio.sleep(0.3)
+        self.assertEqual(pool.available, 0)
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.info()['expired'], 1)
+        pool.close()
+
+    def test_max_lifetime(self):
+        pool = self.pool(max_lifetime=0.1)
+        c = yield from pool.connect()
+        connection = c.connection
+        yield from asyncio.sleep(0.2)
+        c.close()
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.available, 0)
+        c = yield from pool.connect()
+        self.assertNotEqual(c.connection, connection)
+        c.close()
+        pool.close()
+
+    def test_min_idle(self):
+        pool = self.pool(pool_size=3, min_idle=2)
+        c = yield from pool.connect()
+        yield from asyncio.sleep(0.05)
+        self.assertEqual(pool.available, 2)
+        self.assertEqual(pool.in_use, 1)
+        c.close()
+        self.assertEqual(pool.available, 3)
+        pool.close()
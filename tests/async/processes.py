@@ -0,0 +1,96 @@
+'''Tests the process pool for CPU bound work.'''
+import os
+import signal
+import unittest
+
+from pulsar import (get_event_loop, get_actor, ProcessPool, run_in_process,
+                    platform)
+
+
+def fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def child_signals():
+    # the wakeup fd and whether SIGTERM has the default handler
+    wakeup = signal.set_wakeup_fd(-1)
+    return wakeup, signal.getsignal(signal.SIGTERM) == signal.SIG_DFL
+
+
+@run_in_process
+def child_pid():
+    return os.getpid()
+
+
+class TestProcessPool(unittest.TestCase):
+
+    def pool(self, **kw):
+        pool = ProcessPool(**kw)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_submit(self):
+        pool = self.pool(max_workers=1)
+        result = yield from pool.submit(get_event_loop(), fibonacci, 30)
+        self.assertEqual(result, 832040)
+        info = pool.info()
+        self.assertEqual(info['tasks'], 1)
+        self.assertEqual(info['recycled'], 0)
+
+    def test_exception(self):
+        pool = self.pool(max_workers=1)
+        try:
+            yield from pool.submit(get_event_loop(), fail, 'bla')
+        except ValueError as exc:
+            self.assertEqual(str(exc), 'bla')
+        else:
+            raise AssertionError('ValueError not raised')
+
+    def test_recycle(self):
+        pool = self.pool(max_workers=1, max_tasks=2)
+        loop = get_event_loop()
+        pids = []
+        for _ in range(4):
+            pid = yield from pool.submit(loop, os.getpid)
+            pids.append(pid)
+        self.assertEqual(pool.info()['recycled'], 1)
+        self.assertEqual(pool.info()['pending'], 0)
+        self.assertEqual(pids[0], pids[1])
+        self.assertEqual(pids[2], pids[3])
+        self.assertNotEqual(pids[1], pids[2])
+
+
+class TestRunInProcess(unittest.TestCase):
+
+    def test_actor(self):
+        result = yield from get_actor().run_in_process(fibonacci, 20)
+        self.assertEqual(result, 6765)
+
+    def test_actor_exception(self):
+        try:
+            yield from get_actor().run_in_process(fail, 'foo')
+        except ValueError as exc:
+            self.assertEqual(str(exc), 'foo')
+        else:
+            raise AssertionError('ValueError not raised')
+
+    def test_decorator(self):
+        pid = yield from child_pid()
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual(child_pid.__name__, 'child_pid')
+
+    @unittest.skipUnless(platform.is_posix, 'Requires posix')
+    def test_child_signals(self):
+        # The arbiter pool is forked after the arbiter installed its
+        # signal handlers
+        wakeup, default = yield from get_actor().run_in_process(
+            child_signals)
+        self.assertEqual(wakeup, -1)
+        self.assertTrue(default)
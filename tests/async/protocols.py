@@ -0,0 +1,127 @@
+'''Tests connections and protocol consumers.'''
+import unittest
+from functools import partial
+
+from pulsar import get_actor, get_event_loop, TcpServer, Connection, Future
+from pulsar.async.protocols import Protocol
+
+from examples.echo.manage import Echo, EchoServerProtocol
+
+
+class Transport(object):
+    _closing = False
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def writelines(self, chunks):
+        self.write(b''.join(chunks))
+
+    def close(self):
+        self._closing = True
+
+    def abort(self):
+        self._closing = True
+
+
+class TestCork(unittest.TestCase):
+
+    def protocol(self, **kw):
+        protocol = Protocol(loop=get_event_loop(), **kw)
+        protocol._transport = Transport()
+        return protocol
+
+    def test_cork(self):
+        protocol = self.protocol()
+        self.assertFalse(protocol.corked)
+        protocol.cork()
+        self.assertTrue(protocol.corked)
+        protocol.write(b'Hello')
+        protocol.write(b' ')
+        protocol.write(b'World')
+        self.assertEqual(protocol.transport.writes, [])
+        protocol.uncork()
+        self.assertFalse(protocol.corked)
+        self.assertEqual(protocol.transport.writes, [b'Hello World'])
+        protocol.write(b'!')
+        self.assertEqual(protocol.transport.writes, [b'Hello World', b'!'])
+
+    def test_autocork(self):
+        protocol = self.protocol(autocork=True)
+        protocol.write(b'Hello')
+        protocol.write(b' World')
+        self.assertTrue(protocol.corked)
+        self.assertEqual(protocol.transport.writes, [])
+        waiter = Future()
+        waiter._loop.call_soon(waiter.set_result, None)
+        yield from waiter
+        self.assertFalse(protocol.corked)
+        self.assertEqual(protocol.transport.writes, [b'Hello World'])
+
+    def test_autocork_close(self):
+        protocol = self.protocol(autocork=True)
+        protocol.write(b'Hello')
+        protocol.write(b' World')
+        protocol.close()
+        self.assertFalse(protocol.corked)
+        self.assertTrue(protocol.closed)
+        self.assertEqual(protocol.transport.writes, [b'Hello World'])
+
+    def test_autocork_abort(self):
+        protocol = self.protocol(autocork=True)
+        protocol.write(b'Hello')
+        protocol.abort()
+        self.assertFalse(protocol.corked)
+        self.assertEqual(protocol.transport.writes, [])
+
+
+class TestConnection(unittest.TestCase):
+
+    def server(self, **kw):
+        loop = get_actor()._loop
+        server = TcpServer(partial(Connection, EchoServerProtocol),
+                           loop, ('127.0.0.1', 0), **kw)
+        yield from server.start_serving()
+        return server
+
+    def test_lazy_events(self):
+        server = yield from self.server()
+        connection = server.create_protocol()
+        self.assertFalse(connection._events.get('data_received'))
+        self.assertFalse(connection._events.get('before_write'))
+        self.assertTrue(connection.event('data_received'))
+        self.assertTrue(connection._events.get('data_received'))
+        yield from server.close()
+
+    def test_consumer_reuse(self):
+        server = yield from self.server()
+        consumers = {}
+
+        def post_request(consumer, exc=None):
+            ids = consumers.setdefault(consumer.connection, set())
+            ids.add(id(consumer))
+
+        server.bind_event('post_request', post_request)
+        echo = Echo(server.address, pool_size=1, loop=server._loop)
+        result = yield from echo(b'Hello!')
+        self.assertEqual(result, b'Hello!')
+        result = yield from echo(b'Ciao!')
+        self.assertEqual(result, b'Ciao!')
+        self.assertEqual(len(consumers), 1)
+        connection, ids = consumers.popitem()
+        self.assertEqual(connection.requests_processed, 2)
+        self.assertEqual(len(ids), 1)
+        info = server.info()
+        self.assertTrue(info['clients']['connection_memory'] > 0)
+        yield from server.close()
+
+    def test_autocork(self):
+        server = yield from self.server(autocork=True)
+        self.assertTrue(server.info()['server']['autocork'])
+        echo = Echo(server.address, loop=server._loop)
+        result = yield from echo(b'Hello!')
+        self.assertEqual(result, b'Hello!')
+        yield from server.close()
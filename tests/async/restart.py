@@ -0,0 +1,232 @@
+'''Tests the rolling restart and the recycling of monitor workers.'''
+import unittest
+import logging
+from time import time
+
+from pulsar import Config, Future, get_event_loop
+from pulsar.async.concurrency import MonitorConcurrency, Concurrency
+
+
+class Impl(object):
+
+    def __init__(self, age):
+        self.age = age
+
+
+class Proxy(object):
+    stopping_start = None
+
+    def __init__(self, aid, age):
+        self.aid = aid
+        self.impl = Impl(age)
+        self.info = {}
+
+    @property
+    def notified(self):
+        return self.info.get('last_notified')
+
+
+class Monitor(object):
+    logger = logging.getLogger('pulsar.test.restart')
+
+    def __init__(self, concurrency, **params):
+        self.cfg = Config(**params)
+        self.concurrency = concurrency
+        self.spawned = 0
+
+    def is_running(self):
+        return True
+
+    def is_process(self):
+        return True
+
+    def spawn(self):
+        self.spawned += 1
+        aid = 'new%s' % self.spawned
+        self.concurrency.managed_actors[aid] = Proxy(aid, 100 + self.spawned)
+
+
+def monitor_concurrency(workers):
+    concurrency = MonitorConcurrency()
+    concurrency.managed_actors = {}
+    concurrency.actors_load = {}
+    concurrency.next_autoscale = 0
+    for n in range(workers):
+        aid = 'old%s' % n
+        concurrency.managed_actors[aid] = Proxy(aid, n)
+    concurrency.stopped = []
+
+    def manage_actor(monitor, actor, stop=False):
+        concurrency.stopped.append(actor.aid)
+        actor.stopping_start = time()
+
+    concurrency.manage_actor = manage_actor
+    return concurrency
+
+
+class TestRollingRestart(unittest.TestCase):
+
+    def test_restart(self):
+        concurrency = monitor_concurrency(2)
+        monitor = Monitor(concurrency, workers=2)
+        self.assertTrue(concurrency.restart_actors(monitor))
+        self.assertFalse(concurrency.restart_actors(monitor))
+        self.assertEqual(concurrency.restarting, set(('old0', 'old1')))
+        # spawn the first fresh worker
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(monitor.spawned, 1)
+        self.assertEqual(concurrency._restart_spawned, 'new1')
+        # wait for its first notification
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(monitor.spawned, 1)
+        self.assertEqual(concurrency.stopped, [])
+        concurrency.managed_actors['new1'].info['last_notified'] = time()
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(len(concurrency.stopped), 1)
+        # second worker
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(monitor.spawned, 2)
+        concurrency.managed_actors['new2'].info['last_notified'] = time()
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(sorted(concurrency.stopped), ['old0', 'old1'])
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(concurrency.restarting, None)
+        self.assertEqual(monitor.spawned, 2)
+
+    def test_abort(self):
+        concurrency = monitor_concurrency(1)
+        monitor = Monitor(concurrency, workers=1)
+        concurrency.restart_actors(monitor)
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(monitor.spawned, 1)
+        # the fresh worker died before notifying
+        concurrency.managed_actors.pop('new1')
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(concurrency.restarting, None)
+        self.assertEqual(concurrency.stopped, [])
+
+    def test_no_workers(self):
+        concurrency = monitor_concurrency(0)
+        monitor = Monitor(concurrency, workers=0)
+        concurrency.restart_actors(monitor)
+        concurrency.rolling_restart(monitor)
+        self.assertEqual(concurrency.restarting, None)
+        self.assertEqual(monitor.spawned, 0)
+
+
+class Loop(object):
+
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class TestRecycle(unittest.TestCase):
+
+    def test_recycle_reason(self):
+        concurrency = Concurrency()
+        actor = Monitor(concurrency, max_worker_age=100)
+        actor._started = 0
+        actor._loop = Loop(10)
+        self.assertEqual(concurrency.recycle_reason(actor), None)
+        actor._loop = Loop(10*concurrency._max_age)
+        self.assertTrue(concurrency.recycle_reason(actor).startswith('age'))
+
+    def test_recycle_memory(self):
+        concurrency = Concurrency()
+        actor = Monitor(concurrency, max_worker_memory=1)
+        self.assertTrue(concurrency.recycle_reason(actor).startswith('memory'))
+        actor = Monitor(concurrency, max_worker_memory=1000000)
+        self.assertEqual(concurrency.recycle_reason(actor), None)
+
+    def test_recycle_one_at_the_time(self):
+        concurrency = monitor_concurrency(3)
+        monitor = Monitor(concurrency, workers=3)
+        managed = concurrency.managed_actors
+        self.assertTrue(concurrency.recycle_actor(monitor, managed['old1']))
+        self.assertEqual(concurrency.stopped, ['old1'])
+        self.assertTrue(concurrency.recycle_actor(monitor, managed['old1']))
+        self.assertFalse(concurrency.recycle_actor(monitor, managed['old2']))
+        self.assertEqual(concurrency.stopped, ['old1'])
+        managed.pop('old1')
+        self.assertTrue(concurrency.recycle_actor(monitor, managed['old2']))
+        self.assertEqual(concurrency.stopped, ['old1', 'old2'])
+
+    def test_recycle_during_restart(self):
+        concurrency = monitor_concurrency(2)
+        monitor = Monitor(concurrency, workers=2)
+        concurrency.restart_actors(monitor)
+        managed = concurrency.managed_actors
+        self.assertFalse(concurrency.recycle_actor(monitor, managed['old0']))
+
+    def test_recycle_not_by_arbiter(self):
+        concurrency = Concurrency()
+        actor = Monitor(concurrency, max_worker_memory=1)
+        requests = []
+
+        def send(target, command, reason):
+            requests.append(command)
+            return Future(loop=get_event_loop())
+
+        actor.send = send
+        # spawned directly by the arbiter
+        concurrency._recycle(actor)
+        self.assertEqual(requests, [])
+        concurrency._recyclable = True
+        concurrency._recycle(actor)
+        self.assertEqual(requests, ['recycle'])
+
+
+class ProcessImpl(Impl):
+    exitcode = None
+
+    def is_process(self):
+        return True
+
+
+class ProcessProxy(Proxy):
+    alive = True
+    joined = False
+
+    def __init__(self, aid, age):
+        super(ProcessProxy, self).__init__(aid, age)
+        self.impl = ProcessImpl(age)
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self):
+        self.joined = True
+
+
+class ReapMonitor(Monitor):
+
+    def is_monitor(self):
+        return True
+
+    def spawn(self):
+        self.spawned += 1
+        aid = 'new%s' % self.spawned
+        self.concurrency.managed_actors[aid] = ProcessProxy(aid, 0)
+
+    def _remove_actor(self, actor, log=True):
+        self.concurrency.managed_actors.pop(actor.aid)
+
+
+class TestReapActors(unittest.TestCase):
+
+    def test_reap(self):
+        concurrency = MonitorConcurrency()
+        concurrency.managed_actors = dict(
+            ((aid, ProcessProxy(aid, n)) for n, aid in enumerate('ab')))
+        monitor = ReapMonitor(concurrency, workers=2)
+        self.assertEqual(concurrency.reap_actors(monitor), 0)
+        crashed = concurrency.managed_actors['a']
+        crashed.alive = False
+        crashed.impl.exitcode = 1
+        self.assertEqual(concurrency.reap_actors(monitor), 1)
+        self.assertTrue(crashed.joined)
+        self.assertEqual(monitor.spawned, 1)
+        self.assertEqual(sorted(concurrency.managed_actors), ['b', 'new1'])
@@ -0,0 +1,62 @@
+'''Tests the timer wheel for idle timeouts.'''
+import unittest
+import asyncio
+
+from pulsar import get_event_loop
+from pulsar.async.mixins import TimerWheel
+
+
+class Entry(object):
+    _timeout_deadline = None
+    _timeout_bucket = None
+    expired = False
+
+    def _timed_out(self):
+        self.expired = True
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    def wheel(self):
+        return TimerWheel(get_event_loop(), resolution=0.05)
+
+    def test_get(self):
+        loop = get_event_loop()
+        wheel = TimerWheel.get(loop)
+        self.assertIsInstance(wheel, TimerWheel)
+        self.assertEqual(TimerWheel.get(loop), wheel)
+
+    def test_expire(self):
+        wheel = self.wheel()
+        a, b = Entry(), Entry()
+        wheel.add(a, 0.1)
+        wheel.add(b, 1)
+        self.assertEqual(len(wheel), 2)
+        yield from asyncio.sleep(0.3)
+        self.assertTrue(a.expired)
+        self.assertFalse(b.expired)
+        self.assertEqual(len(wheel), 1)
+        wheel.remove(b)
+        self.assertEqual(len(wheel), 0)
+
+    def test_touch(self):
+        wheel = self.wheel()
+        a = Entry()
+        wheel.add(a, 0.2)
+        for _ in range(5):
+            yield from asyncio.sleep(0.1)
+            wheel.add(a, 0.2)
+        self.assertFalse(a.expired)
+        yield from asyncio.sleep(0.4)
+        self.assertTrue(a.expired)
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel._handle, None)
+
+    def test_cancel(self):
+        wheel = self.wheel()
+        a = Entry()
+        wheel.add(a, 0.1)
+        wheel.cancel(a)
+        yield from asyncio.sleep(0.3)
+        self.assertFalse(a.expired)
+        self.assertEqual(len(wheel), 0)
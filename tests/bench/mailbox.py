@@ -0,0 +1,109 @@
+'''Benchmark the throughput of the actor mailbox protocol with and
+without batching and the cost of mailbox serializers.'''
+import unittest
+
+from pulsar import new_event_loop
+from pulsar.async.mailbox import MailboxProtocol, Message, get_serializer
+
+
+class Transport(object):
+    _closing = False
+
+    def __init__(self):
+        self.writes = 0
+        self.buffer = []
+
+    def write(self, data):
+        self.writes += 1
+        self.buffer.append(data)
+
+
+class TestMailbox(unittest.TestCase):
+    __benchmark__ = True
+    __number__ = 100
+    messages = 100
+    batch = False
+    benchmark_template = ('{0[name]}: repeated {0[repeat]}(x{0[times]}) '
+                          'times, average {0[mean]} secs, stdev {0[std]}, '
+                          '{0[messages_per_second]} messages per second')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def startUp(self):
+        self.sender = MailboxProtocol(loop=self.loop, batch=self.batch)
+        self.sender._transport = Transport()
+        self.receiver = MailboxProtocol(loop=self.loop)
+
+    def getSummary(self, info, repeat, total_time, total_time2):
+        number = self.messages*self.__number__*repeat
+        info['messages_per_second'] = int(number/total_time)
+        return info
+
+    def test_send_and_receive(self):
+        sender = self.sender
+        for n in range(self.messages):
+            sender._write(Message.callback(n, 'abcdefgh'))
+        sender._flush()
+        transport = sender._transport
+        data = b''.join(transport.buffer)
+        received = sum(1 for m in self.receiver._messages(data))
+        self.assertEqual(received, self.messages)
+
+
+class TestMailboxBatch(TestMailbox):
+    batch = True
+
+
+class TestPickleSerializer(unittest.TestCase):
+    __benchmark__ = True
+    __number__ = 100
+    messages = 100
+    serializer = 'pickle'
+    benchmark_template = ('{0[name]}: repeated {0[repeat]}(x{0[times]}) '
+                          'times, average {0[mean]} secs, stdev {0[std]}, '
+                          '{0[usecs_per_message]} microseconds per message')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.codec = get_serializer(cls.serializer)
+        info = {'cpu': 0.5, 'rss': 1234567, 'uptime': 3600.0}
+        cls.data = []
+        for n in range(cls.messages):
+            if n % 4 == 0:
+                data = Message.command('notify', 'worker', 'monitor',
+                                       (info,), None).data
+            elif n % 4 == 1:
+                data = Message.command('ping', 'worker', 'arbiter',
+                                       None, None).data
+            elif n % 4 == 2:
+                data = Message.command('run', 'worker', 'arbiter',
+                                       (len,), None).data
+            else:
+                data = Message.callback('pong', 'abcdefgh').data
+            cls.data.append(data)
+        cls.encoded = [cls.codec.encode(data) for data in cls.data]
+
+    def getSummary(self, info, repeat, total_time, total_time2):
+        number = self.messages*self.__number__*repeat
+        info['usecs_per_message'] = round(1000000*total_time/number, 3)
+        return info
+
+    def test_encode(self):
+        encode = self.codec.encode
+        for data in self.data:
+            encode(data)
+
+    def test_decode(self):
+        decode = self.codec.decode
+        for data in self.encoded:
+            decode(data)
+
+
+class TestCompactSerializer(TestPickleSerializer):
+    serializer = 'compact'
@@ -0,0 +1,94 @@
+'''Benchmark idle timeouts implemented with a ``call_later`` handle per
+connection against the shared :class:`.TimerWheel`.'''
+import unittest
+
+from pulsar import new_event_loop
+from pulsar.async.mixins import TimerWheel
+
+
+class CallLaterEntry(object):
+    '''Idle timeout as it was implemented before the timer wheel'''
+    _handle = None
+
+    def __init__(self, loop, timeout):
+        self._loop = loop
+        self._timeout = timeout
+
+    def add(self):
+        self.cancel()
+        self._handle = self._loop.call_later(self._timeout, self._timed_out)
+
+    def cancel(self):
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+    def _timed_out(self):
+        pass
+
+
+class WheelEntry(object):
+    _timeout_deadline = None
+    _timeout_bucket = None
+
+    def __init__(self, loop, timeout):
+        self._wheel = TimerWheel.get(loop)
+        self._timeout = timeout
+
+    def add(self):
+        self._wheel.add(self, self._timeout)
+
+    def cancel(self):
+        self._wheel.cancel(self)
+
+    def _timed_out(self):
+        pass
+
+
+class TestCallLaterTimeout(unittest.TestCase):
+    __benchmark__ = True
+    __number__ = 20
+    connections = 1000
+    requests = 10
+    entry = CallLaterEntry
+    loop = None
+    benchmark_template = ('{0[name]}: repeated {0[repeat]}(x{0[times]}) '
+                          'times, average {0[mean]} secs, stdev {0[std]}, '
+                          '{0[usecs_per_request]} microseconds and '
+                          '{0[timers_per_request]} timers per request')
+
+    def startUp(self):
+        if self.loop:
+            self.loop.close()
+        self.loop = loop = new_event_loop()
+        call_at = loop.call_at
+
+        def counting_call_at(when, callback, *args):
+            self.timers += 1
+            return call_at(when, callback, *args)
+
+        loop.call_at = counting_call_at
+        self.entries = [self.entry(loop, 30) for _ in range(self.connections)]
+        for entry in self.entries:
+            entry.add()
+        self.timers = 0
+
+    def getSummary(self, info, repeat, total_time, total_time2):
+        number = self.connections*self.requests*self.__number__*repeat
+        info['usecs_per_request'] = round(1000000*total_time/number, 3)
+        number = self.connections*self.requests
+        info['timers_per_request'] = round(self.timers/number, 3)
+        return info
+
+    def test_requests(self):
+        entries = self.entries
+        for _ in range(self.requests):
+            for entry in entries:
+                # data_received, before_write and after_write events
+                entry.cancel()
+                entry.cancel()
+                entry.add()
+
+
+class TestTimerWheelTimeout(TestCallLaterTimeout):
+    entry = WheelEntry
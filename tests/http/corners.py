@@ -1,8 +1,30 @@
 import unittest
 
+import asyncio
+
+from pulsar import get_event_loop, task
+from pulsar.utils.httpurl import HttpParser
 from pulsar.apps.http import HttpClient, HttpRequest, parse_qsl
 
 
+RESPONSE = (b'HTTP/1.1 200 OK\r\n'
+            b'Content-Length: 5\r\n'
+            b'\r\n'
+            b'Hello')
+
+
+@task
+def trailing_data(reader, writer):
+    # Reply to each request with a response followed by extra bytes
+    while True:
+        try:
+            yield from reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            break
+        writer.write(RESPONSE + b'HTTP/1.1 200 OK\r\n')
+    writer.close()
+
+
 class TestClientCornerCases(unittest.TestCase):
 
     def test_headers(self):
@@ -27,3 +49,20 @@ class TestClientCornerCases(unittest.TestCase):
                               urlparams=urlparams)
         params = parse_qsl(request.query)
         self.assertEqual(len(params), 3)
+
+    def test_trailing_data(self):
+        loop = get_event_loop()
+        server = yield from asyncio.start_server(trailing_data, '127.0.0.1',
+                                                 0, loop=loop)
+        self.addCleanup(server.close)
+        address = server.sockets[0].getsockname()
+        url = 'http://%s:%s/' % address
+        http = HttpClient(loop=loop, parser=HttpParser)
+        response = yield from http.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_content(), b'Hello')
+        # the connection with unrequested data is not reused
+        self.assertTrue(response.connection.closed)
+        response = yield from http.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_content(), b'Hello')
@@ -167,6 +167,73 @@ class TestPythonHttpParser(unittest.TestCase):
         data = b'HTTP/1.1 200 Connection established\r\n\r\n'
         self.assertEqual(p.execute(data, len(data)), len(data))
 
+    def test_headers_byte_by_byte(self):
+        p = self.parser()
+        data = (b'GET /test HTTP/1.1\r\nHost: example.com\r\n'
+                b'Accept: */*\r\nContent-Length: 2\r\n\r\nok')
+        for n in range(len(data)):
+            self.assertEqual(p.execute(data[n:n+1], 1), 1)
+        self.assertTrue(p.is_message_complete())
+        headers = p.get_headers()
+        self.assertEqual(headers.get('Host'), ['example.com'])
+        self.assertEqual(headers.get('Accept'), ['*/*'])
+        self.assertEqual(p.recv_body(), b'ok')
+
+    def test_chunked_small_pieces(self):
+        p = self.parser()
+        data = (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                b'5\r\nhello\r\n7;ext=1\r\n, world\r\n0\r\n'
+                b'X-Checksum: 12\r\n\r\n')
+        body = []
+        for n in range(0, len(data), 3):
+            chunk = data[n:n+3]
+            self.assertEqual(p.execute(chunk, len(chunk)), len(chunk))
+            body.append(p.recv_body())
+        self.assertTrue(p.is_chunked())
+        self.assertTrue(p.is_message_complete())
+        self.assertEqual(b''.join(body), b'hello, world')
+
+    def test_pipelined_requests(self):
+        p = self.parser()
+        first = b'POST /a HTTP/1.1\r\nContent-Length: 3\r\n\r\nabc'
+        second = b'GET /b HTTP/1.1\r\n\r\n'
+        data = first + second
+        self.assertEqual(p.execute(data, len(data)), len(first))
+        self.assertTrue(p.is_message_complete())
+        self.assertEqual(p.recv_body(), b'abc')
+        p = self.parser()
+        data = data[len(first):]
+        self.assertEqual(p.execute(data, len(data)), len(data))
+        self.assertEqual(p.get_path(), '/b')
+        self.assertTrue(p.is_message_complete())
+
+    def test_bad_chunk_size(self):
+        p = self.parser()
+        data = (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                b'zz\r\nhello\r\n')
+        self.assertNotEqual(p.execute(data, len(data)), len(data))
+        self.assertEqual(p.errno, httpurl.INVALID_CHUNK)
+
+    def test_interned_header_names(self):
+        data = (b'GET /test HTTP/1.1\r\nx-custom-header: a\r\n'
+                b'user-agent: b\r\n\r\n')
+        names = []
+        for _ in range(2):
+            p = self.parser()
+            p.execute(data, len(data))
+            names.append(list(p.get_headers()))
+        self.assertEqual(names[0], ['X-Custom-Header', 'User-Agent'])
+        self.assertIs(names[0][0], names[1][0])
+
+    def test_header_continuation(self):
+        p = self.parser()
+        data = (b'GET /test HTTP/1.1\r\nX-Long: first\r\n'
+                b'  second\r\nAccept: */*\r\n\r\n')
+        self.assertEqual(p.execute(data, len(data)), len(data))
+        headers = p.get_headers()
+        self.assertEqual(headers['X-Long'], ['first\r\n  second'])
+        self.assertEqual(headers['Accept'], ['*/*'])
+
 
 @unittest.skipUnless(hasextensions, 'Requires C extensions')
 class TestCHttpParser(TestPythonHttpParser):
@@ -174,3 +241,33 @@ class TestCHttpParser(TestPythonHttpParser):
     @classmethod
     def parser(cls, **kwargs):
         return httpurl.CHttpParser(**kwargs)
+
+
+class TestChunkedBody(unittest.TestCase):
+    '''Feed a 10MB chunked body to the parser in 1KB pieces.'''
+    __benchmark__ = True
+    __number__ = 1
+    size = 10*1024*1024
+    piece = 1024
+    chunk = 1024*1024
+
+    @classmethod
+    def setUpClass(cls):
+        chunk = b'x'*cls.chunk
+        frame = ('%x\r\n' % cls.chunk).encode('ascii') + chunk + b'\r\n'
+        data = (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n' +
+                frame*(cls.size//len(chunk)) + b'0\r\n\r\n')
+        piece = cls.piece
+        cls.pieces = [data[n:n+piece] for n in range(0, len(data), piece)]
+
+    def parser(self):
+        return httpurl.HttpParser()
+
+    def test_chunked_body(self):
+        p = self.parser()
+        size = 0
+        for data in self.pieces:
+            p.execute(data, len(data))
+            size += len(p.recv_body())
+        self.assertTrue(p.is_message_complete())
+        self.assertEqual(size, self.size)
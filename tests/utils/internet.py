@@ -11,7 +11,7 @@ import pulsar
 from pulsar import platform
 from pulsar.utils.internet import (parse_address, parse_connection_string,
                                    close_socket, is_socket_closed,
-                                   format_address)
+                                   format_address, reuse_port_socket)
 
 
 class TestParseAddress(unittest.TestCase):
@@ -99,3 +99,33 @@ class TestMisc(unittest.TestCase):
         self.assertRaises(ValueError, format_address, (1, 2, 3))
         self.assertRaises(ValueError, format_address, (1, 2, 3, 4, 5))
         self.assertEqual(format_address(1), '1')
+
+
+@unittest.skipUnless(platform.has_reuse_port, 'Requires SO_REUSEPORT')
+class TestReusePort(unittest.TestCase):
+
+    def test_tcp(self):
+        sock1 = reuse_port_socket(('127.0.0.1', 0))
+        self.addCleanup(sock1.close)
+        address = sock1.getsockname()
+        sock2 = reuse_port_socket(address)
+        self.addCleanup(sock2.close)
+        self.assertEqual(sock2.getsockname(), address)
+        self.assertEqual(sock2.type, socket.SOCK_STREAM)
+        sock1.listen(5)
+        sock2.listen(5)
+
+    def test_udp(self):
+        sock1 = reuse_port_socket(('127.0.0.1', 0), socket.SOCK_DGRAM)
+        self.addCleanup(sock1.close)
+        sock2 = reuse_port_socket(sock1.getsockname(), socket.SOCK_DGRAM)
+        self.addCleanup(sock2.close)
+        self.assertEqual(sock2.getsockname(), sock1.getsockname())
+        self.assertEqual(sock2.type, socket.SOCK_DGRAM)
+
+    def test_address_in_use(self):
+        sock1 = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(sock1.close)
+        sock1.bind(('127.0.0.1', 0))
+        self.assertRaises(socket.error, reuse_port_socket,
+                          sock1.getsockname())
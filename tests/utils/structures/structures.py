@@ -3,7 +3,8 @@ import unittest
 import pickle
 
 from pulsar.utils.structures import (MultiValueDict, merge_prefix, deque,
-                                     AttributeDictionary)
+                                     AttributeDictionary, flat_mapping,
+                                     mapping_delta, apply_delta)
 
 
 class TestMultiValueDict(unittest.TestCase):
@@ -135,3 +136,23 @@ class TestFunctions(unittest.TestCase):
         self.assertEqual(d, deque([b'abc', b'defg', b'hi', b'j']))
         merge_prefix(d, 100)
         self.assertEqual(d, deque([b'abcdefghij']))
+
+    def test_flat_mapping(self):
+        flat = flat_mapping({'a': 1, 'b': {'c': [1, 2], 'd': {}}})
+        self.assertEqual(flat, {('a',): 1, ('b', 'c'): [1, 2],
+                                ('b', 'd'): {}})
+
+    def test_mapping_delta(self):
+        old = {'actor': {'uptime': 1, 'pid': 5, 'peer': 'x'}, 'workers': [1]}
+        new = {'actor': {'uptime': 2, 'pid': 5}, 'workers': [1, 2],
+               'extra': {'foo': 'bar'}}
+        delta = mapping_delta(flat_mapping(old), flat_mapping(new))
+        changed, removed = delta
+        self.assertEqual(changed, {('actor', 'uptime'): 2,
+                                   ('workers',): [1, 2],
+                                   ('extra', 'foo'): 'bar'})
+        self.assertEqual(removed, [('actor', 'peer')])
+        self.assertEqual(apply_delta(old, pickle.loads(pickle.dumps(delta))),
+                         new)
+        self.assertEqual(mapping_delta(flat_mapping(new), flat_mapping(new)),
+                         ({}, []))
@@ -0,0 +1,57 @@
+'''Tests the response headers written by the wsgi server.'''
+import unittest
+from functools import partial
+
+import asyncio
+
+from pulsar import get_event_loop, TcpServer, Connection
+from pulsar.apps.wsgi import WSGIServer, HttpServerResponse
+
+
+def hello(environ, start_response):
+    start_response('200 OK', [('Content-Length', '2')])
+    return [b'OK']
+
+
+def request(path, *headers):
+    lines = ['GET %s HTTP/1.1' % path, 'Host: localhost'] + list(headers)
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+
+class TestResponseHeaders(unittest.TestCase):
+
+    def server(self, app=hello):
+        loop = get_event_loop()
+        cfg = WSGIServer(callable=app).cfg
+        consumer = partial(HttpServerResponse, app, cfg)
+        server = TcpServer(partial(Connection, consumer), loop,
+                           ('127.0.0.1', 0))
+        yield from server.start_serving()
+        self.addCleanup(server.close)
+        self.tcp_server = server
+        reader, writer = yield from asyncio.open_connection(
+            *server.address, loop=loop)
+        self.addCleanup(writer.close)
+        return reader, writer
+
+    def test_connection_close_header(self):
+        reader, writer = yield from self.server()
+        writer.write(request('/', 'Connection: close'))
+        head = yield from reader.readuntil(b'\r\n\r\n')
+        self.assertEqual(head.lower().count(b'\r\nconnection: '), 1)
+
+    def test_server_date_headers(self):
+        reader, writer = yield from self.server()
+        responses = []
+        self.tcp_server.bind_event(
+            'post_request', lambda response, exc=None: responses.append(
+                response))
+        writer.write(request('/'))
+        head = yield from reader.readuntil(b'\r\n\r\n')
+        yield from reader.readexactly(2)
+        self.assertIn(b'\r\nServer: ', head)
+        self.assertIn(b'\r\nDate: ', head)
+        self.assertEqual(len(responses), 1)
+        headers = responses[0].headers
+        self.assertFalse('Server' in headers)
+        self.assertFalse('Date' in headers)
@@ -0,0 +1,103 @@
+'''Tests concurrent processing of pipelined HTTP/1.1 requests.'''
+import unittest
+from functools import partial
+
+import asyncio
+
+from pulsar import get_event_loop, task, TcpServer, Connection
+from pulsar.apps.wsgi import WSGIServer, HttpServerResponse
+
+
+@task
+def delayed(environ, start_response):
+    '''Reply with the path after sleeping the number of seconds in it.'''
+    path = environ['PATH_INFO']
+    yield from asyncio.sleep(float(path[1:]))
+    data = path.encode('utf-8')
+    start_response('200 OK', [('Content-Length', str(len(data)))])
+    return [data]
+
+
+aborted = []
+
+
+@task
+def abortable(environ, start_response):
+    '''Like :func:`delayed` but record the path when cancelled.'''
+    try:
+        return (yield from delayed(environ, start_response))
+    except asyncio.CancelledError:
+        aborted.append(environ['PATH_INFO'])
+        raise
+
+
+def request(path, *headers):
+    lines = ['GET %s HTTP/1.1' % path, 'Host: localhost'] + list(headers)
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+
+class TestPipeline(unittest.TestCase):
+    http_pipeline = 16
+
+    def server(self, app=delayed):
+        loop = get_event_loop()
+        cfg = WSGIServer(callable=app,
+                         http_pipeline=self.http_pipeline).cfg
+        consumer = partial(HttpServerResponse, app, cfg)
+        server = TcpServer(partial(Connection, consumer), loop,
+                           ('127.0.0.1', 0))
+        yield from server.start_serving()
+        self.addCleanup(server.close)
+        reader, writer = yield from asyncio.open_connection(
+            *server.address, loop=loop)
+        self.addCleanup(writer.close)
+        return reader, writer
+
+    def responses(self, reader, paths):
+        bodies = []
+        for path in paths:
+            yield from reader.readuntil(b'\r\n\r\n')
+            body = yield from reader.readexactly(len(path))
+            bodies.append(body.decode('utf-8'))
+        return bodies
+
+    def test_order(self):
+        reader, writer = yield from self.server()
+        paths = ['/0.3', '/0.1', '/0.2', '/0']
+        loop = get_event_loop()
+        start = loop.time()
+        writer.write(b''.join(request(path) for path in paths))
+        bodies = yield from self.responses(reader, paths)
+        self.assertEqual(bodies, paths)
+        if self.http_pipeline > 1:
+            self.assertTrue(loop.time() - start < 0.55)
+
+    def test_connection_close(self):
+        reader, writer = yield from self.server()
+        writer.write(request('/0.1') +
+                     request('/0', 'Connection: close') +
+                     request('/0'))
+        bodies = yield from self.responses(reader, ['/0.1', '/0'])
+        self.assertEqual(bodies, ['/0.1', '/0'])
+        rest = yield from reader.read()
+        self.assertEqual(rest, b'')
+
+    def test_connection_lost(self):
+        reader, writer = yield from self.server(abortable)
+        paths = ['/1', '/1.1', '/1.2']
+        writer.write(b''.join(request(path) for path in paths))
+        yield from asyncio.sleep(0.1)
+        writer.close()
+        yield from asyncio.sleep(0.1)
+        if self.http_pipeline > 1:
+            self.assertEqual(sorted(aborted), paths[:self.http_pipeline])
+        del aborted[:]
+
+
+class TestPipelineLimit(TestPipeline):
+    http_pipeline = 2
+
+
+class TestNoPipeline(TestPipeline):
+    http_pipeline = 0
+
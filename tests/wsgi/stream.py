@@ -0,0 +1,166 @@
+'''Tests streaming of request bodies via wsgi.input.'''
+import sys
+import unittest
+from functools import partial
+
+import asyncio
+
+from pulsar import get_event_loop, task, TcpServer, Connection
+from pulsar.utils.httpurl import Headers, HttpParser
+from pulsar.apps.wsgi import WSGIServer, HttpServerResponse
+from pulsar.apps.wsgi.server import StreamReader
+
+
+class Transport:
+
+    def __init__(self):
+        self.paused = 0
+        self.resumed = 0
+
+    def pause_reading(self):
+        self.paused += 1
+
+    def resume_reading(self):
+        self.resumed += 1
+
+
+@task
+def body_size(environ, start_response):
+    '''Read the body in chunks and reply with its size.'''
+    stream = environ['wsgi.input']
+    size = 0
+    while True:
+        chunk = yield from stream.read(10000)
+        if not chunk:
+            break
+        size += len(chunk)
+        yield from asyncio.sleep(0)
+    data = str(size).encode('utf-8')
+    start_response('200 OK', [('Content-Length', str(len(data)))])
+    return [data]
+
+
+class TestStreamReader(unittest.TestCase):
+
+    def stream(self, limit=100, transport=None, pausing=None):
+        return StreamReader(Headers(kind='client'), HttpParser(),
+                            transport or Transport(), limit=limit,
+                            pausing=pausing)
+
+    def test_read_n(self):
+        stream = self.stream()
+        future = stream.read(5)
+        self.assertFalse(future.done())
+        stream.feed_data(b'hello world')
+        data = yield from future
+        self.assertEqual(data, b'hello')
+        self.assertEqual(stream.buffered, 6)
+        data = yield from stream.read(100)
+        self.assertEqual(data, b' world')
+        stream.feed_eof()
+        data = yield from stream.read(100)
+        self.assertEqual(data, b'')
+
+    def test_read_across_chunks(self):
+        stream = self.stream()
+        for chunk in (b'ab', b'cde', b'fgh'):
+            stream.feed_data(chunk)
+        data = yield from stream.read(4)
+        self.assertEqual(data, b'abcd')
+        data = yield from stream.read(10)
+        self.assertEqual(data, b'efgh')
+
+    def test_backpressure(self):
+        stream = self.stream()
+        stream.feed_data(b'x'*60)
+        self.assertEqual(stream.transport.paused, 0)
+        stream.feed_data(b'x'*60)
+        self.assertEqual(stream.transport.paused, 1)
+        stream.feed_data(b'x'*60)
+        self.assertEqual(stream.transport.paused, 1)
+        yield from stream.read(100)
+        self.assertEqual(stream.transport.resumed, 0)
+        yield from stream.read(50)
+        self.assertEqual(stream.transport.resumed, 1)
+
+    def test_shared_backpressure(self):
+        transport = Transport()
+        pausing = set()
+        first = self.stream(transport=transport, pausing=pausing)
+        second = self.stream(transport=transport, pausing=pausing)
+        first.feed_data(b'x'*120)
+        second.feed_data(b'x'*120)
+        self.assertEqual(transport.paused, 1)
+        self.assertTrue(first.paused)
+        self.assertTrue(second.paused)
+        yield from first.read(100)
+        self.assertFalse(first.paused)
+        self.assertEqual(transport.resumed, 0)
+        second.resume_reading()
+        self.assertEqual(transport.resumed, 1)
+        self.assertFalse(pausing)
+
+    def test_read_body(self):
+        stream = self.stream()
+        stream.feed_data(b'x'*120)
+        self.assertEqual(stream.transport.paused, 1)
+        future = stream.read()
+        self.assertEqual(stream.transport.resumed, 1)
+        stream.feed_data(b'y'*200)
+        self.assertEqual(stream.transport.paused, 1)
+        stream.feed_eof()
+        data = yield from future
+        self.assertEqual(data, b'x'*120 + b'y'*200)
+
+    @unittest.skipUnless(sys.version_info >= (3, 5), 'Requires python 3.5')
+    def test_async_iterator(self):
+        stream = self.stream()
+        self.assertIs(stream.__aiter__(), stream)
+        stream.feed_data(b'hello')
+        stream.feed_eof()
+        data = yield from stream.__anext__()
+        self.assertEqual(data, b'hello')
+        try:
+            yield from stream.__anext__()
+        except StopAsyncIteration:
+            pass
+        else:
+            raise AssertionError('StopAsyncIteration not raised')
+
+
+def post(size):
+    return ('POST / HTTP/1.1\r\nHost: localhost\r\n'
+            'Content-Length: %d\r\n\r\n' % size).encode('utf-8') + b'x'*size
+
+
+class TestStreamingUpload(unittest.TestCase):
+
+    def client(self, **params):
+        loop = get_event_loop()
+        cfg = WSGIServer(callable=body_size, **params).cfg
+        consumer = partial(HttpServerResponse, body_size, cfg)
+        server = TcpServer(partial(Connection, consumer), loop,
+                           ('127.0.0.1', 0))
+        yield from server.start_serving()
+        self.addCleanup(server.close)
+        reader, writer = yield from asyncio.open_connection(
+            *server.address, loop=loop)
+        self.addCleanup(writer.close)
+        return reader, writer
+
+    def test_upload(self):
+        reader, writer = yield from self.client()
+        size = 2**21
+        writer.write(post(size))
+        yield from reader.readuntil(b'\r\n\r\n')
+        data = yield from reader.read(len(str(size)))
+        self.assertEqual(int(data), size)
+
+    def test_pipelined_uploads(self):
+        reader, writer = yield from self.client(http_pipeline=4)
+        sizes = [2**20 + 1, 2**20 + 3]
+        writer.write(b''.join(post(size) for size in sizes))
+        for size in sizes:
+            yield from reader.readuntil(b'\r\n\r\n')
+            data = yield from reader.readexactly(len(str(size)))
+            self.assertEqual(int(data), size)
@@ -45,6 +45,13 @@ class WsgiRequestTests(unittest.TestCase):
         request = self.request(headers=[('host', 'blaa.com')])
         self.assertEqual(request.get_host(), 'blaa.com')
 
+    def test_environ_headers(self):
+        request = self.request(headers=[('x-forwarded-proto', 'https'),
+                                        ('accept-language', 'en')])
+        environ = request.environ
+        self.assertEqual(environ['HTTP_X_FORWARDED_PROTO'], 'https')
+        self.assertEqual(environ['HTTP_ACCEPT_LANGUAGE'], 'en')
+
     def test_full_path(self):
         request = self.request(headers=[('host', 'blaa.com')])
         self.assertEqual(request.full_path(), '/')
@@ -245,3 +252,28 @@ class WsgiRequestTests(unittest.TestCase):
         response = request.redirect('/foo2', permanent=True)
         self.assertEqual(response.status_code, 301)
         self.assertEqual(response['location'], '/foo2')
+
+    def test_http_date_header(self):
+        from pulsar.apps.wsgi.server import http_date_header
+        now = time.time()
+        line = http_date_header(now)
+        self.assertTrue(line.startswith(b'Date: '))
+        self.assertTrue(line.endswith(b' GMT\r\n'))
+        self.assertIs(http_date_header(int(now) + 0.5), line)
+        self.assertNotEqual(http_date_header(now + 1), line)
+
+    def test_static_headers(self):
+        from pulsar.apps.wsgi.server import static_headers
+        block = static_headers('pulsar/1.0')
+        self.assertEqual(block, b'Server: pulsar/1.0\r\n')
+        self.assertIs(static_headers('pulsar/1.0'), block)
+        self.assertEqual(static_headers(None), b'')
+
+    def test_flat_headers(self):
+        headers = http.Headers([('content-type', 'text/plain')])
+        data = headers.flat((1, 1), '200 OK', b'Server: pulsar\r\n')
+        self.assertEqual(data, b'HTTP/1.1 200 OK\r\nServer: pulsar\r\n'
+                               b'Content-Type: text/plain\r\n\r\n')
+        self.assertEqual(headers.flat((1, 1), '200 OK'),
+                         b'HTTP/1.1 200 OK\r\n'
+                         b'Content-Type: text/plain\r\n\r\n')